@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Optional, List, Tuple
+from core.bitboard import Bitboard, BoardBits
 from core.constants import Direction
+from core.grid import DIRECTION_SLOT, grid_topology
 
 class AIDifficulty(Enum):
     EASY = "easy"
@@ -12,25 +14,34 @@ class AIDifficulty(Enum):
 class SnakeAI(ABC):
     """Base class for all Snake AI implementations"""
     
-    def __init__(self, game):
+    def __init__(self, game, bitboard: bool = False):
         self.game = game
         self.current_path = []
+        self.topology = grid_topology(game.width, game.height, game.grid_size)
+        # Collision checks against this tick's bitboard masks instead of the body
+        self.bitboard = Bitboard(game.width, game.height) if bitboard else None
     
     @abstractmethod
     def get_next_move(self) -> Optional[Direction]:
         """Get the next move for the snake"""
         pass
 
+    def end_episode(self, score: int) -> None:
+        """Called once a game ends, before the board is reset; drop per-game state here"""
+        self.current_path = []
+
     def get_state(self) -> List[bool]:
         """Get the current state of the game environment"""
-        head = self.game.snake_pos[0]
-        grid_size = self.game.settings.GRID_SIZE
+        body = self.game.snake_pos
+        head = body.head
+        occupied, tail = body.occupied, body.cell_id(body.tail)
         
-        # Points around the head
-        point_l = (head[0] - grid_size, head[1])
-        point_r = (head[0] + grid_size, head[1])
-        point_u = (head[0], head[1] - grid_size)
-        point_d = (head[0], head[1] + grid_size)
+        # Cells around the head, clockwise from right, and whether each is a
+        # wall or body (the tail moves away this tick)
+        around = self.topology.neighbor_list[body.cell_id(head)]
+        danger = [cell < 0 or (occupied[cell] and cell != tail) for cell in around]
+        # Slot of the current direction; +1 turns right, -1 turns left
+        slot = DIRECTION_SLOT[self.game.snake_direction]
 
         # Current direction
         dir_l = self.game.snake_direction == Direction.LEFT
@@ -38,51 +49,39 @@ class SnakeAI(ABC):
         dir_u = self.game.snake_direction == Direction.UP
         dir_d = self.game.snake_direction == Direction.DOWN
 
+        # No food left once the board is full
+        food = self.game.food_pos or head
+
         state = [
             # Danger straight
-            (dir_r and self._is_collision(point_r)) or
-            (dir_l and self._is_collision(point_l)) or
-            (dir_u and self._is_collision(point_u)) or
-            (dir_d and self._is_collision(point_d)),
+            danger[slot],
 
             # Danger right
-            (dir_u and self._is_collision(point_r)) or
-            (dir_d and self._is_collision(point_l)) or
-            (dir_l and self._is_collision(point_u)) or
-            (dir_r and self._is_collision(point_d)),
+            danger[(slot + 1) % 4],
 
             # Danger left
-            (dir_d and self._is_collision(point_r)) or
-            (dir_u and self._is_collision(point_l)) or
-            (dir_r and self._is_collision(point_u)) or
-            (dir_l and self._is_collision(point_d)),
+            danger[(slot - 1) % 4],
 
             # Move direction
             dir_l, dir_r, dir_u, dir_d,
 
             # Food location relative to head
-            self.game.food_pos[0] < head[0],  # food left
-            self.game.food_pos[0] > head[0],  # food right
-            self.game.food_pos[1] < head[1],  # food up
-            self.game.food_pos[1] > head[1]   # food down
+            food[0] < head[0],  # food left
+            food[0] > head[0],  # food right
+            food[1] < head[1],  # food up
+            food[1] > head[1]   # food down
         ]
         
         return state
 
     def _is_collision(self, point: Tuple[int, int]) -> bool:
         """Check if a point results in collision"""
-        x, y = point
-        
-        # Hits boundary
-        if (x >= self.game.settings.WINDOW_SIZE or x < 0 or 
-            y >= self.game.settings.WINDOW_SIZE or y < 0):
-            return True
-        
-        # Hits itself
-        if point in self.game.snake_pos[:-1]:
-            return True
-            
-        return False
+        # Hits boundary or itself (the tail moves away this tick)
+        if self.bitboard is not None:
+            if not self.topology.in_bounds(point):
+                return True
+            return BoardBits.for_tick(self.bitboard, self.game).is_blocked(self.topology.cell_id(point))
+        return self.game.snake_pos.is_blocked(point)
 
     def _get_manhattan_distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
         """Calculate Manhattan distance between two points"""
@@ -1,117 +1,188 @@
-from typing import List, Tuple, Set, Dict
+from typing import List, Optional, Tuple
 import heapq
+from collections import deque
+from core.bitboard import Bitboard, BoardBits
 from core.constants import Direction
-from collections import defaultdict
-import numpy as np
+from core.grid import grid_topology
+from .distance_field import DistanceField
+from .regions import RegionMap
 
-class Node:
-    def __init__(self, position: Tuple[int, int], parent=None):
-        self.position = position
-        self.parent = parent
-        self.g = 0  # Cost from start to current node
-        self.h = 0  # Estimated cost from current node to end
-        self.f = 0  # Total cost (g + h)
+class AStarPathfinder:
+    """A* over flat integer cell ids (cell = y * width + x).
 
-    def __eq__(self, other):
-        return self.position == other.position
-    
-    def __lt__(self, other):
-        return self.f < other.f
+    Neighbor lists and cell coordinates come from the board's shared
+    GridTopology, and the g/parent scratch arrays are allocated once and
+    reused by every search; a generation stamp marks which entries belong
+    to the current search, so nothing is cleared between calls. The open
+    set is a heap of (f, h, cell) tuples with lazy deletion: a cell may be
+    pushed again when a shorter route is found and stale entries are
+    skipped when popped. The Manhattan heuristic is split into per-axis
+    tables, rebuilt only when the target changes.
 
-class AStarPathfinder:
-    def __init__(self, game):
+    A breadth-first DistanceField sits beside the search as a per-tick
+    cache: when one from the current head is already in the env's tick
+    cache, the food path is read from it instead of searched, and when the
+    food is out of reach (A* has then explored the whole region anyway)
+    the tail path comes from one field that later callers this tick share.
+
+    With ``bitboard=True`` flood fills run on whole-board bit masks
+    (core.bitboard) instead of visiting cells one by one.
+    """
+
+    def __init__(self, game, bitboard: bool = False):
         self.game = game
-        self.grid_size = game.settings.GRID_SIZE
-        self.width = game.settings.WINDOW_SIZE // self.grid_size
-        self.height = game.settings.WINDOW_SIZE // self.grid_size
+        self.grid_size = game.grid_size
+        self.width = game.width
+        self.height = game.height
         self.current_path = []
+        # Where the cached path leads and where the head should be when it is used next
+        self._path_goal = None
+        self._expected_head = None
+        
+        self.topology = grid_topology(self.width, self.height, self.grid_size)
+        num_cells = self.topology.num_cells
         
+        # Scratch arrays shared by every search
+        self._g = [0] * num_cells
+        self._parent = [-1] * num_cells
+        self._seen = [0] * num_cells    # stamp of the search that reached the cell
+        self._closed = [0] * num_cells  # stamp of the search that expanded the cell
+        self._stamp = 0
+        self._target = None
+        self._h_x = []
+        self._h_y = []
+        self.regions = RegionMap(self.topology)
+        self.distances = DistanceField(self.topology)
+        self.bitboard = Bitboard(self.width, self.height) if bitboard else None
+    
+    def end_episode(self, score: int) -> None:
+        """Drop the cached path before the board is reset"""
+        self.current_path = []
+        self._path_goal = None
+        self._expected_head = None
+
     def get_next_move(self) -> Direction:
         """Get the next move using A* pathfinding"""
+        head = self.game.snake_pos[0]
+        if self.current_path and not self._path_is_valid(head):
+            self.current_path = []
+        
         # If we don't have a path or reached end of current path, calculate new path
         if not self.current_path:
-            # First try path to food
-            path = self.find_path(self.game.snake_pos[0], self.game.food_pos)
+            # First try path to food, from this tick's field if one exists
+            field = self.distances.cached(self.game)
+            if field is not None:
+                path = field.path(self.game.food_pos)
+            else:
+                path = self.find_path(head, self.game.food_pos)
+            self._path_goal = self.game.food_pos
             
             # If can't reach food, try to find path to tail
             if not path:
-                path = self.find_path(self.game.snake_pos[0], self.game.snake_pos[-1])
+                path = self.distances.for_tick(self.game).path(self.game.snake_pos[-1])
+                # The tail moves every tick, so this path is only good for one step
+                self._path_goal = None
             
-            if path:
-                self.current_path = path
+            # Paths start at the head; only the steps after it are moves
+            if len(path) > 1:
+                self.current_path = path[1:]
             else:
                 # If no path found, try to move to the safest direction
                 return self.get_safe_direction()
         
         # Get next position from path
         next_pos = self.current_path.pop(0)
-        return self.get_direction_to_position(self.game.snake_pos[0], next_pos)
+        self._expected_head = next_pos
+        if self._path_goal is None:
+            self.current_path = []
+        topology = self.topology
+        return topology.direction_between(topology.cell_id(head), topology.cell_id(next_pos))
+    
+    def _path_is_valid(self, head: Tuple[int, int]) -> bool:
+        """Whether the cached path still starts at the head, leads to the food and is unblocked"""
+        if head != self._expected_head or self.game.food_pos != self._path_goal:
+            return False
+        # Between ticks only the head cell fills up, so this rarely fails; a
+        # reset or external move is caught by the checks above
+        body = self.game.snake_pos
+        occupied = body.occupied
+        tail = body.cell_id(body.tail)
+        for position in self.current_path:
+            cell = self.topology.cell_id(position)
+            if occupied[cell] and cell != tail:
+                return False
+        return True
     
-    def find_path(self, start: Tuple[int, int], end: Tuple[int, int]) -> List[Tuple[int, int]]:
-        """Find path using A* algorithm"""
-        start_node = Node(start)
-        end_node = Node(end)
+    def _set_target(self, target: int) -> None:
+        """Per-axis Manhattan tables for a target: h(cell) = h_x[x] + h_y[y]"""
+        if target != self._target:
+            tx, ty = self.topology.cell_x[target], self.topology.cell_y[target]
+            self._h_x = [abs(x - tx) for x in range(self.width)]
+            self._h_y = [abs(y - ty) for y in range(self.height)]
+            self._target = target
+    
+    def find_path(self, start: Tuple[int, int], end: Optional[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Shortest path from start to end (both included), or [] if unreachable"""
+        if end is None:  # board full, nothing to reach
+            return []
+        cells = self.find_cell_path(self.topology.cell_id(start), self.topology.cell_id(end))
+        return [self.topology.cell_position(cell) for cell in cells]
+    
+    def find_cell_path(self, start: int, goal: int) -> List[int]:
+        """A* on cell ids; the snake body blocks every cell except its tail"""
+        body = self.game.snake_pos
+        occupied = body.occupied
+        tail = body.cell_id(body.tail)
         
-        # Initialize open and closed lists
-        open_list = []
-        closed_list = set()
+        self._set_target(goal)
+        h_x, h_y = self._h_x, self._h_y
+        cell_x, cell_y = self.topology.cell_x, self.topology.cell_y
+        adjacency = self.topology.adjacency
+        g_score, parent, seen, closed = self._g, self._parent, self._seen, self._closed
+        self._stamp += 1
+        stamp = self._stamp
         
-        # Add start node to open list
-        heapq.heappush(open_list, start_node)
+        g_score[start] = 0
+        parent[start] = -1
+        seen[start] = stamp
+        h = h_x[cell_x[start]] + h_y[cell_y[start]]
+        open_heap = [(h, h, start)]
+        pop, push = heapq.heappop, heapq.heappush
         
-        while open_list:
-            # Get node with lowest f score
-            current_node = heapq.heappop(open_list)
-            closed_list.add(current_node.position)
+        while open_heap:
+            _, _, cell = pop(open_heap)
+            if closed[cell] == stamp:
+                continue  # stale duplicate
+            closed[cell] = stamp
             
-            # Found the goal
-            if current_node == end_node:
+            if cell == goal:
                 path = []
-                current = current_node
-                while current is not None:
-                    path.append(current.position)
-                    current = current.parent
-                return path[::-1]  # Return reversed path
+                while cell != -1:
+                    path.append(cell)
+                    cell = parent[cell]
+                return path[::-1]
             
-            # Generate neighbors
-            for new_position in self.get_neighbors(current_node.position):
-                # Skip if position is in closed list
-                if new_position in closed_list:
+            g = g_score[cell] + 1
+            for neighbor in adjacency[cell]:
+                if occupied[neighbor] and neighbor != tail:
                     continue
-                
-                # Create neighbor node
-                neighbor = Node(new_position, current_node)
-                
-                # Skip if position collides with snake
-                if self.is_collision(new_position):
+                if closed[neighbor] == stamp:
                     continue
-                
-                # Calculate costs
-                neighbor.g = current_node.g + 1
-                neighbor.h = self.manhattan_distance(neighbor.position, end_node.position)
-                neighbor.f = neighbor.g + neighbor.h
-                
-                # Check if neighbor is in open list and if it has a lower f value
-                if self.should_add_to_open(open_list, neighbor):
-                    heapq.heappush(open_list, neighbor)
+                if seen[neighbor] == stamp and g_score[neighbor] <= g:
+                    continue
+                seen[neighbor] = stamp
+                g_score[neighbor] = g
+                parent[neighbor] = cell
+                h = h_x[cell_x[neighbor]] + h_y[cell_y[neighbor]]
+                # Ties on f go to the cell nearer the goal
+                push(open_heap, (g + h, h, neighbor))
         
         return []  # No path found
     
     def get_neighbors(self, position: Tuple[int, int]) -> List[Tuple[int, int]]:
         """Get valid neighboring positions"""
-        x, y = position
-        neighbors = []
-        
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # Down, Right, Up, Left
-            new_x = x + dx * self.grid_size
-            new_y = y + dy * self.grid_size
-            
-            # Check bounds
-            if (0 <= new_x < self.game.settings.WINDOW_SIZE and 
-                0 <= new_y < self.game.settings.WINDOW_SIZE):
-                neighbors.append((new_x, new_y))
-        
-        return neighbors
+        positions = self.topology.positions
+        return [positions[cell] for cell in self.topology.adjacency[self.topology.cell_id(position)]]
     
     def manhattan_distance(self, pos1: Tuple[int, int], pos2: Tuple[int, int]) -> int:
         """Calculate Manhattan distance between two positions"""
@@ -119,25 +190,20 @@ class AStarPathfinder:
     
     def is_collision(self, position: Tuple[int, int]) -> bool:
         """Check if position collides with snake body"""
-        return position in self.game.snake_pos[:-1]
-    
-    def should_add_to_open(self, open_list: List[Node], neighbor: Node) -> bool:
-        """Check if neighbor should be added to open list"""
-        for node in open_list:
-            if neighbor == node and neighbor.f >= node.f:
-                return False
-        return True
+        return self.game.snake_pos.is_blocked(position)
     
     def get_safe_direction(self) -> Direction:
         """Get the safest direction when no path is found"""
         head = self.game.snake_pos[0]
         possible_moves = []
+        # One labeling of all free regions answers every direction
+        regions = self.regions.for_tick(self.game)
         
         for direction in Direction:
             next_pos = self.get_next_position(head, direction)
             if next_pos and not self.is_collision(next_pos):
-                # Calculate number of free squares accessible from this move
-                free_squares = self.count_free_squares(next_pos)
+                # Number of free squares accessible from this move
+                free_squares = regions.region_size(self.topology.cell_id(next_pos))
                 possible_moves.append((direction, free_squares))
         
         if possible_moves:
@@ -149,50 +215,35 @@ class AStarPathfinder:
     
     def count_free_squares(self, start_pos: Tuple[int, int]) -> int:
         """Count number of free squares accessible from a position"""
-        visited = set([start_pos])
-        queue = [start_pos]
+        if self.bitboard is not None:
+            return BoardBits.for_tick(self.bitboard, self.game).free_squares(self.topology.cell_id(start_pos))
+        
+        body = self.game.snake_pos
+        occupied = body.occupied
+        tail = body.cell_id(body.tail)
+        adjacency = self.topology.adjacency
+        
+        self._stamp += 1
+        stamp, seen = self._stamp, self._seen
+        start = self.topology.cell_id(start_pos)
+        seen[start] = stamp
+        queue = deque([start])
         count = 0
         
         while queue:
-            pos = queue.pop(0)
+            cell = queue.popleft()
             count += 1
             
-            for next_pos in self.get_neighbors(pos):
-                if (next_pos not in visited and 
-                    not self.is_collision(next_pos)):
-                    visited.add(next_pos)
-                    queue.append(next_pos)
+            for neighbor in adjacency[cell]:
+                if (seen[neighbor] != stamp and 
+                    (not occupied[neighbor] or neighbor == tail)):
+                    seen[neighbor] = stamp
+                    queue.append(neighbor)
         
         return count
     
     def get_next_position(self, position: Tuple[int, int], direction: Direction) -> Tuple[int, int]:
         """Get next position based on direction"""
-        x, y = position
-        if direction == Direction.UP:
-            y -= self.grid_size
-        elif direction == Direction.DOWN:
-            y += self.grid_size
-        elif direction == Direction.LEFT:
-            x -= self.grid_size
-        elif direction == Direction.RIGHT:
-            x += self.grid_size
-            
-        # Check bounds
-        if (0 <= x < self.game.settings.WINDOW_SIZE and 
-            0 <= y < self.game.settings.WINDOW_SIZE):
-            return (x, y)
-        return None
-    
-    def get_direction_to_position(self, current: Tuple[int, int], target: Tuple[int, int]) -> Direction:
-        """Get direction to move from current position to target position"""
-        dx = target[0] - current[0]
-        dy = target[1] - current[1]
-        
-        if dx > 0:
-            return Direction.RIGHT
-        elif dx < 0:
-            return Direction.LEFT
-        elif dy > 0:
-            return Direction.DOWN
-        else:
-            return Direction.UP
\ No newline at end of file
+        cell = self.topology.move(self.topology.cell_id(position), direction)
+        return self.topology.positions[cell] if cell >= 0 else None
+    
\ No newline at end of file
@@ -0,0 +1,102 @@
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+class HamiltonianCycle:
+    """Closed tour of a board with lookup tables over flat cell ids.
+
+    ``order[i]`` is the i-th cell of the tour, ``index[cell]`` its position,
+    and ``next_cell``/``prev_cell`` its successor and predecessor, so
+    walking the cycle or measuring how far ahead a cell lies is a table
+    lookup. The NumPy arrays are shared between agents and read-only; the
+    ``*_list`` copies are for scalar lookups in per-tick code, where
+    indexing a list is several times faster than indexing an array.
+
+    A board with both sides odd has no Hamiltonian cycle (a grid is
+    bipartite and such a board has one more cell of one color), so there
+    the tour leaves out the top-left corner. ``skipped`` is that cell and
+    ``detour_entry`` the tour cell next to it from which the snake can
+    step into it; the corner's own entries stand in for the tour cell it
+    replaces, so an agent that takes the detour (say, to eat food there)
+    rejoins the tour without losing its place. ``skipped`` is -1 otherwise.
+    """
+
+    def __init__(self, width: int, height: int, cells: List[Tuple[int, int]], skipped: int = -1):
+        self.width = width
+        self.height = height
+        self.length = len(cells)
+
+        order = np.array([y * width + x for x, y in cells], dtype=np.int32)
+        index = np.full(width * height, -1, dtype=np.int32)
+        index[order] = np.arange(self.length, dtype=np.int32)
+        next_cell = np.full(width * height, -1, dtype=np.int32)
+        next_cell[order] = np.roll(order, -1)
+        prev_cell = np.full(width * height, -1, dtype=np.int32)
+        prev_cell[order] = np.roll(order, 1)
+
+        self.skipped = skipped
+        self.detour_entry = -1
+        if skipped >= 0:
+            # The corner replaces the tour cell diagonal to it: entered from
+            # that cell's predecessor and left towards its successor
+            stand_in = skipped + width + 1
+            self.detour_entry = int(prev_cell[stand_in])
+            index[skipped] = index[stand_in]
+            next_cell[skipped] = next_cell[stand_in]
+            prev_cell[skipped] = self.detour_entry
+
+        for array in (order, index, next_cell, prev_cell):
+            array.flags.writeable = False
+        self.order, self.index = order, index
+        self.next_cell, self.prev_cell = next_cell, prev_cell
+
+        self.order_list = order.tolist()
+        self.index_list = index.tolist()
+        self.next_list = next_cell.tolist()
+        self.prev_list = prev_cell.tolist()
+
+    def distance(self, start: int, end: int) -> int:
+        """Steps along the cycle from cell start to cell end"""
+        return (self.index_list[end] - self.index_list[start]) % self.length
+
+
+def _even_height_tour(width: int, height: int) -> List[Tuple[int, int]]:
+    """Tour of a width x height board with even height, as (x, y) cells.
+
+    Row 0 runs left to right, the remaining rows snake back and forth over
+    columns 1.. and column 0 is the way back up; an even number of rows
+    makes the last row end next to column 0, which closes the cycle.
+    """
+    cells = [(x, 0) for x in range(width)]
+    for y in range(1, height):
+        columns = range(width - 1, 0, -1) if y % 2 == 1 else range(1, width)
+        cells.extend((x, y) for x in columns)
+    cells.extend((0, y) for y in range(height - 1, 0, -1))
+    return cells
+
+
+@lru_cache(maxsize=None)
+def hamiltonian_cycle(width: int, height: int) -> HamiltonianCycle:
+    """The cycle for a board size, built once and shared by every agent"""
+    if width < 2 or height < 2:
+        raise ValueError(f"a Hamiltonian cycle needs a board of at least 2x2, got {width}x{height}")
+    if height % 2 == 0:
+        return HamiltonianCycle(width, height, _even_height_tour(width, height))
+    if width % 2 == 0:
+        # Same construction with the axes swapped
+        cells = [(x, y) for y, x in _even_height_tour(height, width)]
+        return HamiltonianCycle(width, height, cells)
+
+    # Odd by odd: tour rows 1.. (an even count), then splice row 0 minus
+    # its first cell into row 1, whose cells the tour visits left to right,
+    # replacing each step (x, 1) -> (x+1, 1) with x odd by a detour through
+    # (x, 0) and (x+1, 0)
+    tour = [(x, y + 1) for x, y in _even_height_tour(width, height - 1)]
+    cells = []
+    for x in range(width):
+        cells.append(tour[x])
+        if x % 2 == 1:
+            cells.extend([(x, 0), (x + 1, 0)])
+    cells.extend(tour[width:])
+    return HamiltonianCycle(width, height, cells, skipped=0)
@@ -0,0 +1,95 @@
+from typing import List, Optional, Tuple
+from core.grid import GridTopology
+
+class DistanceField:
+    """Shortest distances from the snake's head to every cell, one BFS per tick.
+
+    A single breadth-first search from the head records, for every cell it
+    reaches, the distance and the cell it was reached from. After that any
+    target (food, tail, a candidate cell) is answered by walking parents
+    back to the head, in time proportional to the path, instead of a new
+    search per target. Passability is the usual rule: free cells and the
+    tail, which moves away this tick. Entries are tagged with a
+    generation stamp so the arrays are never cleared.
+    """
+
+    CACHE_KEY = 'distance_field'
+
+    def __init__(self, topology: GridTopology):
+        self.topology = topology
+        num_cells = topology.num_cells
+        self.dist = [0] * num_cells
+        self.parent = [-1] * num_cells
+        self._marks = [0] * num_cells
+        self._stamp = 0
+        self.source = -1
+
+    def compute(self, body) -> 'DistanceField':
+        """BFS from the head of a SnakeBody over the passable cells"""
+        self._stamp += 1
+        stamp, marks = self._stamp, self._marks
+        dist, parent = self.dist, self.parent
+        adjacency = self.topology.adjacency
+        occupied = body.occupied
+        source = self.source = body.cell_id(body.head)
+        tail = body.cell_id(body.tail)
+
+        marks[source] = stamp
+        dist[source] = 0
+        parent[source] = -1
+        frontier = [source]
+        distance = 0
+        # Level by level: every cell of a frontier is at the same distance
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for cell in frontier:
+                for neighbor in adjacency[cell]:
+                    if marks[neighbor] != stamp and (not occupied[neighbor] or neighbor == tail):
+                        marks[neighbor] = stamp
+                        dist[neighbor] = distance
+                        parent[neighbor] = cell
+                        next_frontier.append(neighbor)
+            # Expanding each level in cell order makes a cell's parent its
+            # lowest-numbered neighbor one step nearer the head; the paths
+            # this keeps play as well as the ones A*'s tie-breaking chooses
+            next_frontier.sort()
+            frontier = next_frontier
+        return self
+
+    def for_tick(self, game) -> 'DistanceField':
+        """This tick's field from game's head, computed at most once per tick"""
+        cache = getattr(game, 'tick_cache', None)
+        if cache is None:
+            return self.compute(game.snake_pos)
+        field = cache.get(self.CACHE_KEY)
+        if field is None:
+            field = cache[self.CACHE_KEY] = self.compute(game.snake_pos)
+        return field
+
+    def cached(self, game) -> Optional['DistanceField']:
+        """This tick's field if one was already computed, without computing it"""
+        cache = getattr(game, 'tick_cache', None)
+        return cache.get(self.CACHE_KEY) if cache is not None else None
+
+    def distance(self, cell: int) -> int:
+        """Moves from the head to cell, or -1 if it cannot be reached"""
+        return self.dist[cell] if self._marks[cell] == self._stamp else -1
+
+    def cell_path(self, cell: int) -> List[int]:
+        """Shortest path from the head to cell (both included), or [] if unreachable"""
+        if self._marks[cell] != self._stamp:
+            return []
+        parent = self.parent
+        path = []
+        while cell != -1:
+            path.append(cell)
+            cell = parent[cell]
+        return path[::-1]
+
+    def path(self, position: Optional[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """Shortest path from the head to a pixel position (both included), or [] if unreachable"""
+        if position is None:
+            return []
+        positions = self.topology.positions
+        return [positions[cell] for cell in self.cell_path(self.topology.cell_id(position))]
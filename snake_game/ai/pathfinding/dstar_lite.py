@@ -0,0 +1,174 @@
+from typing import List, Optional, Tuple
+import heapq
+from core.grid import grid_topology
+
+INF = float('inf')
+
+class DStarLitePlanner:
+    """Incremental shortest path from the snake's head to the food (D* Lite).
+
+    The search runs backwards from the food, so g[cell] is the distance
+    from a cell to the food and the head can move without invalidating
+    anything. Between two ticks only a few cells change passability: the
+    new head cell becomes body and the new tail cell becomes passable
+    (the tail is treated as free, like everywhere else in the agents). The
+    planner repairs just the vertices around those cells and then only
+    expands what the repair made inconsistent, so per-tick cost follows
+    the size of the change rather than the board. A new food, a new
+    episode or a skipped tick starts a fresh search.
+    """
+
+    def __init__(self, game):
+        self.game = game
+        self.grid_size = game.grid_size
+        self.width = game.width
+        self.height = game.height
+        self.topology = grid_topology(self.width, self.height, self.grid_size)
+        self._cell_x = self.topology.cell_x
+        self._cell_y = self.topology.cell_y
+        self._adjacency = self.topology.adjacency
+
+        self.g: List[float] = []
+        self.rhs: List[float] = []
+        self._heap = []
+        self._km = 0
+        self._goal = -1
+        self._start = -1
+        # What the search was last repaired against
+        self._body = None
+        self._steps = -1
+        self._head = -1
+        self._tail = -1
+        self.expansions = 0  # vertices expanded by the last update (for profiling)
+
+    # D* Lite core
+    def _heuristic(self, cell: int) -> int:
+        """Manhattan distance from the current start (head) to cell"""
+        return (abs(self._cell_x[cell] - self._cell_x[self._start]) +
+                abs(self._cell_y[cell] - self._cell_y[self._start]))
+
+    def _key(self, cell: int) -> Tuple[float, float]:
+        m = min(self.g[cell], self.rhs[cell])
+        return (m + self._heuristic(cell) + self._km, m)
+
+    def _update_vertex(self, cell: int, occupied, tail: int) -> None:
+        g, rhs = self.g, self.rhs
+        if cell != self._goal:
+            goal = self._goal
+            best = INF
+            for neighbor in self._adjacency[cell]:
+                # Entering a cell requires it to be free (or the moving tail, or the food)
+                if not occupied[neighbor] or neighbor == tail or neighbor == goal:
+                    cost = g[neighbor] + 1
+                    if cost < best:
+                        best = cost
+            rhs[cell] = best
+        g_cell, rhs_cell = g[cell], rhs[cell]
+        if g_cell != rhs_cell:
+            m = g_cell if g_cell < rhs_cell else rhs_cell
+            start = self._start
+            h = (abs(self._cell_x[cell] - self._cell_x[start]) +
+                 abs(self._cell_y[cell] - self._cell_y[start]))
+            heapq.heappush(self._heap, (m + h + self._km, m, cell))
+
+    def _compute_shortest_path(self, occupied, tail: int) -> None:
+        heap, g, rhs = self._heap, self.g, self.rhs
+        adjacency = self._adjacency
+        start = self._start
+        pop, push = heapq.heappop, heapq.heappush
+        update_vertex = self._update_vertex
+        expansions = 0
+        while heap:
+            k1, k2, cell = heap[0]
+            # Key of the start (its heuristic is 0)
+            m = g[start] if g[start] < rhs[start] else rhs[start]
+            if (k1, k2) >= (m + self._km, m) and g[start] == rhs[start]:
+                break
+            pop(heap)
+            if g[cell] == rhs[cell]:
+                continue  # stale entry of a vertex made consistent since
+            new_key = self._key(cell)
+            if (k1, k2) < new_key:
+                push(heap, (new_key[0], new_key[1], cell))
+                continue
+            expansions += 1
+            if g[cell] > rhs[cell]:
+                g[cell] = rhs[cell]
+            else:
+                g[cell] = INF
+                update_vertex(cell, occupied, tail)
+            for neighbor in adjacency[cell]:
+                update_vertex(neighbor, occupied, tail)
+        self.expansions = expansions
+
+    def _reset(self, start: int, goal: int) -> None:
+        num_cells = self.width * self.height
+        self.g = [INF] * num_cells
+        self.rhs = [INF] * num_cells
+        self._km = 0
+        self._start = start
+        self._goal = goal
+        self.rhs[goal] = 0
+        self._heap = [(self._heuristic(goal), 0, goal)]
+
+    # Tracking the snake
+    def update(self) -> bool:
+        """Bring the search up to date with the game; False if there is no food"""
+        game = self.game
+        if game.food_pos is None:
+            return False
+        body = game.snake_pos
+        occupied = body.occupied
+        head, tail = body.cell_id(body.head), body.cell_id(body.tail)
+        goal = self.topology.cell_id(game.food_pos)
+
+        if (body is not self._body or goal != self._goal or
+                game.steps != self._steps + 1):
+            self._reset(head, goal)
+        elif head != self._head:
+            # The head moved one cell: shift the heuristic origin and repair
+            # around the cells whose passability changed
+            self._km += (abs(self._cell_x[head] - self._cell_x[self._start]) +
+                         abs(self._cell_y[head] - self._cell_y[self._start]))
+            self._start = head
+            for changed in {head, tail, self._tail}:
+                for neighbor in self._adjacency[changed]:
+                    self._update_vertex(neighbor, occupied, tail)
+
+        self._body, self._steps = body, game.steps
+        self._head, self._tail = head, tail
+        self._compute_shortest_path(occupied, tail)
+        return True
+
+    def next_cell(self) -> Optional[int]:
+        """Neighbor of the head on a shortest path to the food, or None if unreachable"""
+        if not self.update() or self.g[self._start] == INF and self.rhs[self._start] == INF:
+            return None
+        body = self.game.snake_pos
+        occupied, tail = body.occupied, self._tail
+        best, best_cost = None, INF
+        for neighbor in self._adjacency[self._start]:
+            if occupied[neighbor] and neighbor != tail and neighbor != self._goal:
+                continue
+            cost = self.g[neighbor] + 1
+            if cost < best_cost:
+                best, best_cost = neighbor, cost
+        return best
+
+    def path(self) -> List[Tuple[int, int]]:
+        """Current shortest path from the head to the food (both included)"""
+        if self._start < 0 or self.g[self._start] == INF:
+            return []
+        body = self.game.snake_pos
+        occupied, tail = body.occupied, self._tail
+        cell, path = self._start, [self._start]
+        while cell != self._goal and len(path) <= len(self.g):
+            options = [n for n in self._adjacency[cell]
+                       if not occupied[n] or n == tail or n == self._goal]
+            if not options:
+                return []
+            cell = min(options, key=self.g.__getitem__)
+            if self.g[cell] == INF:
+                return []
+            path.append(cell)
+        return [self.topology.cell_position(cell) for cell in path]
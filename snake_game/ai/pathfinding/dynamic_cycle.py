@@ -0,0 +1,176 @@
+from typing import List
+from core.constants import Direction
+from core.grid import grid_topology
+from .cycles import hamiltonian_cycle
+
+class DynamicHamiltonianPathfinder:
+    """Hamiltonian cycle agent that reshapes its own cycle towards the food.
+
+    The snake always steps to the next cell of the cycle, and its body
+    always covers the cycle cells just behind its head, in order, so the
+    cell ahead is free (or the departing tail) and the snake never dies.
+    Instead of leaving the cycle for shortcuts, the agent changes the cycle
+    itself, only where nothing can be broken: ahead of the head, before the
+    tail.
+
+    The changes are splices on 2x2 squares. When two cycle edges run in
+    opposite directions along two sides of a square, swapping them for the
+    other two sides cuts the cycle in two; done again with one edge in
+    each part, it joins them back into one. Cutting off a loop of the
+    stretch between the head and the food and joining it back in after
+    the food shortens the way to the food by the length of the loop. Each
+    tick the agent greedily moves the largest such loops, touching only
+    the free cells ahead of the head, so the body keeps its place and the
+    invariant holds.
+
+    On odd-by-odd boards the cycle misses one cell. Food there is taken by
+    swapping that cell for the cycle cell just ahead of the head when both
+    share the head and the cell after as neighbors; the swapped-out cell
+    becomes the missing one.
+    """
+
+    # Loops moved per tick; the first one or two do most of the work
+    MAX_REROUTES_PER_TICK = 4
+
+    def __init__(self, game):
+        self.game = game
+        self.grid_size = game.grid_size
+        self.width = game.width
+        self.height = game.height
+        self.topology = grid_topology(self.width, self.height, self.grid_size)
+        self._cell_x = self.topology.cell_x
+        self._cell_y = self.topology.cell_y
+        # Offsets to the cells beside a cell across a horizontal / vertical edge
+        self._across_rows = [tuple(side for side, ok in ((self.width, y + 1 < self.height), (-self.width, y > 0)) if ok)
+                             for y in self._cell_y]
+        self._across_columns = [tuple(side for side, ok in ((1, x + 1 < self.width), (-1, x > 0)) if ok)
+                                for x in self._cell_x]
+
+        self.order: List[int] = []  # cycle position -> cell
+        self.index: List[int] = []  # cell -> cycle position, -1 off the cycle
+        self.skipped = -1
+        self._body = None
+        self.splices = 0  # splices applied so far (for profiling)
+        self.reset_cycle()
+
+    def reset_cycle(self) -> None:
+        """Start again from the board's fixed cycle (shared, so copied)"""
+        base = hamiltonian_cycle(self.width, self.height)
+        self.order = list(base.order_list)
+        self.index = list(base.index_list)
+        self.skipped = base.skipped
+        if self.skipped >= 0:
+            self.index[self.skipped] = -1
+
+    def _adjacent(self, a: int, b: int) -> bool:
+        return abs(self._cell_x[a] - self._cell_x[b]) + abs(self._cell_y[a] - self._cell_y[b]) == 1
+
+    def end_episode(self, score: int) -> None:
+        """Go back to the fixed cycle for the next game"""
+        self._body = None
+
+    def get_next_move(self) -> Direction:
+        """Get the next move along the (reshaped) cycle"""
+        body = self.game.snake_pos
+        if body is not self._body:
+            # New episode: a one-cell snake lies on any cycle in order
+            self._body = body
+            self.reset_cycle()
+        head = self.topology.cell_id(body.head)
+
+        if self.game.food_pos is not None:
+            food = self.topology.cell_id(self.game.food_pos)
+            if food == self.skipped:
+                if len(body) == len(self.order) and self._adjacent(head, food):
+                    # Only the missing cell is left: eat it and win
+                    return self.topology.direction_between(head, food)
+                self._take_in_skipped(head, len(body))
+            else:
+                self._bring_food_closer(head, food, len(body))
+
+        next_cell = self.order[(self.index[head] + 1) % len(self.order)]
+        return self.topology.direction_between(head, next_cell)
+
+    def _bring_food_closer(self, head: int, food: int, length: int) -> None:
+        """Move loops of the free stretch before the food to just after it"""
+        order, index = self.order, self.index
+        across_rows, across_columns = self._across_rows, self._across_columns
+        n = len(order)
+        free = n - length  # offsets 1..free ahead of the head are free cells
+
+        for _ in range(self.MAX_REROUTES_PER_TICK):
+            h = index[head]
+            f = (index[food] - h) % n
+            if f < 4:
+                return
+
+            # An edge c -> c + 1 and a cycle edge s -> s + 1 running the other
+            # way along the opposite side of a 2x2 square can be swapped for
+            # the square's other two sides: this cuts the cycle in two, or
+            # joins two cycles into one. rejoin[c] is such an s after the
+            # food (f <= s <= free), where a loop cut off before it could be
+            # joined back in through edge c. Cells are read off the cycle by
+            # offset from the head, only as far as the food
+            rejoin = [-1] * f
+            below = [0] * (f + 1)  # rejoin edges at offsets below c
+            r = order[(h + 1) % n]
+            for c in range(1, f - 1):
+                r_next = order[(h + c + 1) % n]
+                step = r_next - r
+                for side in (across_rows[r] if step == 1 or step == -1 else across_columns[r]):
+                    si = index[r_next + side]
+                    if si >= 0 and order[(si + 1) % n] == r + side and f <= (si - h) % n <= free:
+                        rejoin[c] = (si - h) % n
+                        break
+                below[c + 1] = below[c] + (rejoin[c] >= 0)
+                r = r_next
+            below[f] = below[f - 1]
+            if not below[f]:
+                return
+
+            # Cut edges a -> a + 1 and b -> b + 1 the same way to split off
+            # the loop a + 1..b, keeping the largest one that can rejoin
+            best_gain, best = 0, None
+            p = head
+            for a in range(f - 2):
+                p_next = order[(h + a + 1) % n]
+                step = p_next - p
+                for side in (across_rows[p] if step == 1 or step == -1 else across_columns[p]):
+                    qi = index[p_next + side]
+                    if qi < 0 or order[(qi + 1) % n] != p + side:
+                        continue
+                    b = (qi - h) % n
+                    if a + 1 < b < f and b - a > best_gain and below[b] > below[a + 1]:
+                        best_gain, best = b - a, (a, b)
+                p = p_next
+            if best is None:
+                return
+            a, b = best
+            c = next(c for c in range(a + 1, b) if rejoin[c] >= 0)
+            self._move_loop(h, a, b, c, rejoin[c])
+            self.splices += 2
+
+    def _move_loop(self, h: int, a: int, b: int, c: int, s: int) -> None:
+        """Cut the loop at offsets a + 1..b out after a and join it back in after s, entering at c + 1"""
+        order, index = self.order, self.index
+        n = len(order)
+        cells = [order[(h + k) % n] for k in range(a + 1, s + 1)]
+        loop = cells[:b - a]
+        # Stretch after the loop up to s, then the loop from c + 1 around to c
+        cells = cells[b - a:] + loop[c - a:] + loop[:c - a]
+        for k, cell in enumerate(cells, start=h + a + 1):
+            order[k % n] = cell
+            index[cell] = k % n
+
+    def _take_in_skipped(self, head: int, length: int) -> None:
+        """Swap the off-cycle cell in for the cell just ahead of the head, if they are interchangeable"""
+        order, index = self.order, self.index
+        n = len(order)
+        h = index[head]
+        ahead, after = order[(h + 1) % n], order[(h + 2) % n]
+        if (length < n and self._adjacent(head, self.skipped) and
+                self._adjacent(self.skipped, after)):
+            order[(h + 1) % n] = self.skipped
+            index[self.skipped] = (h + 1) % n
+            index[ahead] = -1
+            self.skipped = ahead
@@ -1,7 +1,10 @@
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 from core.constants import Direction
+from core.state import SnakeState
 from .astar import AStarPathfinder
+from .distance_field import DistanceField
 from .hamilton import HamiltonianPathfinder
+from .dstar_lite import DStarLitePlanner
 
 class HybridPathfinder:
     """Combines A* and Hamiltonian strategies for optimal performance"""
@@ -10,6 +13,11 @@ class HybridPathfinder:
         self.game = game
         self.astar = AStarPathfinder(game)
         self.hamilton = HamiltonianPathfinder(game)
+        # Food path repaired incrementally tick to tick instead of re-searched
+        self.planner = DStarLitePlanner(game)
+        # BFS over simulated bodies for the tail checks, apart from the tick's shared field
+        self.topology = self.astar.topology
+        self.lookahead = DistanceField(self.topology)
         self.use_astar = True  # Start with A* for efficiency
         
     def get_next_move(self) -> Direction:
@@ -27,30 +35,84 @@ class HybridPathfinder:
             
         # Use appropriate strategy
         if self.use_astar:
-            # Try A* first
-            path = self.astar.find_path(self.game.snake_pos[0], self.game.food_pos)
-            if path:
-                return self.astar.get_direction_to_position(
-                    self.game.snake_pos[0], 
-                    path[1] if len(path) > 1 else path[0]
-                )
+            # Try the shortest path to food first, unless eating there
+            # would wall the head off from its tail
+            next_cell = self.planner.next_cell()
+            if next_cell is not None and self.tail_reachable_after(self.planner.path()):
+                head = self.topology.cell_id(self.game.snake_pos[0])
+                return self.topology.direction_between(head, next_cell)
+            
+            # Food cut off or unsafe: take the long way round to the tail,
+            # which reshapes the body until a food path is safe again
+            direction = self.stall_direction()
+            if direction is not None:
+                return direction
             
             # If A* fails, switch to Hamiltonian
             self.use_astar = False
             
-        # Use Hamiltonian cycle as fallback
-        return self.hamilton.get_next_move()
+        # Use Hamiltonian cycle as fallback; a body that grew along A*
+        # paths is not in cycle order yet, so the cycle move gets the
+        # same tail check
+        direction = self.hamilton.get_next_move()
+        if self.tail_reachable_after_move(direction):
+            return direction
+        return self.stall_direction() or direction
+    
+    def tail_reachable_after(self, path: List[Tuple[int, int]]) -> bool:
+        """Whether the head can still reach the tail once the snake has followed path"""
+        if len(path) < 2:
+            return False
+        topology = self.topology
+        state = SnakeState.from_game(self.game)
+        for position in path[1:]:
+            step = topology.direction_between(topology.cell_id(state.head), topology.cell_id(position))
+            if not state.step(step):
+                return state.won
+        return self._tail_distance(state) > 0
+    
+    def tail_reachable_after_move(self, direction: Direction) -> bool:
+        """Whether the head can still reach the tail one move in direction later"""
+        state = SnakeState.from_game(self.game)
+        if not state.step(direction):
+            return state.won
+        return self._tail_distance(state) > 0
+    
+    def stall_direction(self) -> Optional[Direction]:
+        """Move after which the tail is still reachable and as far from the head as possible"""
+        state = SnakeState.from_game(self.game)
+        snapshot = state.snapshot()
+        best, best_distance = None, 0
+        for direction in Direction:
+            if state.step(direction):
+                distance = self._tail_distance(state)
+                if distance > best_distance:
+                    best, best_distance = direction, distance
+            elif state.won:
+                return direction
+            state.restore(snapshot)
+        return best
+    
+    def _tail_distance(self, state: SnakeState) -> int:
+        """Moves from the simulated head to its tail, or -1 if it is walled off"""
+        body = state.body
+        return self.lookahead.compute(body).distance(body.cell_id(body.tail))
+    
+    def end_episode(self, score: int) -> None:
+        """Drop per-game state before the board is reset"""
+        self.astar.end_episode(score)
+        self.hamilton.end_episode(score)
+        self.use_astar = True
     
     def draw_debug_info(self, screen) -> None:
         """Draw debug visualization"""
         import pygame
-        font = pygame.font.Font(None, 24)
+        from core.text_cache import get_text_cache
         strategy = "A*" if self.use_astar else "Hamiltonian"
-        text = font.render(f"Strategy: {strategy}", True, (255, 255, 255))
-        screen.blit(text, (10, 160))
+        get_text_cache().blit(screen, f"Strategy: {strategy}", 24, (255, 255, 255), topleft=(10, 160))
         
         # Draw current path if using A*
-        if self.use_astar and hasattr(self.astar, 'current_path'):
-            for pos in self.astar.current_path:
+        if self.use_astar:
+            for pos in self.planner.path():
                 pygame.draw.rect(screen, (0, 255, 0), 
                                (pos[0], pos[1], 5, 5))
\ No newline at end of file
@@ -0,0 +1,121 @@
+from typing import List, Tuple
+from core.grid import grid_topology
+from .regions import RegionMap
+
+class TailReachability:
+    """Which passable cells can still reach the snake's tail, kept across ticks.
+
+    Connectivity of the passable cells (free or tail) is held in a
+    union-find. From one tick to the next the body shifts by a single
+    cell, so the board changes in at most two places:
+
+    - the new tail cell becomes passable: it gets a fresh node that is
+      unioned with its passable neighbors, which union-find does exactly;
+    - the new head cell becomes blocked: union-find cannot split sets, so
+      the 3x3 ring around the cell is checked instead. If the passable
+      4-neighbors of the cell are all joined by passable ring cells, every
+      path through it can be rerouted and no region splits; the cell is
+      just dropped. Only otherwise is the board relabelled.
+
+    Relabelling starts from the tick's shared RegionMap, so after a reset,
+    a skipped tick or a possible split the cost is one labeling pass; every
+    other tick costs O(1) plus a few near-constant ``find`` calls.
+    """
+
+    # Node table growth allowed before it is compacted by a relabel
+    MAX_NODES_PER_CELL = 2
+
+    def __init__(self, game, regions: RegionMap = None):
+        self.game = game
+        self.grid_size = game.grid_size
+        self.width = game.width
+        self.height = game.height
+        self.topology = grid_topology(self.width, self.height, self.grid_size)
+        self.regions = regions or RegionMap(self.topology)
+        self._adjacency = self.topology.adjacency
+        self._rings = self.topology.rings
+
+        self._node = [-1] * self.topology.num_cells  # union-find node of each passable cell, -1 if blocked
+        self._parent: List[int] = []
+        # What the structure was last brought up to date with
+        self._body = None
+        self._steps = -1
+        self._head = -1
+        self._tail = -1
+        self.relabels = 0  # full relabels so far (for profiling)
+
+    def _find(self, node: int) -> int:
+        parent = self._parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]  # path halving
+            node = parent[node]
+        return node
+
+    # Keeping up with the snake
+    def update(self) -> None:
+        """Bring the structure up to date with the game's current board"""
+        game = self.game
+        body = game.snake_pos
+        if body is self._body and game.steps == self._steps:
+            return
+        head, tail = body.cell_id(body.head), body.cell_id(body.tail)
+        if (body is not self._body or game.steps != self._steps + 1 or
+                len(self._parent) > self.MAX_NODES_PER_CELL * len(self._node)):
+            self._relabel()
+        else:
+            occupied = body.occupied
+            if tail != self._tail:
+                self._add(tail, occupied, tail)
+            if head != self._head and not self._remove(head, occupied, tail):
+                self._relabel()
+        self._body, self._steps = body, game.steps
+        self._head, self._tail = head, tail
+
+    def _relabel(self) -> None:
+        """Rebuild from this tick's region labels: one root node per region"""
+        regions = self.regions.for_tick(self.game)
+        self._node = [regions.label(cell) for cell in range(len(self._node))]
+        self._parent = list(range(regions.num_regions))
+        self.relabels += 1
+
+    def _add(self, cell: int, occupied, tail: int) -> None:
+        """cell became passable: give it a fresh node joined to its passable neighbors"""
+        node, parent = self._node, self._parent
+        if node[cell] >= 0:
+            return
+        root = node[cell] = len(parent)
+        parent.append(root)
+        for neighbor in self._adjacency[cell]:
+            if node[neighbor] >= 0 and (not occupied[neighbor] or neighbor == tail):
+                other = self._find(node[neighbor])
+                if other != root:
+                    parent[other] = root
+
+    def _remove(self, cell: int, occupied, tail: int) -> bool:
+        """cell became blocked; False if that may have split its region"""
+        if self._node[cell] < 0 or not occupied[cell] or cell == tail:
+            return True
+        self._node[cell] = -1
+        # Count the runs of passable ring cells that hold a 4-neighbor; a
+        # single run means the neighbors stay joined around the cell
+        passable = [c >= 0 and (not occupied[c] or c == tail) for c in self._rings[cell]]
+        if all(passable):
+            return True
+        start = passable.index(False)
+        runs, touches = 0, False
+        for i in range(start + 1, start + 9):
+            slot = i % 8
+            if passable[slot]:
+                touches = touches or slot % 2 == 1
+            else:
+                runs += touches
+                touches = False
+        return runs <= 1
+
+    # Queries
+    def reachable(self, position: Tuple[int, int]) -> bool:
+        """Whether the tail can be reached from a passable position"""
+        self.update()
+        cell = self.topology.cell_id(position)
+        a, b = self._node[cell], self._node[self._tail]
+        return a >= 0 and b >= 0 and self._find(a) == self._find(b)
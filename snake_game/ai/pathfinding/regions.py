@@ -0,0 +1,80 @@
+from typing import List
+from core.grid import GridTopology
+
+class RegionMap:
+    """Connected regions of passable cells, labelled in one pass per tick.
+
+    Passable means free or the snake's tail (it moves away this tick), the
+    same rule as ``SnakeBody.is_blocked``. ``compute`` walks only the free
+    cells, so late-game labeling gets cheaper as the snake grows; after it,
+    "how big is the region behind this neighbor" and "can this cell reach
+    that one" are O(1) lookups. Labels are tagged with a generation stamp
+    so the arrays are never cleared.
+    """
+
+    CACHE_KEY = 'regions'
+
+    def __init__(self, topology: GridTopology):
+        self.topology = topology
+        num_cells = topology.num_cells
+        self._adjacency = topology.adjacency
+        self.labels = [-1] * num_cells
+        self.sizes: List[int] = []
+        self._marks = [0] * num_cells
+        self._stamp = 0
+
+    def compute(self, body) -> 'RegionMap':
+        """Label every passable cell of a SnakeBody with its region id"""
+        self._stamp += 1
+        stamp, marks, labels = self._stamp, self._marks, self.labels
+        adjacency = self._adjacency
+        occupied = body.occupied
+        tail = body.cell_id(body.tail) if len(body) else -1
+        sizes = self.sizes = []
+
+        seeds = body.free_cells if tail < 0 else body.free_cells + [tail]
+        for seed in seeds:
+            if marks[seed] == stamp:
+                continue
+            label = len(sizes)
+            marks[seed] = stamp
+            labels[seed] = label
+            stack = [seed]
+            count = 0
+            while stack:
+                cell = stack.pop()
+                count += 1
+                for neighbor in adjacency[cell]:
+                    if marks[neighbor] != stamp and (not occupied[neighbor] or neighbor == tail):
+                        marks[neighbor] = stamp
+                        labels[neighbor] = label
+                        stack.append(neighbor)
+            sizes.append(count)
+        return self
+
+    def for_tick(self, game) -> 'RegionMap':
+        """This tick's labeling of game's board, computed at most once per tick"""
+        cache = getattr(game, 'tick_cache', None)
+        if cache is None:
+            return self.compute(game.snake_pos)
+        regions = cache.get(self.CACHE_KEY)
+        if regions is None:
+            regions = cache[self.CACHE_KEY] = self.compute(game.snake_pos)
+        return regions
+
+    def label(self, cell: int) -> int:
+        """Region id of a cell, or -1 if it is blocked"""
+        return self.labels[cell] if self._marks[cell] == self._stamp else -1
+
+    def region_size(self, cell: int) -> int:
+        """Number of passable cells reachable from (and including) cell; 0 if blocked"""
+        label = self.label(cell)
+        return self.sizes[label] if label >= 0 else 0
+
+    def connected(self, a: int, b: int) -> bool:
+        label = self.label(a)
+        return label >= 0 and label == self.label(b)
+
+    @property
+    def num_regions(self) -> int:
+        return len(self.sizes)
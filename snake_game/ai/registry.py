@@ -0,0 +1,28 @@
+import importlib
+from typing import Dict, Type
+
+from core.constants import AIType
+
+# AI type -> "module:Class"; modules are imported on first use so the
+# manual game never pays for torch or the pathfinders at startup
+AGENTS: Dict[AIType, str] = {
+    AIType.REINFORCEMENT_LEARNING: 'ai.reinforcement.agent:RLAgent',
+    AIType.ASTAR: 'ai.pathfinding.astar:AStarPathfinder',
+    AIType.HAMILTONIAN: 'ai.pathfinding.hamilton:HamiltonianPathfinder',
+    AIType.HYBRID: 'ai.pathfinding.hybrid:HybridPathfinder',
+    AIType.DYNAMIC_HAMILTONIAN: 'ai.pathfinding.dynamic_cycle:DynamicHamiltonianPathfinder',
+}
+
+_loaded: Dict[AIType, Type] = {}
+
+def load_agent_class(ai_type: AIType) -> Type:
+    """Import and return the agent class for an AI type"""
+    cls = _loaded.get(ai_type)
+    if cls is None:
+        module_name, class_name = AGENTS[ai_type].split(':')
+        cls = _loaded[ai_type] = getattr(importlib.import_module(module_name), class_name)
+    return cls
+
+def create_agent(ai_type: AIType, env, **kwargs):
+    """Construct an agent of the given type driving env"""
+    return load_agent_class(ai_type)(env, **kwargs)
\ No newline at end of file
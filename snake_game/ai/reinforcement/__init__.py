@@ -1,8 +1,18 @@
 # ai/reinforcement/__init__.py
-from .agent import RLAgent
-from .model import SnakeNN
-from .memory import PrioritizedReplayMemory
 from .config import RLConfig
-from .trainer import QTrainer
 
-__all__ = ['RLAgent', 'SnakeNN', 'PrioritizedReplayMemory', 'RLConfig', 'QTrainer']
\ No newline at end of file
+__all__ = ['RLAgent', 'SnakeNN', 'PrioritizedReplayMemory', 'RLConfig', 'QTrainer']
+
+_LAZY = {
+    'RLAgent': '.agent',
+    'SnakeNN': '.model',
+    'PrioritizedReplayMemory': '.memory',
+    'QTrainer': '.trainer',
+}
+
+def __getattr__(name):
+    # Everything but the config needs torch; import it only on demand
+    if name in _LAZY:
+        import importlib
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -9,6 +9,7 @@ import os
 from datetime import datetime
 
 from core.constants import Direction
+from core.text_cache import get_text_cache
 from ..base import SnakeAI
 from .model import SnakeNN
 from .config import RLConfig
@@ -17,9 +18,11 @@ from .memory import PrioritizedReplayMemory
 from utils.persistence import SaveLoadManager
 
 class RLAgent(SnakeAI):
-    def __init__(self, game):
-        super().__init__(game)
+    def __init__(self, game, seed: Optional[int] = None, bitboard: bool = False):
+        super().__init__(game, bitboard)
         self.config = RLConfig()
+        # Own RNG so exploration is reproducible for a given seed
+        self.rng = random.Random(seed)
         self.n_games = 0
         self.epsilon = self.config.EPSILON_START
         
@@ -54,11 +57,9 @@ class RLAgent(SnakeAI):
         self.current_reward = 0
         self.record = 0
         
-        # Initialize save/load manager
+        # Initialize save/load manager; resuming from training_states/ is
+        # up to the caller (load_training_state), not construction
         self.save_load_manager = SaveLoadManager(max_saves=5)
-        
-        # Load previous training state if available
-        self.load_training_state()
 
     def get_next_move(self) -> Direction:
         """Get the next move based on current state"""
@@ -66,6 +67,12 @@ class RLAgent(SnakeAI):
         action = self._get_action(state)
         return self._action_to_direction(action)
 
+    def end_episode(self, score: int) -> None:
+        """Record the finished game and train on a batch from replay memory"""
+        super().end_episode(score)
+        self.update_training_stats(score)
+        self.train_long_memory()
+
     def remember(self, state: List[bool], action: List[int], reward: float, 
                 next_state: List[bool], done: bool) -> None:
         """Store experience in memory with memory management"""
@@ -147,7 +154,10 @@ class RLAgent(SnakeAI):
         """Update training statistics with enhanced memory metrics"""
         self.n_games += 1
         self.scores.append(score)
-        mean_score = sum(self.scores) / len(self.scores)
+        # Running mean: self-play finishes thousands of games a second, so
+        # re-summing every score per game would grow quadratically
+        previous_mean = self.mean_scores[-1] if self.mean_scores else 0.0
+        mean_score = previous_mean + (score - previous_mean) / len(self.scores)
         self.mean_scores.append(mean_score)
         
         if score > self.record:
@@ -199,9 +209,9 @@ class RLAgent(SnakeAI):
         
         final_move = [0, 0, 0]  # [straight, right, left]
         
-        if random.random() < self.epsilon:
+        if self.rng.random() < self.epsilon:
             # Exploration: random action
-            move = random.randint(0, 2)
+            move = self.rng.randint(0, 2)
             final_move[move] = 1
         else:
             # Exploitation: predicted action
@@ -234,7 +244,7 @@ class RLAgent(SnakeAI):
         """Draw AI debug visualization with enhanced information"""
         # Draw state information
         state = self.get_state()
-        font = pygame.font.Font(None, 24)
+        text_cache = get_text_cache()
         
         # Draw danger indicators
         if state[0]:  # Danger straight
@@ -256,6 +266,5 @@ class RLAgent(SnakeAI):
         ]
         
         for text in texts:
-            text_surface = font.render(text, True, (255,255,255))
-            screen.blit(text_surface, (10, y_pos))
+            text_cache.blit(screen, text, 24, (255,255,255), topleft=(10, y_pos))
             y_pos += 20
\ No newline at end of file
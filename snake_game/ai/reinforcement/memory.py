@@ -41,6 +41,23 @@ class PrioritizedReplayMemory:
         self.total_added += 1
         self.priority_sum = sum(self.priorities)
     
+    def push_batch(self, states, actions, rewards, next_states, dones) -> None:
+        """Store many transitions at once, recomputing the priority sum only once"""
+        max_priority = max(self.priorities) if self.priorities else 1.0
+        
+        for experience in zip(states, actions, rewards, next_states, dones):
+            if len(self.memory) < self.capacity:
+                self.memory.append((max_priority, experience))
+                self.priorities.append(max_priority)
+            else:
+                idx = self.position % self.capacity
+                self.memory[idx] = (max_priority, experience)
+                self.priorities[idx] = max_priority
+            self.position = (self.position + 1) % self.capacity
+            self.total_added += 1
+        
+        self.priority_sum = sum(self.priorities)
+    
     def sample(self, batch_size: int) -> Tuple:
         """Sample a batch of experiences based on their priorities"""
         if batch_size > len(self.memory):
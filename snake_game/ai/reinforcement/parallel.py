@@ -0,0 +1,333 @@
+# parallel.py
+import argparse
+import multiprocessing as mp
+import os
+import time
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+import numpy as np
+import torch
+
+from core.constants import GameSettings
+from core.vec_env import VecSnakeEnv
+from .model import SnakeNN
+
+STATE_SIZE = VecSnakeEnv.OBSERVATION_SIZE
+
+
+class SharedTransitionBuffer:
+    """Transition ring buffers in one shared-memory block, one ring per worker.
+
+    Every worker writes only to its own ring and then bumps its own write
+    counter, so writers never contend and the learner can read new rows
+    straight out of shared memory without locks or pickling. Before it
+    overwrites old rows a worker also bumps a reserve counter, which lets
+    the learner tell after a copy which rows a lapping worker may have
+    overwritten while it was reading.
+    """
+
+    def __init__(self, num_workers: int, capacity: int, name: Optional[str] = None):
+        self.num_workers = num_workers
+        self.capacity = capacity
+        rows = num_workers * capacity
+
+        layout = [
+            ('counters', np.int64, (num_workers,)),
+            ('reserved', np.int64, (num_workers,)),
+            ('states', np.float32, (rows, STATE_SIZE)),
+            ('next_states', np.float32, (rows, STATE_SIZE)),
+            ('rewards', np.float32, (rows,)),
+            ('actions', np.int8, (rows,)),
+            ('dones', np.bool_, (rows,)),
+        ]
+        size = sum(np.dtype(dtype).itemsize * int(np.prod(shape)) for _, dtype, shape in layout)
+
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+
+        offset = 0
+        for field, dtype, shape in layout:
+            array = np.ndarray(shape, dtype=dtype, buffer=self.shm.buf, offset=offset)
+            setattr(self, field, array)
+            offset += array.nbytes
+        if self.owner:
+            self.counters[:] = 0
+            self.reserved[:] = 0
+        self._read = np.zeros(num_workers, dtype=np.int64)
+
+    def write(self, worker: int, states: np.ndarray, actions: np.ndarray,
+              rewards: np.ndarray, next_states: np.ndarray, dones: np.ndarray) -> None:
+        """Append a batch of transitions to a worker's ring (worker side)"""
+        n = len(states)
+        start = int(self.counters[worker])
+        slots = worker * self.capacity + (start + np.arange(n)) % self.capacity
+        # Claim the rows first: readers drop anything this batch may overwrite
+        self.reserved[worker] = start + n
+        self.states[slots] = states
+        self.actions[slots] = actions
+        self.rewards[slots] = rewards
+        self.next_states[slots] = next_states
+        self.dones[slots] = dones
+        # Publish only after the rows are written
+        self.counters[worker] = start + n
+
+    def read_new(self) -> Tuple[np.ndarray, ...]:
+        """Copy out every transition written since the last call (learner side).
+
+        If a worker lapped the reader, the overwritten rows are skipped,
+        including rows it overwrote while they were being copied.
+        """
+        batches = []
+        for worker in range(self.num_workers):
+            written = int(self.counters[worker])
+            start = max(int(self._read[worker]), written - self.capacity)
+            self._read[worker] = written
+            if written <= start:
+                continue
+            rows = np.arange(start, written)
+            slots = worker * self.capacity + rows % self.capacity
+            batch = (self.states[slots], self.actions[slots], self.rewards[slots],
+                     self.next_states[slots], self.dones[slots])
+            # Rows below this may have been rewritten during the copy
+            intact = rows >= int(self.reserved[worker]) - self.capacity
+            if not intact.all():
+                batch = tuple(column[intact] for column in batch)
+            batches.append(batch)
+        if not batches:
+            return (self.states[:0].copy(), self.actions[:0].copy(), self.rewards[:0].copy(),
+                    self.next_states[:0].copy(), self.dones[:0].copy())
+        return tuple(np.concatenate(columns) for columns in zip(*batches))
+
+    def close(self) -> None:
+        # Drop views before closing the mapping
+        for field in ('counters', 'reserved', 'states', 'next_states', 'rewards', 'actions', 'dones'):
+            setattr(self, field, None)
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+class SharedWeights:
+    """Flat model parameters plus epsilon in shared memory, guarded by a seqlock.
+
+    The learner bumps the version to an odd number while writing and to
+    the next even number when done; readers retry if they saw an odd or
+    changed version, so a worker never loads a half-written model.
+    """
+
+    def __init__(self, num_params: int, name: Optional[str] = None):
+        self.num_params = num_params
+        size = 16 + 4 * num_params
+        self.owner = name is None
+        if self.owner:
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.version = np.ndarray((1,), dtype=np.int64, buffer=self.shm.buf, offset=0)
+        self.epsilon = np.ndarray((1,), dtype=np.float64, buffer=self.shm.buf, offset=8)
+        self.params = np.ndarray((num_params,), dtype=np.float32, buffer=self.shm.buf, offset=16)
+        if self.owner:
+            self.version[0] = 0
+
+    def publish(self, model: torch.nn.Module, epsilon: float) -> None:
+        vector = torch.nn.utils.parameters_to_vector(model.parameters()).detach().cpu().numpy()
+        self.version[0] += 1
+        self.params[:] = vector
+        self.epsilon[0] = epsilon
+        self.version[0] += 1
+
+    def load_into(self, model: torch.nn.Module, seen_version: int) -> Tuple[int, float]:
+        """Copy newer weights into model; returns (version, epsilon)"""
+        while True:
+            version = int(self.version[0])
+            if version == seen_version:
+                return version, float(self.epsilon[0])
+            if version % 2:
+                time.sleep(0)
+                continue
+            params = self.params.copy()
+            epsilon = float(self.epsilon[0])
+            if int(self.version[0]) == version:
+                break
+        torch.nn.utils.vector_to_parameters(torch.from_numpy(params), model.parameters())
+        return version, epsilon
+
+    def close(self) -> None:
+        self.version = self.epsilon = self.params = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def _self_play_worker(worker: int, num_envs: int, settings: GameSettings,
+                      buffer_name: str, num_workers: int, capacity: int,
+                      weights_name: str, num_params: int,
+                      stop_event, scores_queue, seed: int, sync_interval: int) -> None:
+    """Worker process: step its own VecSnakeEnv batch with a local model copy"""
+    torch.set_num_threads(1)
+    buffer = SharedTransitionBuffer(num_workers, capacity, name=buffer_name)
+    weights = SharedWeights(num_params, name=weights_name)
+    model = SnakeNN(input_size=STATE_SIZE, hidden_size=256, output_size=3)
+    model.eval()
+    rng = np.random.default_rng(seed)
+    env = VecSnakeEnv(num_envs, settings, seed=seed)
+
+    try:
+        version, epsilon = weights.load_into(model, -1)
+        states = env.reset()
+        step = 0
+        while not stop_event.is_set():
+            with torch.no_grad():
+                actions = model(torch.from_numpy(states)).argmax(dim=1).numpy()
+            explore = rng.random(num_envs) < epsilon
+            actions[explore] = rng.integers(0, 3, explore.sum())
+
+            next_states, rewards, dones, info = env.step(actions)
+            # Store the true terminal observation, not the auto-reset one
+            stored_next = next_states
+            if dones.any():
+                stored_next = next_states.copy()
+                stored_next[dones] = info['terminal_observation']
+                for score in info['scores'][dones]:
+                    scores_queue.put(int(score))
+            buffer.write(worker, states, actions, rewards, stored_next, dones)
+            states = next_states
+
+            step += 1
+            if step % sync_interval == 0:
+                version, epsilon = weights.load_into(model, version)
+    finally:
+        buffer.close()
+        weights.close()
+
+
+class SelfPlayPool:
+    """Persistent pool of self-play worker processes feeding one learner.
+
+    Each worker owns ``envs_per_worker`` boards (a ``VecSnakeEnv``) and a
+    private copy of the network, writes transitions into a
+    ``SharedTransitionBuffer`` and re-reads weights from ``SharedWeights``
+    every ``sync_interval`` steps. The learner calls ``collect()`` to pull
+    new transitions and ``broadcast()`` after training to push weights.
+    """
+
+    def __init__(self, model: torch.nn.Module, num_workers: Optional[int] = None,
+                 envs_per_worker: int = 16, capacity_per_worker: int = 65_536,
+                 settings: Optional[GameSettings] = None, epsilon: float = 1.0,
+                 sync_interval: int = 50, seed: int = 0):
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.envs_per_worker = envs_per_worker
+        self.settings = settings or GameSettings()
+        num_params = sum(p.numel() for p in model.parameters())
+
+        self.buffer = SharedTransitionBuffer(self.num_workers, capacity_per_worker)
+        self.weights = SharedWeights(num_params)
+        self.weights.publish(model, epsilon)
+
+        ctx = mp.get_context('spawn')
+        self.stop_event = ctx.Event()
+        self.scores_queue = ctx.Queue()
+        self.workers = [
+            ctx.Process(
+                target=_self_play_worker,
+                args=(i, envs_per_worker, self.settings,
+                      self.buffer.name, self.num_workers, capacity_per_worker,
+                      self.weights.name, num_params,
+                      self.stop_event, self.scores_queue, seed + i, sync_interval),
+                daemon=True,
+            )
+            for i in range(self.num_workers)
+        ]
+        for worker in self.workers:
+            worker.start()
+
+    def collect(self) -> Tuple[Tuple[np.ndarray, ...], List[int]]:
+        """New transitions since the last call and the scores of finished games"""
+        scores = []
+        while not self.scores_queue.empty():
+            scores.append(self.scores_queue.get_nowait())
+        return self.buffer.read_new(), scores
+
+    def broadcast(self, model: torch.nn.Module, epsilon: float) -> None:
+        """Publish the learner's current weights and exploration rate"""
+        self.weights.publish(model, epsilon)
+
+    def close(self) -> None:
+        self.stop_event.set()
+        for worker in self.workers:
+            worker.join(timeout=5)
+            if worker.is_alive():
+                worker.terminate()
+        self.scores_queue.close()
+        self.buffer.close()
+        self.weights.close()
+
+    def __enter__(self) -> 'SelfPlayPool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def train_self_play(agent, updates: int, num_workers: Optional[int] = None,
+                    settings: Optional[GameSettings] = None,
+                    broadcast_interval: int = 10) -> List[int]:
+    """Train an RLAgent on a SelfPlayPool's experience; returns the scores of finished games.
+
+    Every update pulls the workers' new transitions into the agent's replay
+    memory and trains on one batch; every ``broadcast_interval`` updates
+    epsilon decays and the weights are pushed back to the workers. The
+    pool, and with it its shared memory, is closed on return.
+    """
+    scores = []
+    with SelfPlayPool(agent.model, num_workers=num_workers, settings=settings,
+                      epsilon=agent.epsilon) as pool:
+        update = 0
+        while update < updates:
+            (states, actions, rewards, next_states, dones), finished = pool.collect()
+            for score in finished:
+                agent.update_training_stats(score)
+            scores.extend(finished)
+            if not len(states):
+                # Workers still starting up, or the learner got ahead of them
+                time.sleep(0.001)
+                continue
+
+            one_hot = np.eye(3, dtype=np.float32)[actions]
+            agent.memory.push_batch(states, one_hot, rewards, next_states, dones)
+            agent.train_long_memory()
+
+            update += 1
+            if update % broadcast_interval == 0:
+                agent.epsilon = max(agent.config.EPSILON_END,
+                                    agent.epsilon * agent.config.EPSILON_DECAY)
+                pool.broadcast(agent.model, agent.epsilon)
+    return scores
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Train the RL agent from parallel self-play")
+    parser.add_argument('--updates', type=int, default=10_000, help="learner training steps")
+    parser.add_argument('--workers', type=int, help="self-play processes (default: all cores)")
+    parser.add_argument('--board', type=int, help="board size in cells per side (default: fill the window)")
+    parser.add_argument('--output', '-o', default='model.pth', help="weights file name under models/")
+    args = parser.parse_args(argv)
+
+    from core.env import SnakeEnv
+    from .agent import RLAgent
+
+    settings = GameSettings(BOARD_WIDTH=args.board, BOARD_HEIGHT=args.board)
+    agent = RLAgent(SnakeEnv(settings))
+    scores = train_self_play(agent, args.updates, args.workers, settings)
+    agent.model.save(args.output)
+
+    mean = sum(scores) / len(scores) if scores else 0.0
+    print(f"{len(scores)} self-play games, mean score {mean:.2f}, "
+          f"epsilon {agent.epsilon:.3f}; weights saved to models/{args.output}")
+    return 0
@@ -0,0 +1,6 @@
+# benchmark.py
+import sys
+from evaluation.benchmark import main
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,8 +1,20 @@
 # core/__init__.py
-from .game import SnakeGame
+from .env import SnakeEnv
+from .state import SnakeState
+from .vec_env import VecSnakeEnv
+from .pixel_renderer import PixelRenderer
+from .grid import GridTopology, grid_topology
 from .constants import Direction, GameState, GameSettings
 from .theme import Theme, ThemeManager
 from .high_score_system import HighScoreSystem
 
-__all__ = ['SnakeGame', 'Direction', 'GameState', 'GameSettings', 
-           'Theme', 'ThemeManager', 'HighScoreSystem']
\ No newline at end of file
+__all__ = ['SnakeGame', 'SnakeEnv', 'SnakeState', 'VecSnakeEnv', 'PixelRenderer', 'GridTopology', 'grid_topology', 'Direction', 'GameState', 'GameSettings', 
+           'Theme', 'ThemeManager', 'HighScoreSystem']
+
+def __getattr__(name):
+    # SnakeGame pulls in pygame and every AI backend; import it only on
+    # demand so headless code (and spawned workers) can import core.* cheaply
+    if name == 'SnakeGame':
+        from .game import SnakeGame
+        return SnakeGame
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,107 @@
+from typing import List, Optional
+
+# occupancy byte -> ASCII digit, for int(..., 2)
+_DIGITS = bytes.maketrans(b'\x00\x01', b'01')
+
+
+class Bitboard:
+    """Sets of cells as Python ints: bit ``cell`` is set when the cell is in the set.
+
+    A whole board fits in one int (a 30x30 board is 900 bits), so a set
+    operation on every cell at once is a single big-int operation done in
+    C. Moving a set one cell in a direction is a shift by 1 or by the
+    width; the edge masks drop the bits that would wrap around from one
+    row end into the next row. A flood fill then grows a whole frontier
+    per iteration instead of visiting one cell at a time, so it takes as
+    many iterations as the region is deep, not as many as it has cells.
+    """
+
+    def __init__(self, width: int, height: int):
+        self.width = width
+        self.height = height
+        self.full = (1 << (width * height)) - 1
+        self.first_column = sum(1 << (y * width) for y in range(height))
+        self.last_column = self.first_column << (width - 1)
+        # Where a set may land after moving right / left without wrapping
+        self._not_first_column = self.full & ~self.first_column
+        self._not_last_column = self.full & ~self.last_column
+
+    def from_occupancy(self, occupied: bytearray) -> int:
+        """Mask of the cells set in a 0/1 occupancy bytearray"""
+        # Cell 0 is the lowest bit, i.e. the last digit
+        return int(occupied.translate(_DIGITS)[::-1], 2)
+
+    def expand(self, mask: int) -> int:
+        """mask plus every cell next to one of its cells"""
+        width = self.width
+        return (mask | ((mask << 1) & self._not_first_column) | ((mask >> 1) & self._not_last_column) |
+                ((mask << width) & self.full) | (mask >> width))
+
+    def flood_fill(self, seed: int, passable: int) -> int:
+        """Cells reachable from seed through passable cells (seed itself always included)"""
+        width, full = self.width, self.full
+        not_first, not_last = self._not_first_column, self._not_last_column
+        reached = seed
+        while True:
+            grown = reached | (passable & (((reached << 1) & not_first) | ((reached >> 1) & not_last) |
+                                           ((reached << width) & full) | (reached >> width)))
+            if grown == reached:
+                return reached
+            reached = grown
+
+    def regions(self, passable: int) -> List[int]:
+        """The connected regions of passable, as masks"""
+        regions = []
+        remaining = passable
+        while remaining:
+            region = self.flood_fill(remaining & -remaining, passable)
+            regions.append(region)
+            remaining &= ~region
+        return regions
+
+    @staticmethod
+    def count(mask: int) -> int:
+        return bin(mask).count('1')
+
+
+class BoardBits:
+    """A snake board as bitboard masks, built once per tick.
+
+    ``blocked`` is the body minus its tail (the tail moves away this tick,
+    as everywhere else), ``passable`` everything else. Whether a cell
+    reaches the tail is answered from one flood fill, done on first use.
+    """
+
+    CACHE_KEY = 'bitboard'
+
+    def __init__(self, bitboard: Bitboard, body):
+        self.bitboard = bitboard
+        self.tail = 1 << body.cell_id(body.tail) if len(body) else 0
+        self.blocked = bitboard.from_occupancy(body.occupied) & ~self.tail
+        self.passable = bitboard.full & ~self.blocked
+        self._tail_region: Optional[int] = None
+
+    @classmethod
+    def for_tick(cls, bitboard: Bitboard, game) -> 'BoardBits':
+        """This tick's masks of game's board, built at most once per tick"""
+        cache = getattr(game, 'tick_cache', None)
+        if cache is None:
+            return cls(bitboard, game.snake_pos)
+        bits = cache.get(cls.CACHE_KEY)
+        if bits is None:
+            bits = cache[cls.CACHE_KEY] = cls(bitboard, game.snake_pos)
+        return bits
+
+    def is_blocked(self, cell: int) -> bool:
+        return bool(self.blocked >> cell & 1)
+
+    def free_squares(self, cell: int) -> int:
+        """Number of cells reachable from cell, itself included"""
+        return Bitboard.count(self.bitboard.flood_fill(1 << cell, self.passable))
+
+    def reaches_tail(self, cell: int) -> bool:
+        """Whether the tail can be reached from a passable cell"""
+        if self._tail_region is None:
+            # One fill from the tail answers every cell this tick
+            self._tail_region = self.bitboard.flood_fill(self.tail, self.passable)
+        return bool(self._tail_region >> cell & 1)
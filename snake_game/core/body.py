@@ -0,0 +1,138 @@
+import random
+from collections import deque
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+class SnakeBody:
+    """Snake segments ordered head to tail with O(1) updates and lookups.
+
+    Segments live in a deque (constant-time head push and tail pop) and are
+    mirrored in a one-byte-per-cell occupancy bitmap indexed by cell id, so
+    membership and collision checks never scan or copy the body. The free
+    cells are kept in a swap-remove array with a cell -> slot map, so a
+    uniformly random empty cell can be drawn in O(1) at any snake length.
+    Positions are pixel coordinates, like everywhere else in the game.
+    """
+
+    def __init__(self, width: int, height: int, grid_size: int,
+                 segments: Iterable[Tuple[int, int]] = ()):
+        self.width = width
+        self.height = height
+        self.grid_size = grid_size
+        self.occupied = bytearray(width * height)
+        self._segments = deque()
+        self._init_free_cells()
+        for pos in segments:
+            self.push_tail(pos)
+
+    def _init_free_cells(self) -> None:
+        num_cells = self.width * self.height
+        self._free = list(range(num_cells))
+        self._free_slot = list(range(num_cells))  # -1 while occupied
+
+    def _mark_occupied(self, cell: int) -> None:
+        self.occupied[cell] = 1
+        slot = self._free_slot[cell]
+        last = self._free.pop()
+        if last != cell:
+            self._free[slot] = last
+            self._free_slot[last] = slot
+        self._free_slot[cell] = -1
+
+    def _mark_free(self, cell: int) -> None:
+        self.occupied[cell] = 0
+        self._free_slot[cell] = len(self._free)
+        self._free.append(cell)
+
+    def cell_id(self, position: Tuple[int, int]) -> int:
+        """Flat cell id of an in-bounds pixel position"""
+        return (position[1] // self.grid_size) * self.width + position[0] // self.grid_size
+
+    def in_bounds(self, position: Tuple[int, int]) -> bool:
+        x, y = position
+        return (0 <= x < self.width * self.grid_size and
+                0 <= y < self.height * self.grid_size)
+
+    @property
+    def head(self) -> Tuple[int, int]:
+        return self._segments[0]
+
+    @property
+    def tail(self) -> Tuple[int, int]:
+        return self._segments[-1]
+
+    def push_head(self, position: Tuple[int, int]) -> None:
+        self._segments.appendleft(position)
+        self._mark_occupied(self.cell_id(position))
+
+    def push_tail(self, position: Tuple[int, int]) -> None:
+        self._segments.append(position)
+        self._mark_occupied(self.cell_id(position))
+
+    def pop_tail(self) -> Tuple[int, int]:
+        position = self._segments.pop()
+        self._mark_free(self.cell_id(position))
+        return position
+
+    def pop_head(self) -> Tuple[int, int]:
+        position = self._segments.popleft()
+        self._mark_free(self.cell_id(position))
+        return position
+
+    def copy(self) -> 'SnakeBody':
+        """Independent copy; only flat C-level buffer copies, no per-segment work"""
+        other = SnakeBody.__new__(SnakeBody)
+        other.width = self.width
+        other.height = self.height
+        other.grid_size = self.grid_size
+        other.occupied = self.occupied[:]
+        other._segments = self._segments.copy()
+        other._free = self._free[:]
+        other._free_slot = self._free_slot[:]
+        return other
+
+    def clear(self) -> None:
+        self._segments.clear()
+        self.occupied = bytearray(self.width * self.height)
+        self._init_free_cells()
+
+    @property
+    def free_count(self) -> int:
+        return len(self._free)
+
+    @property
+    def free_cells(self) -> List[int]:
+        """Ids of all unoccupied cells in no particular order (read-only view)"""
+        return self._free
+
+    def random_free_position(self, rng=random) -> Optional[Tuple[int, int]]:
+        """Uniformly random unoccupied position, or None if the board is full"""
+        if not self._free:
+            return None
+        cell = self._free[rng.randrange(len(self._free))]
+        return ((cell % self.width) * self.grid_size, (cell // self.width) * self.grid_size)
+
+    def is_blocked(self, position: Tuple[int, int]) -> bool:
+        """Whether moving the head onto position this tick would be fatal.
+
+        True for out-of-bounds positions and for every segment except the
+        tail, which moves out of the way on the same tick. This is the
+        single collision check all engines and agents should use.
+        """
+        if not self.in_bounds(position):
+            return True
+        return bool(self.occupied[self.cell_id(position)]) and position != self._segments[-1]
+
+    def __contains__(self, position) -> bool:
+        return self.in_bounds(position) and bool(self.occupied[self.cell_id(position)])
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return iter(self._segments)
+
+    def __getitem__(self, index: int) -> Tuple[int, int]:
+        return self._segments[index]
+
+    def __repr__(self) -> str:
+        return f"SnakeBody({list(self._segments)!r})"
@@ -1,5 +1,6 @@
 from enum import Enum
 from dataclasses import dataclass
+from typing import Optional
 
 class Direction(Enum):
     RIGHT = 1
@@ -19,12 +20,45 @@ class GameState(Enum):
 class GameSettings:
     WINDOW_SIZE: int = 600
     GRID_SIZE: int = 20
+    # Board size in cells; None fills the window. Larger boards are shown
+    # through a scrolling viewport that follows the head
+    BOARD_WIDTH: Optional[int] = None
+    BOARD_HEIGHT: Optional[int] = None
     INITIAL_SPEED: int = 10
     MAX_SPEED: int = 20
     MIN_SPEED: int = 5
+    # AI turbo mode: simulation ticks per rendered frame and the time budget for them
+    TURBO_TICKS_PER_FRAME: int = 1000
+    TURBO_FRAME_BUDGET_MS: float = 12.0
+    TURBO_FPS: int = 60
+    RENDER_EVERY_OPTIONS: tuple = (1, 5, 10, 50, 100)
+    # Large-board mode: minimap size in pixels and how often it is rebuilt
+    MINIMAP_SIZE: int = 150
+    MINIMAP_INTERVAL: int = 10
+    # Frame profiler (F3 overlay, F4 cProfile): rolling window in frames and periodic dump
+    PROFILE_WINDOW: int = 600
+    PROFILE_DUMP_INTERVAL: float = 10.0
+    PROFILE_DUMP_PATH: str = 'profile_stats.json'
+
+    @property
+    def board_width(self) -> int:
+        return self.BOARD_WIDTH or self.WINDOW_SIZE // self.GRID_SIZE
+
+    @property
+    def board_height(self) -> int:
+        return self.BOARD_HEIGHT or self.WINDOW_SIZE // self.GRID_SIZE
 
 class AIType(Enum):
     REINFORCEMENT_LEARNING = "Reinforcement Learning"
     ASTAR = "A* Pathfinding"
     HAMILTONIAN = "Hamiltonian Cycle"
-    HYBRID = "Hybrid AI"
\ No newline at end of file
+    HYBRID = "Hybrid AI"
+    DYNAMIC_HAMILTONIAN = "Dynamic Hamiltonian Cycle"
+
+@dataclass
+class RewardSettings:
+    """Default step rewards for the headless engine (mirrors RLConfig)"""
+    REWARD_EAT: float = 10.0
+    REWARD_DEATH: float = -10.0
+    REWARD_CLOSER: float = 1.0
+    REWARD_FARTHER: float = -1.0
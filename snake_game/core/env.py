@@ -0,0 +1,157 @@
+import random
+from typing import Optional, Tuple
+
+from core.body import SnakeBody
+from core.constants import Direction, GameSettings, RewardSettings
+from core.replay import Replay
+
+class SnakeEnv:
+    """Headless snake simulation: board, snake, food and scoring only.
+
+    Has no pygame dependency so it can be stepped thousands of times per
+    second for training and evaluation. ``SnakeGame`` wraps one of these
+    and only adds rendering and input handling on top.
+
+    All randomness comes from a per-episode ``random.Random`` seeded from
+    the env's own seed, so a game is reproducible from its episode seed
+    and actions alone. With ``record=True`` each episode is captured as a
+    compact ``Replay``.
+
+    ``tick_cache`` lets agents share work done on the current board: a
+    helper's ``for_tick`` (region labels, distance field, bitboard masks)
+    computes its result once and stores it under its ``CACHE_KEY``, and
+    every later caller in the same tick reuses it. The env empties the
+    cache on every step and reset, so nothing cached outlives the board it
+    was computed from.
+    """
+
+    def __init__(self, settings: Optional[GameSettings] = None, config=None,
+                 seed: Optional[int] = None, record: bool = False):
+        self.settings = settings or GameSettings()
+        # Any object exposing the REWARD_* fields works (e.g. RLConfig)
+        self.config = config or RewardSettings()
+        self.grid_size = self.settings.GRID_SIZE
+        self.width = self.settings.board_width
+        self.height = self.settings.board_height
+
+        # Master RNG only hands out episode seeds; None seeds from OS entropy
+        self.seed_rng = random.Random(seed)
+        self.record = record
+        self.replay = None
+
+        self.episode = 0
+        self.reset()
+
+    def reset(self, seed: Optional[int] = None) -> None:
+        """Start a new episode with a single-segment snake in the centre"""
+        self.episode_seed = seed if seed is not None else self.seed_rng.getrandbits(64)
+        self.rng = random.Random(self.episode_seed)
+        if self.record:
+            self.replay = Replay(self.width, self.height, self.episode_seed)
+
+        center_x = (self.width // 2) * self.grid_size
+        center_y = (self.height // 2) * self.grid_size
+        self.snake_pos = SnakeBody(self.width, self.height, self.grid_size,
+                                   [(center_x, center_y)])
+        self.snake_direction = Direction.RIGHT
+        self.food_pos = self.generate_food()
+        # Per-tick scratch shared by agents (e.g. region labels); emptied on every step
+        self.tick_cache = {}
+        self.score = 0
+        self.steps = 0
+        self.game_over = False
+        self.won = False
+        self.prev_food_distance = float('inf')
+        self.episode += 1
+
+    def place_snake(self, segments, direction: Direction) -> None:
+        """Replace the snake with the given head-to-tail segments and respawn food.
+
+        Used to set up mid-game positions for benchmarks and evaluation.
+        """
+        self.snake_pos = SnakeBody(self.width, self.height, self.grid_size, segments)
+        self.snake_direction = direction
+        self.food_pos = self.generate_food()
+        self.tick_cache = {}
+        self.score = len(self.snake_pos) - 1
+        self.game_over = False
+        self.won = False
+        self.prev_food_distance = float('inf')
+
+    def generate_food(self) -> Optional[Tuple[int, int]]:
+        """Generate new food position, or None once the snake fills the board"""
+        return self.snake_pos.random_free_position(self.rng)
+
+    def next_head(self, direction: Direction) -> Tuple[int, int]:
+        """Position the head would move to in the given direction"""
+        head_x, head_y = self.snake_pos[0]
+        if direction == Direction.UP:
+            head_y -= self.grid_size
+        elif direction == Direction.DOWN:
+            head_y += self.grid_size
+        elif direction == Direction.LEFT:
+            head_x -= self.grid_size
+        elif direction == Direction.RIGHT:
+            head_x += self.grid_size
+        return (head_x, head_y)
+
+    def is_collision(self, position: Tuple[int, int]) -> bool:
+        """Check if moving the head onto position would end the game"""
+        return self.snake_pos.is_blocked(position)
+
+    def step(self, direction: Optional[Direction] = None) -> Tuple[float, bool, int]:
+        """Advance one tick and return (reward, done, score)"""
+        if self.game_over:
+            return 0, True, self.score
+        if direction is not None:
+            self.snake_direction = direction
+        if self.replay is not None:
+            self.replay.record(self.snake_direction)
+
+        new_head = self.next_head(self.snake_direction)
+        self.steps += 1
+        self.tick_cache.clear()
+
+        if self.is_collision(new_head):
+            self.game_over = True
+            return self.calculate_reward(False, True), True, self.score
+
+        # Vacate the tail before pushing the head so the bitmap stays exact
+        # when the head moves into the cell the tail just left
+        ate_food = new_head == self.food_pos
+        if not ate_food:
+            self.snake_pos.pop_tail()
+        self.snake_pos.push_head(new_head)
+
+        if ate_food:
+            self.score += 1
+            self.food_pos = self.generate_food()
+            if self.food_pos is None:
+                # Board full: the game is won and ends here
+                self.won = True
+                self.game_over = True
+                return self.calculate_reward(True, False), True, self.score
+
+        return self.calculate_reward(ate_food, False), False, self.score
+
+    def calculate_reward(self, ate_food: bool, died: bool) -> float:
+        """Calculate reward for the current step"""
+        if died:
+            return self.config.REWARD_DEATH
+        if ate_food:
+            return self.config.REWARD_EAT
+
+        head = self.snake_pos[0]
+        old_distance = self.prev_food_distance
+        new_distance = abs(head[0] - self.food_pos[0]) + abs(head[1] - self.food_pos[1])
+        self.prev_food_distance = new_distance
+
+        if new_distance < old_distance:
+            return self.config.REWARD_CLOSER
+        return self.config.REWARD_FARTHER
+
+    def save_replay(self, path: str) -> None:
+        """Write the current episode's replay (requires record=True)"""
+        if self.replay is None:
+            raise RuntimeError("SnakeEnv was created without record=True")
+        self.replay.save(path)
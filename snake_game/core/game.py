@@ -1,28 +1,34 @@
+import logging
 import pygame
-import random
 import sys
+import time
 from typing import Optional, Tuple, List
-from enum import Enum
-import numpy as np
-import matplotlib.pyplot as plt
-from concurrent.futures import ThreadPoolExecutor
-import threading
-from queue import Queue
 
 from core.constants import Direction, GameState, GameSettings, AIType
-from core.theme import ThemeManager, Theme
-from ai.base import SnakeAI
-from ai.reinforcement import RLAgent, RLConfig
-from ai.pathfinding.astar import AStarPathfinder
-from ai.pathfinding.hamilton import HamiltonianPathfinder
-from ai.pathfinding.hybrid import HybridPathfinder
-from utils.visualization import plot_training_stats
+from core.body import SnakeBody
+from core.env import SnakeEnv
+from core.renderer import BoardRenderer
+from core.text_cache import get_text_cache
+from core.theme import ThemeManager
+from ai.registry import create_agent
+from ai.reinforcement.config import RLConfig
+from utils.profiler import FrameProfiler
 from core.high_score_system import HighScoreSystem
 
+logger = logging.getLogger(__name__)
+
 class SnakeGame:
-    def __init__(self):
+    AI_MENU_KEYS = {
+        pygame.K_1: AIType.REINFORCEMENT_LEARNING,
+        pygame.K_2: AIType.ASTAR,
+        pygame.K_3: AIType.HAMILTONIAN,
+        pygame.K_4: AIType.HYBRID,
+        pygame.K_5: AIType.DYNAMIC_HAMILTONIAN,
+    }
+
+    def __init__(self, settings: Optional[GameSettings] = None):
         pygame.init()
-        self.settings = GameSettings()
+        self.settings = settings or GameSettings()
         
         # Setup display
         self.screen = pygame.display.set_mode((self.settings.WINDOW_SIZE, self.settings.WINDOW_SIZE))
@@ -47,10 +53,11 @@ class SnakeGame:
         self.selected_menu_item = 0
         self.current_speed = self.settings.INITIAL_SPEED
         
+        # Turbo (fast-forward) mode for AI: many ticks per rendered frame
+        self.turbo = False
+        self.render_every_n_episodes = 1
+        
         # Game variables
-        self.score = 0
-        self.game_over = False
-        self.prev_food_distance = float('inf')
         self.input_active = False
         self.name_input = ""
         
@@ -64,9 +71,45 @@ class SnakeGame:
         self.mean_scores = []
         self.config = RLConfig()
         
+        # Headless simulation core; this class only renders it and feeds input
+        self.env = SnakeEnv(self.settings, self.config)
+        self.renderer = BoardRenderer(self.settings.WINDOW_SIZE, self.settings.GRID_SIZE,
+                                      self.settings.MINIMAP_SIZE, self.settings.MINIMAP_INTERVAL)
+        self.hud_rect = None
+        self.text = get_text_cache()
+        
+        # Per-phase timings; instruments nothing until toggled on with F3
+        self.profiler = FrameProfiler(self.settings.PROFILE_WINDOW,
+                                      self.settings.PROFILE_DUMP_INTERVAL,
+                                      self.settings.PROFILE_DUMP_PATH)
+        
         # Initialize game state
         self.reset_game()
 
+    @property
+    def snake_pos(self) -> SnakeBody:
+        return self.env.snake_pos
+
+    @property
+    def snake_direction(self) -> Direction:
+        return self.env.snake_direction
+
+    @snake_direction.setter
+    def snake_direction(self, direction: Direction) -> None:
+        self.env.snake_direction = direction
+
+    @property
+    def food_pos(self) -> Optional[Tuple[int, int]]:
+        return self.env.food_pos
+
+    @property
+    def score(self) -> int:
+        return self.env.score
+
+    @property
+    def game_over(self) -> bool:
+        return self.env.game_over
+
     def save_high_score(self):
         """Save the current score to high scores database"""
         if self.input_active and self.score > 0:
@@ -101,41 +144,24 @@ class SnakeGame:
         # Update AI-related stats if AI is active
         if self.ai_agent:
             self.game_count += 1
-            if hasattr(self.ai_agent, 'train_long_memory') and self.game_count > 1:
-                self.ai_agent.train_long_memory()
+            # Agent-specific bookkeeping (training stats, cached plans); the
+            # first reset only starts the agent's first game
+            if self.game_count > 1:
+                self.ai_agent.end_episode(self.score)
                 
             # Update AI metrics
             self.total_score += self.score
             mean_score = self.total_score / self.game_count if self.game_count > 0 else 0
             self.scores.append(self.score)
             self.mean_scores.append(mean_score)
-            
-            # Update AI agent's specific stats if available
-            if hasattr(self.ai_agent, 'update_training_stats'):
-                self.ai_agent.update_training_stats(self.score)
         
         # Reset core game state
-        grid_count = self.settings.WINDOW_SIZE // self.settings.GRID_SIZE
-        center = (grid_count // 2) * self.settings.GRID_SIZE
-        self.snake_pos = [(center, center)]
-        self.snake_direction = Direction.RIGHT
-        self.food_pos = self.generate_food()
-        self.score = 0
-        self.game_over = False
-        self.prev_food_distance = float('inf')
+        self.env.reset()
         
         # Reset any temporary game state flags
         self.input_active = False
         self.name_input = ""
 
-    def generate_food(self) -> Tuple[int, int]:
-        """Generate new food position"""
-        while True:
-            x = random.randrange(0, self.settings.WINDOW_SIZE, self.settings.GRID_SIZE)
-            y = random.randrange(0, self.settings.WINDOW_SIZE, self.settings.GRID_SIZE)
-            if (x, y) not in self.snake_pos:
-                return (x, y)
-
     def handle_title_input(self):
         """Handle input on the title screen"""
         for event in pygame.event.get():
@@ -173,6 +199,14 @@ class SnakeGame:
                         self.state = GameState.PAUSED
                 elif event.key == pygame.K_r and self.game_over:
                     self.reset_game()
+                elif event.key == pygame.K_t and self.ai_agent:
+                    self.turbo = not self.turbo
+                elif event.key == pygame.K_F3:
+                    self.profiler.toggle(self)
+                elif event.key == pygame.K_F4:
+                    path = self.profiler.toggle_cprofile()
+                    if path:
+                        logger.info(f"cProfile stats saved to {path}")
                 elif self.input_active:
                     if event.key == pygame.K_RETURN:
                         self.save_high_score()
@@ -200,24 +234,14 @@ class SnakeGame:
                 pygame.quit()
                 sys.exit()
             if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_1:  # Reinforcement Learning
-                    self.ai_type = AIType.REINFORCEMENT_LEARNING
-                    self.ai_agent = RLAgent(self)
-                    self.state = GameState.PLAYING
-                    self.reset_game()
-                elif event.key == pygame.K_2:  # A* Pathfinding
-                    self.ai_type = AIType.ASTAR
-                    self.ai_agent = AStarPathfinder(self)
-                    self.state = GameState.PLAYING
-                    self.reset_game()
-                elif event.key == pygame.K_3:  # Hamiltonian Cycle
-                    self.ai_type = AIType.HAMILTONIAN
-                    self.ai_agent = HamiltonianPathfinder(self)
-                    self.state = GameState.PLAYING
-                    self.reset_game()
-                elif event.key == pygame.K_4:  # Hybrid
-                    self.ai_type = AIType.HYBRID
-                    self.ai_agent = HybridPathfinder(self)
+                ai_type = self.AI_MENU_KEYS.get(event.key)
+                if ai_type is not None:
+                    # Backends (torch, pathfinders) are imported on first selection
+                    self.ai_type = ai_type
+                    self.ai_agent = create_agent(ai_type, self.env)
+                    if ai_type == AIType.REINFORCEMENT_LEARNING:
+                        # Pick up training where the last session saved it
+                        self.ai_agent.load_training_state()
                     self.state = GameState.PLAYING
                     self.reset_game()
                 elif event.key == pygame.K_ESCAPE:
@@ -259,10 +283,20 @@ class SnakeGame:
                     current_index = themes.index(self.current_theme.name.lower())
                     next_index = (current_index + 1) % len(themes)
                     self.current_theme = self.themes[themes[next_index]]
+                    self.renderer.invalidate()
                 elif event.key == pygame.K_2:  # Change speed
                     self.current_speed = (self.current_speed + 5) % (self.settings.MAX_SPEED + 5)
                     if self.current_speed < self.settings.MIN_SPEED:
                         self.current_speed = self.settings.MIN_SPEED
+                elif event.key == pygame.K_3:  # Toggle turbo
+                    self.turbo = not self.turbo
+                elif event.key == pygame.K_4:  # Change render interval
+                    options = self.settings.RENDER_EVERY_OPTIONS
+                    if self.render_every_n_episodes in options:
+                        next_index = (options.index(self.render_every_n_episodes) + 1) % len(options)
+                    else:
+                        next_index = 0
+                    self.render_every_n_episodes = options[next_index]
 
     def handle_game_over_input(self):
         """Handle input on the game over screen"""
@@ -317,169 +351,48 @@ class SnakeGame:
             if next_direction:
                 self.snake_direction = next_direction
 
-        # Calculate new head position
-        head_x, head_y = self.snake_pos[0]
-        if self.snake_direction == Direction.UP:
-            head_y -= self.settings.GRID_SIZE
-        elif self.snake_direction == Direction.DOWN:
-            head_y += self.settings.GRID_SIZE
-        elif self.snake_direction == Direction.LEFT:
-            head_x -= self.settings.GRID_SIZE
-        elif self.snake_direction == Direction.RIGHT:
-            head_x += self.settings.GRID_SIZE
-        
-        new_head = (head_x, head_y)
-        
-        # Check collisions
-        if (
-            head_x < 0 or head_x >= self.settings.WINDOW_SIZE or
-            head_y < 0 or head_y >= self.settings.WINDOW_SIZE or
-            new_head in self.snake_pos[:-1]
-        ):
-            self.game_over = True
-            return
-            
-        self.snake_pos.insert(0, new_head)
-        
-        # Check food collision
-        if new_head == self.food_pos:
-            self.score += 1
-            self.food_pos = self.generate_food()
-            # Increase speed with score if not in AI mode
-            if not self.ai_agent:
-                self.current_speed = min(
-                    self.settings.MAX_SPEED,
-                    self.settings.INITIAL_SPEED + self.score // 5
-                )
-        else:
-            self.snake_pos.pop()
-
-    def calculate_reward(self, ate_food: bool, died: bool) -> float:
-        """Calculate reward for the current step"""
-        if died:
-            return self.config.REWARD_DEATH
-        if ate_food:
-            return self.config.REWARD_EAT
-            
-        head = self.snake_pos[0]
-        old_distance = self.prev_food_distance
-        new_distance = abs(head[0] - self.food_pos[0]) + abs(head[1] - self.food_pos[1])
-        self.prev_food_distance = new_distance
+        previous_score = self.score
+        self.env.step()
         
-        if new_distance < old_distance:
-            return self.config.REWARD_CLOSER
-        return self.config.REWARD_FARTHER
+        # Increase speed with score if not in AI mode
+        if self.score != previous_score and not self.ai_agent:
+            self.current_speed = min(
+                self.settings.MAX_SPEED,
+                self.settings.INITIAL_SPEED + self.score // 5
+            )
 
     def _move(self, action: List[int]) -> Tuple[float, bool, int]:
         """Execute move and return (reward, done, score)"""
         if self.ai_agent:
             self.snake_direction = self.ai_agent._action_to_direction(action)
-        
-        head_x, head_y = self.snake_pos[0]
-        
-        # Calculate new head position
-        if self.snake_direction == Direction.UP:
-            head_y -= self.settings.GRID_SIZE
-        elif self.snake_direction == Direction.DOWN:
-            head_y += self.settings.GRID_SIZE
-        elif self.snake_direction == Direction.LEFT:
-            head_x -= self.settings.GRID_SIZE
-        elif self.snake_direction == Direction.RIGHT:
-            head_x += self.settings.GRID_SIZE
-        
-        new_head = (head_x, head_y)
-        
-        # Check for collision/game over
-        done = (
-            head_x < 0 or 
-            head_x >= self.settings.WINDOW_SIZE or
-            head_y < 0 or 
-            head_y >= self.settings.WINDOW_SIZE or
-            new_head in self.snake_pos[:-1]
-        )
-        
-        if done:
-            self.game_over = True
-            return self.config.REWARD_DEATH, True, self.score
-        
-        # Update snake position
-        self.snake_pos.insert(0, new_head)
-        
-        # Check food collision
-        ate_food = new_head == self.food_pos
-        if ate_food:
-            self.score += 1
-            self.food_pos = self.generate_food()
-        else:
-            self.snake_pos.pop()
-        
-        # Calculate reward
-        reward = self.calculate_reward(ate_food, done)
-        
-        return reward, done, self.score
+        return self.env.step()
 
-    def ai_step(self) -> Tuple[float, bool, int]:
-        """Execute one step with AI agent"""
-        if not self.ai_agent:
-            return 0, False, 0
-            
+    @staticmethod
+    def _agent_step(env: SnakeEnv, agent) -> Tuple[float, bool, int]:
+        """Execute and learn from one step of an agent on a headless env"""
         # Get old state
-        state_old = self.ai_agent.get_state()
+        state_old = agent.get_state()
         
         # Get move
-        final_move = self.ai_agent.get_next_move()
+        final_move = agent._get_action(state_old)
         
         # Perform move and get new state
-        reward, done, score = self._move(final_move)
-        state_new = self.ai_agent.get_state()
+        reward, done, score = env.step(agent._action_to_direction(final_move))
+        state_new = agent.get_state()
         
         # Train short memory
-        self.ai_agent.train_short_memory(state_old, final_move, reward, state_new, done)
+        agent.train_short_memory(state_old, final_move, reward, state_new, done)
         
         # Remember
-        self.ai_agent.remember(state_old, final_move, reward, state_new, done)
+        agent.remember(state_old, final_move, reward, state_new, done)
         
         return reward, done, score
 
-    def create_parallel_games(self):
-        """Create multiple game instances for parallel training"""
-        self.parallel_games = []
-        for _ in range(self.num_parallel_games):
-            game = SnakeGame()
-            game.ai_agent = self.ai_agent.__class__(game)  # Create new AI agent instance
-            game.ai_agent.model = self.ai_agent.model  # Share the same model
-            self.parallel_games.append(game)
-
-    def process_parallel_game(self, game_index: int) -> Tuple[int, float, bool, int]:
-        """Process one step of a parallel game"""
-        game = self.parallel_games[game_index]
-        if not game.game_over:
-            reward, done, score = game.ai_step()
-            return game_index, reward, done, score
-        return game_index, 0, True, game.score
-
-    def update_parallel_games(self):
-        """Update all parallel games"""
-        results = []
-        with ThreadPoolExecutor(max_workers=self.num_parallel_games) as executor:
-            futures = [executor.submit(self.process_parallel_game, i) 
-                      for i in range(self.num_parallel_games)]
-            for future in futures:
-                results.append(future.result())
-        
-        # Process results
-        for game_index, reward, done, score in results:
-            if done:
-                # Update stats and reset the game
-                self.parallel_games[game_index].ai_agent.update_training_stats(score)
-                self.parallel_games[game_index].reset_game()
-                
-                # Put result in queue for visualization
-                self.game_results_queue.put({
-                    'game_index': game_index,
-                    'score': score,
-                    'total_games': self.ai_agent.n_games
-                })
+    def ai_step(self) -> Tuple[float, bool, int]:
+        """Execute one step with AI agent"""
+        if not self.ai_agent:
+            return 0, False, 0
+        return self._agent_step(self.env, self.ai_agent)
 
     def save_high_score(self):
         """Save the current score to high scores if it qualifies"""
@@ -506,98 +419,136 @@ class SnakeGame:
             if self.ai_agent and hasattr(self.ai_agent, 'model'):
                 self.ai_agent.model.save(f'model_record_{new_score}.pth')
 
+    def tick(self) -> None:
+        """Advance the simulation by one step (AI or manual)"""
+        if self.ai_agent and self.ai_type == AIType.REINFORCEMENT_LEARNING:
+            try:
+                # Get old state
+                state_old = self.ai_agent.get_state()
+                
+                # Get move
+                action = self.ai_agent._get_action(state_old)
+                
+                # Perform move and get new state
+                reward, done, score = self._move(action)
+                state_new = self.ai_agent.get_state()
+                
+                # Train short memory
+                self.ai_agent.train_short_memory(state_old, action, reward, state_new, done)
+                
+                # Remember
+                self.ai_agent.remember(state_old, action, reward, state_new, done)
+                
+                if done:
+                    # Training stats are updated by the agent's end_episode
+                    self.reset_game()
+                    
+                    # Update visualization every N games
+                    if self.ai_agent.n_games % 5 == 0:
+                        try:
+                            from utils.visualization import plot_training_stats
+                            with self.profiler.phase('plot'):
+                                plot_training_stats(
+                                    self.ai_agent.scores,
+                                    self.ai_agent.mean_scores,
+                                    self.ai_agent.training_stats
+                                )
+                        except Exception as viz_error:
+                            print(f"Visualization error: {viz_error}")
+            except Exception as e:
+                print(f"Error in AI loop: {str(e)}")
+                raise e
+        else:
+            self.update()
+            # In turbo every AI agent starts its next game straight away, like
+            # RL; otherwise the game-over screen waits for R
+            if self.ai_agent and self.turbo and self.game_over:
+                self.reset_game()
+
+    def run_turbo_ticks(self) -> None:
+        """Run as many ticks as fit in one frame's time budget"""
+        deadline = time.perf_counter() + self.settings.TURBO_FRAME_BUDGET_MS / 1000
+        episode = self.env.episode
+        for _ in range(self.settings.TURBO_TICKS_PER_FRAME):
+            self.tick()
+            if self.state != GameState.PLAYING:
+                break
+            # Games restart inside tick(); one that will be drawn starts on a new frame
+            if self.env.episode != episode and self.should_render():
+                break
+            if time.perf_counter() >= deadline:
+                break
+
+    def should_render(self) -> bool:
+        """Skip drawing whole episodes when rendering every N episodes in turbo"""
+        if self.state != GameState.PLAYING or not (self.ai_agent and self.turbo):
+            return True
+        return self.env.episode % self.render_every_n_episodes == 0
+
     def run(self):
         """Main game loop"""
-        # Initialize plotting
-        plt.ion()  # Turn on interactive mode
-        
         while True:
             self.handle_input()
             
             if self.state == GameState.PLAYING:
-                if self.ai_agent and isinstance(self.ai_agent, RLAgent):
-                    try:
-                        # Get old state
-                        state_old = self.ai_agent.get_state()
-                        
-                        # Get move
-                        action = self.ai_agent._get_action(state_old)
-                        
-                        # Perform move and get new state
-                        reward, done, score = self._move(action)
-                        state_new = self.ai_agent.get_state()
-                        
-                        # Train short memory
-                        self.ai_agent.train_short_memory(state_old, action, reward, state_new, done)
-                        
-                        # Remember
-                        self.ai_agent.remember(state_old, action, reward, state_new, done)
-                        
-                        if done:
-                            # Update training stats
-                            self.ai_agent.update_training_stats(score)
-                            
-                            # Update visualization every N games
-                            if self.ai_agent.n_games % 5 == 0:
-                                try:
-                                    plot_training_stats(
-                                        self.ai_agent.scores,
-                                        self.ai_agent.mean_scores,
-                                        self.ai_agent.training_stats
-                                    )
-                                except Exception as viz_error:
-                                    print(f"Visualization error: {viz_error}")
-                            
-                            self.reset_game()
-                    except Exception as e:
-                        print(f"Error in AI loop: {str(e)}")
-                        raise e
+                if self.ai_agent and self.turbo:
+                    self.run_turbo_ticks()
                 else:
-                    self.update()
+                    self.tick()
             
             # Draw the current game state
-            self.draw()
+            if self.should_render():
+                self.draw()
+                # Control game speed
+                if self.ai_agent and self.turbo:
+                    self.clock.tick(self.settings.TURBO_FPS)
+                else:
+                    self.clock.tick(60 if self.ai_agent else self.current_speed)
+            else:
+                self.clock.tick()
             
-            # Control game speed
-            self.clock.tick(60 if self.ai_agent else self.current_speed)
+            if self.profiler.enabled:
+                self.profiler.end_frame(self)
+
+    def _static_layer(self, name: str, builder, alpha: bool = False) -> pygame.Surface:
+        """Screen-sized layer rendered once per theme"""
+        size = (self.settings.WINDOW_SIZE, self.settings.WINDOW_SIZE)
+        return self.text.layer((name, self.current_theme.name), size, builder, alpha)
 
     def draw_title_screen(self):
         """Draw the title/menu screen"""
-        self.screen.fill(self.current_theme.bg_color)
-        font = pygame.font.Font(None, 74)
-        title = font.render('Snake Game', True, self.current_theme.snake_color)
-        title_rect = title.get_rect(center=(self.settings.WINDOW_SIZE//2, 100))
-        self.screen.blit(title, title_rect)
+        theme = self.current_theme
+        center_x = self.settings.WINDOW_SIZE//2
+
+        def build(surface):
+            surface.fill(theme.bg_color)
+            self.text.blit(surface, 'Snake Game', 74, theme.snake_color, center=(center_x, 100))
+
+        self.screen.blit(self._static_layer('title', build), (0, 0))
 
         menu_items = ['Start Game', 'AI Mode', 'Settings', 'Quit']
-        menu_font = pygame.font.Font(None, 36)
         for i, item in enumerate(menu_items):
-            color = self.current_theme.food_color if i == self.selected_menu_item else self.current_theme.snake_color
-            text = menu_font.render(item, True, color)
-            rect = text.get_rect(center=(self.settings.WINDOW_SIZE//2, 250 + i * 50))
-            self.screen.blit(text, rect)
-
-    def draw_game_screen(self):
-        """Updated draw method to show correct high score info"""
-        self.screen.fill(self.current_theme.bg_color)
-        
-        # Draw snake and food as before...
-        for segment in self.snake_pos:
-            pygame.draw.rect(self.screen, self.current_theme.snake_color,
-                        (segment[0], segment[1], self.settings.GRID_SIZE, self.settings.GRID_SIZE))
+            color = theme.food_color if i == self.selected_menu_item else theme.snake_color
+            self.text.blit(self.screen, item, 36, color, center=(center_x, 250 + i * 50))
+
+    def draw_game_screen(self) -> List[pygame.Rect]:
+        """Draw the board incrementally plus the HUD; returns the screen rects that changed"""
+        # Only cells changed since the last frame are repainted and copied
+        board_rects = self.renderer.sync(self.env, self.current_theme)
+        dirty = self.renderer.present(self.screen, board_rects)
         
-        pygame.draw.rect(self.screen, self.current_theme.food_color,
-                    (self.food_pos[0], self.food_pos[1], self.settings.GRID_SIZE, self.settings.GRID_SIZE))
+        # Erase last frame's HUD before drawing this one
+        if self.hud_rect is not None:
+            self.renderer.restore(self.screen, self.hud_rect)
+            dirty.append(self.hud_rect)
         
         # Draw scores and info
-        font = pygame.font.Font(None, 24)
-        
         # Get all-time high score
         all_time_high = self.high_scores.get_top_scores(limit=1)
         high_score = all_time_high[0][1] if all_time_high else 0
         
         if self.ai_agent:
-            if isinstance(self.ai_agent, RLAgent):
+            if self.ai_type == AIType.REINFORCEMENT_LEARNING:
                 stats = [
                     f'Score: {self.score}',
                     f'All-Time High: {high_score}',
@@ -607,14 +558,16 @@ class SnakeGame:
                     f'Memory: {len(self.ai_agent.memory)}/{self.ai_agent.config.MAX_MEMORY}',
                     f'Batch: {self.ai_agent.config.BATCH_SIZE}',
                     f'Current Reward: {self.ai_agent.current_reward:.1f}',
-                    f'ε: {self.ai_agent.epsilon:.3f}'
+                    f'ε: {self.ai_agent.epsilon:.3f}',
+                    f'Turbo (T): {"On" if self.turbo else "Off"}'
                 ]
             else:
                 stats = [
                     f'Score: {self.score}',
                     f'All-Time High: {high_score}',
                     f'AI: {self.ai_type.value}',
-                    f'Strategy: {self.ai_type.value}'
+                    f'Strategy: {self.ai_type.value}',
+                    f'Turbo (T): {"On" if self.turbo else "Off"}'
                 ]
         else:
             stats = [
@@ -622,86 +575,82 @@ class SnakeGame:
                 f'All-Time High: {high_score}'
             ]
         
+        hud_rects = []
         for i, stat in enumerate(stats):
-            text = font.render(stat, True, self.current_theme.snake_color)
-            self.screen.blit(text, (10, 10 + i * 20))
+            hud_rects.append(self.text.blit(self.screen, stat, 24, self.current_theme.snake_color,
+                                            topleft=(10, 10 + i * 20)))
+        self.hud_rect = hud_rects[0].unionall(hud_rects[1:])
+        dirty.append(self.hud_rect)
+        
+        # Profiler overlay (F3); erase last frame's copy first
+        if self.profiler.overlay_rect is not None:
+            self.renderer.restore(self.screen, self.profiler.overlay_rect)
+            dirty.append(self.profiler.overlay_rect)
+            self.profiler.overlay_rect = None
+        if self.profiler.enabled:
+            dirty.append(self.profiler.draw_overlay(self.screen, self.text, self.current_theme.snake_color))
+        
+        # Large boards: overview of the whole board with the visible area outlined
+        minimap_rect = self.renderer.draw_minimap(self.screen, self.env, self.current_theme)
+        if minimap_rect is not None:
+            dirty.append(minimap_rect)
+        return dirty
+
+    def _build_overlay(self, title: str):
+        """Builder for a semi-transparent overlay with a title"""
+        def build(surface):
+            surface.fill((0, 0, 0, 128))
+            self.text.blit(surface, title, 74, self.current_theme.snake_color,
+                           center=(self.settings.WINDOW_SIZE//2, 100))
+        return build
 
     def draw_pause_screen(self):
         """Draw the pause screen overlay"""
-        # Add semi-transparent overlay
-        overlay = pygame.Surface((self.settings.WINDOW_SIZE, self.settings.WINDOW_SIZE))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-
-        font = pygame.font.Font(None, 74)
-        title = font.render('Paused', True, self.current_theme.snake_color)
-        title_rect = title.get_rect(center=(self.settings.WINDOW_SIZE//2, 100))
-        self.screen.blit(title, title_rect)
+        # Semi-transparent overlay and title are pre-rendered per theme
+        self.screen.blit(self._static_layer('pause', self._build_overlay('Paused'), alpha=True), (0, 0))
 
         menu_items = ['Resume', 'Restart', 'Main Menu']
-        menu_font = pygame.font.Font(None, 36)
         for i, item in enumerate(menu_items):
             color = self.current_theme.food_color if i == self.selected_pause_item else self.current_theme.snake_color
-            text = menu_font.render(item, True, color)
-            rect = text.get_rect(center=(self.settings.WINDOW_SIZE//2, 250 + i * 50))
-            self.screen.blit(text, rect)
+            self.text.blit(self.screen, item, 36, color, center=(self.settings.WINDOW_SIZE//2, 250 + i * 50))
 
     def draw_game_over_screen(self):
         """Draw the game over screen overlay"""
-        overlay = pygame.Surface((self.settings.WINDOW_SIZE, self.settings.WINDOW_SIZE))
-        overlay.set_alpha(128)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
-
-        font = pygame.font.Font(None, 74)
-        title = font.render('Game Over', True, self.current_theme.snake_color)
-        title_rect = title.get_rect(center=(self.settings.WINDOW_SIZE//2, 100))
-        self.screen.blit(title, title_rect)
+        theme = self.current_theme
+        quarter_x = self.settings.WINDOW_SIZE//4
+        self.screen.blit(self._static_layer('game_over', self._build_overlay('Game Over'), alpha=True), (0, 0))
 
-        score_font = pygame.font.Font(None, 48)
-        score_text = score_font.render(f'Score: {self.score}', True, self.current_theme.snake_color)
-        score_rect = score_text.get_rect(center=(self.settings.WINDOW_SIZE//2, 180))
-        self.screen.blit(score_text, score_rect)
+        self.text.blit(self.screen, f'Score: {self.score}', 48, theme.snake_color,
+                       center=(self.settings.WINDOW_SIZE//2, 180))
 
         # Draw high scores if available
         if hasattr(self, 'high_scores'):
             high_scores = self.high_scores.get_top_scores(limit=5)
             if high_scores:
-                title_font = pygame.font.Font(None, 36)
-                title_text = title_font.render('High Scores:', True, self.current_theme.snake_color)
-                self.screen.blit(title_text, (self.settings.WINDOW_SIZE//4, 220))
+                self.text.blit(self.screen, 'High Scores:', 36, theme.snake_color, topleft=(quarter_x, 220))
                 
-                score_font = pygame.font.Font(None, 24)
                 for i, (name, score, diff, ai, date) in enumerate(high_scores):
-                    score_text = score_font.render(
-                        f'{name}: {score} ({diff}{"[AI]" if ai else ""})',
-                        True, self.current_theme.snake_color
-                    )
-                    self.screen.blit(score_text, (self.settings.WINDOW_SIZE//4, 250 + i * 25))
+                    self.text.blit(self.screen, f'{name}: {score} ({diff}{"[AI]" if ai else ""})',
+                                   24, theme.snake_color, topleft=(quarter_x, 250 + i * 25))
 
         if self.input_active:
-            input_font = pygame.font.Font(None, 36)
-            prompt = input_font.render('Enter your name:', True, self.current_theme.snake_color)
-            self.screen.blit(prompt, (self.settings.WINDOW_SIZE//4, 400))
-            
-            name = input_font.render(self.name_input + '_', True, self.current_theme.food_color)
-            self.screen.blit(name, (self.settings.WINDOW_SIZE//4, 430))
+            self.text.blit(self.screen, 'Enter your name:', 36, theme.snake_color, topleft=(quarter_x, 400))
+            self.text.blit(self.screen, self.name_input + '_', 36, theme.food_color, topleft=(quarter_x, 430))
         else:
             menu_items = ['Restart', 'Main Menu']
-            menu_font = pygame.font.Font(None, 36)
             for i, item in enumerate(menu_items):
-                color = self.current_theme.food_color if i == self.selected_game_over_item else self.current_theme.snake_color
-                text = menu_font.render(item, True, color)
-                rect = text.get_rect(center=(self.settings.WINDOW_SIZE//2, 400 + i * 50))
-                self.screen.blit(text, rect)
+                color = theme.food_color if i == self.selected_game_over_item else theme.snake_color
+                self.text.blit(self.screen, item, 36, color, center=(self.settings.WINDOW_SIZE//2, 400 + i * 50))
 
     def draw(self):
         """Main draw method that handles all game states"""
+        if self.state == GameState.PLAYING:
+            # Push only the changed areas of the board and HUD
+            pygame.display.update(self.draw_game_screen())
+            return
+        
         if self.state == GameState.TITLE:
             self.draw_title_screen()
-        elif self.state == GameState.PLAYING:
-            self.draw_game_screen()
         elif self.state == GameState.PAUSED:
             self.draw_game_screen()  # Draw game state first
             self.draw_pause_screen()  # Then overlay pause menu
@@ -712,79 +661,76 @@ class SnakeGame:
             self.draw_ai_menu()
         elif self.state == GameState.SETTINGS:
             self.draw_settings()
-            
+        
+        # Overlays and menus repaint the screen, so the next board frame
+        # must be copied in full
+        self.renderer.present_all = True
         pygame.display.flip()  # Update the display
 
     def draw_ai_menu(self):
-        """Draw the AI selection menu"""
-        self.screen.fill(self.current_theme.bg_color)
-        font = pygame.font.Font(None, 48)
-        title = font.render('Select AI Type', True, self.current_theme.snake_color)
-        title_rect = title.get_rect(center=(self.settings.WINDOW_SIZE//2, 100))
-        self.screen.blit(title, title_rect)
-
-        # Updated menu items with more descriptive text
-        menu_items = [
-            ('1: Reinforcement Learning', 'Self-learning AI using Deep Q-Network'),
-            ('2: A* Pathfinding', 'Finds optimal path to food'),
-            ('3: Hamiltonian Cycle', 'Never fails but slower'),
-            ('4: Hybrid AI', 'Combines A* and Hamiltonian strategies'),
-            ('ESC: Back to Menu', '')
-        ]
-
-        menu_font = pygame.font.Font(None, 36)
-        desc_font = pygame.font.Font(None, 24)
-        y_pos = 200
+        """Draw the AI selection menu (fully static, rendered once per theme)"""
+        theme = self.current_theme
+        center_x = self.settings.WINDOW_SIZE//2
+
+        def build(surface):
+            surface.fill(theme.bg_color)
+            self.text.blit(surface, 'Select AI Type', 48, theme.snake_color, center=(center_x, 100))
+
+            # Updated menu items with more descriptive text
+            menu_items = [
+                ('1: Reinforcement Learning', 'Self-learning AI using Deep Q-Network'),
+                ('2: A* Pathfinding', 'Finds optimal path to food'),
+                ('3: Hamiltonian Cycle', 'Never fails but slower'),
+                ('4: Hybrid AI', 'Combines A* and Hamiltonian strategies'),
+                ('5: Dynamic Hamiltonian', 'Never fails, reshapes its cycle towards food'),
+                ('ESC: Back to Menu', '')
+            ]
+            y_pos = 200
+            for item, desc in menu_items:
+                # Draw main menu item
+                self.text.blit(surface, item, 36, theme.snake_color, center=(center_x, y_pos))
+                
+                # Draw description if it exists
+                if desc:
+                    self.text.blit(surface, desc, 24, theme.snake_color, center=(center_x, y_pos + 25))
+                
+                y_pos += 65  # Increased spacing to accommodate descriptions
 
-        for item, desc in menu_items:
-            # Draw main menu item
-            text = menu_font.render(item, True, self.current_theme.snake_color)
-            rect = text.get_rect(center=(self.settings.WINDOW_SIZE//2, y_pos))
-            self.screen.blit(text, rect)
-            
-            # Draw description if it exists
-            if desc:
-                desc_text = desc_font.render(desc, True, self.current_theme.snake_color)
-                desc_rect = desc_text.get_rect(center=(self.settings.WINDOW_SIZE//2, y_pos + 25))
-                self.screen.blit(desc_text, desc_rect)
-            
-            y_pos += 70  # Increased spacing to accommodate descriptions
+        self.screen.blit(self._static_layer('ai_menu', build), (0, 0))
 
     def draw_settings(self):
         """Draw the settings menu"""
-        self.screen.fill(self.current_theme.bg_color)
-        font = pygame.font.Font(None, 48)
-        title = font.render('Settings', True, self.current_theme.snake_color)
-        title_rect = title.get_rect(center=(self.settings.WINDOW_SIZE//2, 100))
-        self.screen.blit(title, title_rect)
+        theme = self.current_theme
+        quarter_x = self.settings.WINDOW_SIZE//4
 
         # Settings items with current values
         menu_items = [
-            ('1: Theme', f'Current: {self.current_theme.name}'),
+            ('1: Theme', f'Current: {theme.name}'),
             ('2: Speed', f'Current: {self.current_speed}'),
+            ('3: AI Turbo (T in game)', f'Current: {"On" if self.turbo else "Off"}'),
+            ('4: Turbo Render Every', f'Current: {self.render_every_n_episodes} episode(s)'),
             ('ESC: Back to Menu', '')
         ]
 
-        menu_font = pygame.font.Font(None, 36)
-        value_font = pygame.font.Font(None, 24)
-        y_pos = 200
+        def build(surface):
+            surface.fill(theme.bg_color)
+            self.text.blit(surface, 'Settings', 48, theme.snake_color,
+                           center=(self.settings.WINDOW_SIZE//2, 100))
+            y_pos = 200
+            for item, _ in menu_items:
+                # Draw setting name
+                self.text.blit(surface, item, 36, theme.snake_color, midleft=(quarter_x, y_pos))
+                y_pos += 70
 
-        for item, value in menu_items:
-            # Draw setting name
-            text = menu_font.render(item, True, self.current_theme.snake_color)
-            rect = text.get_rect(midleft=(self.settings.WINDOW_SIZE//4, y_pos))
-            self.screen.blit(text, rect)
-            
-            # Draw current value if it exists
+            # Draw any additional settings info
+            self.text.blit(surface, 'Use number keys to change settings', 24, theme.snake_color,
+                           center=(self.settings.WINDOW_SIZE//2, self.settings.WINDOW_SIZE - 50))
+
+        self.screen.blit(self._static_layer('settings', build), (0, 0))
+
+        # Only the current values change between frames
+        y_pos = 200
+        for _, value in menu_items:
             if value:
-                value_text = value_font.render(value, True, self.current_theme.snake_color)
-                value_rect = value_text.get_rect(midleft=(self.settings.WINDOW_SIZE//4, y_pos + 25))
-                self.screen.blit(value_text, value_rect)
-            
+                self.text.blit(self.screen, value, 24, theme.snake_color, midleft=(quarter_x, y_pos + 25))
             y_pos += 70
-
-        # Draw any additional settings info
-        info_font = pygame.font.Font(None, 24)
-        info_text = info_font.render('Use number keys to change settings', True, self.current_theme.snake_color)
-        info_rect = info_text.get_rect(center=(self.settings.WINDOW_SIZE//2, self.settings.WINDOW_SIZE - 50))
-        self.screen.blit(info_text, info_rect)
\ No newline at end of file
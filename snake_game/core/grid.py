@@ -0,0 +1,110 @@
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from core.constants import Direction
+
+# Neighbor slots, clockwise from right (the order the RL agent turns in)
+DIRECTIONS = (Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.UP)
+DIRECTION_SLOT: Dict[Direction, int] = {direction: slot for slot, direction in enumerate(DIRECTIONS)}
+_DELTAS = ((1, 0), (0, 1), (-1, 0), (0, -1))
+# Keyed by (dx, dy) rather than the id difference, which is ambiguous on
+# one-cell-wide boards (a step down is +1 there, same as a step right)
+_DELTA_DIRECTION: Dict[Tuple[int, int], Direction] = dict(zip(_DELTAS, DIRECTIONS))
+
+# Search order of the pathfinders (down, right, up, left), kept so that
+# ties between equally short paths break the way they always have
+_SEARCH_SLOTS = (1, 0, 3, 2)
+
+
+class GridTopology:
+    """Cell numbering and neighbor tables for one board size.
+
+    Cells are flat ids ``y * width + x``. Everything an agent needs to move
+    between cells, pixels and directions is computed once here and looked
+    up afterwards, so searches never build coordinate tuples or repeat
+    bounds checks:
+
+    - ``neighbors``: (cells, 4) int32 array of the neighbor in each
+      direction slot (right, down, left, up), -1 past a wall, with
+      ``neighbor_list`` as the same table in nested lists for scalar code;
+    - ``adjacency``: per cell, the tuple of its on-board neighbors in
+      search order;
+    - ``positions``: per cell, its pixel position, the tuples the engine
+      uses, shared rather than rebuilt on every conversion;
+    - ``DIRECTION_SLOT``/``direction_between``: direction <-> neighbor slot.
+
+    Topologies are shared: use ``grid_topology`` rather than the
+    constructor.
+    """
+
+    def __init__(self, width: int, height: int, grid_size: int = 1):
+        self.width = width
+        self.height = height
+        self.grid_size = grid_size
+        self.num_cells = width * height
+
+        self.cell_x: List[int] = [cell % width for cell in range(self.num_cells)]
+        self.cell_y: List[int] = [cell // width for cell in range(self.num_cells)]
+        self.positions: List[Tuple[int, int]] = [
+            (x * grid_size, y * grid_size) for x, y in zip(self.cell_x, self.cell_y)]
+
+        xs = np.array(self.cell_x, dtype=np.int32)
+        ys = np.array(self.cell_y, dtype=np.int32)
+        neighbors = np.full((self.num_cells, 4), -1, dtype=np.int32)
+        for slot, (dx, dy) in enumerate(_DELTAS):
+            nx, ny = xs + dx, ys + dy
+            inside = (nx >= 0) & (nx < width) & (ny >= 0) & (ny < height)
+            neighbors[inside, slot] = ny[inside] * width + nx[inside]
+        neighbors.flags.writeable = False
+        self.neighbors = neighbors
+        self.neighbor_list: List[List[int]] = neighbors.tolist()
+        self.adjacency: List[Tuple[int, ...]] = [
+            tuple(row[slot] for slot in _SEARCH_SLOTS if row[slot] >= 0) for row in self.neighbor_list]
+
+        self._rings: Optional[List[Tuple[int, ...]]] = None
+
+    # Pixels <-> cells
+    def cell_id(self, position: Tuple[int, int]) -> int:
+        return (position[1] // self.grid_size) * self.width + position[0] // self.grid_size
+
+    def cell_position(self, cell: int) -> Tuple[int, int]:
+        return self.positions[cell]
+
+    def in_bounds(self, position: Tuple[int, int]) -> bool:
+        x, y = position
+        return 0 <= x < self.width * self.grid_size and 0 <= y < self.height * self.grid_size
+
+    # Directions
+    def move(self, cell: int, direction: Direction) -> int:
+        """Neighbor of cell in a direction, or -1 past a wall"""
+        return self.neighbor_list[cell][DIRECTION_SLOT[direction]]
+
+    def direction_between(self, cell: int, neighbor: int) -> Direction:
+        """Direction of the step from cell to an adjacent cell"""
+        return _DELTA_DIRECTION[self.cell_x[neighbor] - self.cell_x[cell],
+                                self.cell_y[neighbor] - self.cell_y[cell]]
+
+    @property
+    def rings(self) -> List[Tuple[int, ...]]:
+        """Per cell, the 8 cells around it in circular order from the top-left
+        (-1 off the board); odd slots are its 4-neighbors. Built on first use."""
+        if self._rings is None:
+            rings = []
+            for x, y in zip(self.cell_x, self.cell_y):
+                ring = []
+                for dx, dy in ((-1, -1), (0, -1), (1, -1), (1, 0), (1, 1), (0, 1), (-1, 1), (-1, 0)):
+                    if 0 <= x + dx < self.width and 0 <= y + dy < self.height:
+                        ring.append((y + dy) * self.width + x + dx)
+                    else:
+                        ring.append(-1)
+                rings.append(tuple(ring))
+            self._rings = rings
+        return self._rings
+
+
+@lru_cache(maxsize=None)
+def grid_topology(width: int, height: int, grid_size: int = 1) -> GridTopology:
+    """The topology of a board size, built once and shared by every agent"""
+    return GridTopology(width, height, grid_size)
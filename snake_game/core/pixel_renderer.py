@@ -0,0 +1,114 @@
+from typing import Optional, Sequence
+
+import numpy as np
+
+from core.theme import Theme, ThemeManager
+
+# Cell labels, also the row of each color in the palette
+_BG, _SNAKE, _FOOD, _HEAD = 0, 1, 2, 3
+
+
+class PixelRenderer:
+    """Offscreen renderer writing batches of boards into uint8 NumPy frames.
+
+    Each board is first turned into one label per cell (background, snake,
+    food and optionally head), then a palette lookup maps labels to theme
+    colors and, for ``cell_px > 1``, a broadcast copy blows every cell up
+    into a square block. Everything is whole-array indexing into buffers
+    allocated once, with no pygame or display involved, so frames come out
+    as fast as NumPy can copy them (pixel observations, video recording).
+
+    Frames are (B, H, W, 3) RGB, or (B, H, W, 1) luminance with
+    ``grayscale=True``, where H and W are the board size times ``cell_px``.
+    """
+
+    def __init__(self, width: int, height: int, cell_px: int = 1,
+                 theme: Optional[Theme] = None, grayscale: bool = False,
+                 head_color=None):
+        self.width = width
+        self.height = height
+        self.cell_px = cell_px
+        self.grayscale = grayscale
+        self.mark_head = head_color is not None
+
+        theme = theme or ThemeManager.get_default_theme()
+        colors = [theme.bg_color, theme.snake_color, theme.food_color,
+                  head_color if head_color is not None else theme.snake_color]
+        palette = np.array(colors, dtype=np.float64)
+        if grayscale:
+            # ITU-R BT.601 luma
+            palette = palette @ np.array([[0.299], [0.587], [0.114]])
+        self.palette = np.rint(palette).astype(np.uint8)
+        self.channels = self.palette.shape[1]
+
+        self._labels = np.empty((0, width * height), dtype=np.uint8)
+        self._cells = np.empty((0, height, width, self.channels), dtype=np.uint8)
+
+    @property
+    def frame_shape(self):
+        return (self.height * self.cell_px, self.width * self.cell_px, self.channels)
+
+    def allocate(self, batch: int) -> np.ndarray:
+        """Output buffer for a batch of frames, reusable across calls"""
+        return np.empty((batch,) + self.frame_shape, dtype=np.uint8)
+
+    def _label_buffer(self, batch: int) -> np.ndarray:
+        if self._labels.shape[0] != batch:
+            self._labels = np.empty((batch, self.width * self.height), dtype=np.uint8)
+            if self.cell_px > 1:
+                self._cells = np.empty((batch, self.height, self.width, self.channels), dtype=np.uint8)
+        return self._labels
+
+    def _paint(self, labels: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        """Map labels to colors and scale cells up into the output frames"""
+        batch = labels.shape[0]
+        if out is None:
+            out = self.allocate(batch)
+        if out.shape != (batch,) + self.frame_shape or out.dtype != np.uint8:
+            raise ValueError(f"out must be uint8 with shape {(batch,) + self.frame_shape}, got {out.shape}")
+        if not out.flags.c_contiguous:
+            # reshape() would paint into a temporary copy and leave out untouched
+            raise ValueError("out must be C-contiguous")
+
+        if self.cell_px == 1:
+            np.take(self.palette, labels, axis=0, out=out.reshape(batch, -1, self.channels))
+        else:
+            cells = self._cells
+            np.take(self.palette, labels, axis=0, out=cells.reshape(batch, -1, self.channels))
+            px = self.cell_px
+            # Fill the first pixel row of every cell row column by column, then
+            # copy it down: a few large strided copies beat one 6-d broadcast
+            first_rows = out.reshape(batch, self.height, px, self.width, px, self.channels)[:, :, 0]
+            for i in range(px):
+                first_rows[:, :, :, i] = cells
+            rows = out.reshape(batch, self.height, px, -1)
+            rows[:, :, 1:] = rows[:, :, :1]
+        return out
+
+    def render_vec(self, vec_env, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Render every board of a VecSnakeEnv"""
+        batch = vec_env.num_envs
+        labels = self._label_buffer(batch)
+        np.copyto(labels, vec_env.occupancy, casting='unsafe')
+        boards = vec_env._boards
+        if self.mark_head:
+            labels[boards, vec_env.body[boards, vec_env.head_idx]] = _HEAD
+        has_food = vec_env.food >= 0  # -1 once a board is full
+        labels[boards[has_food], vec_env.food[has_food]] = _FOOD
+        return self._paint(labels, out)
+
+    def render_envs(self, envs: Sequence, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Render a sequence of SnakeEnv (or SnakeGame) boards"""
+        labels = self._label_buffer(len(envs))
+        for row, env in zip(labels, envs):
+            body = env.snake_pos
+            row[:] = np.frombuffer(body.occupied, dtype=np.uint8)
+            if self.mark_head:
+                row[body.cell_id(body.head)] = _HEAD
+            if env.food_pos is not None:
+                row[body.cell_id(env.food_pos)] = _FOOD
+        return self._paint(labels, out)
+
+    def render_env(self, env) -> np.ndarray:
+        """Single (H, W, C) frame of one board"""
+        return self.render_envs([env])[0]
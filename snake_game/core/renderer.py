@@ -0,0 +1,267 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+import pygame
+
+from core.theme import Theme
+
+class BoardRenderer:
+    """Incremental renderer for the snake board.
+
+    Keeps the board (background, snake, food) on a persistent surface and
+    repaints only the cells that differ from the last frame it drew: it
+    keeps a copy of the visible occupancy and the food position, and each
+    sync diffs the env against them (normally the new head, the vacated
+    tail and the new food). The env itself tracks nothing for rendering.
+    The caller blits just those rects to the screen and pushes them with
+    ``pygame.display.update(rects)``, so frame cost no longer grows with
+    the snake's length. A full redraw happens on the first frame, when the
+    env starts a new episode or swaps its body, when the theme changes, or
+    when too many cells changed between frames (e.g. in turbo mode).
+
+    Boards larger than the window are drawn through a viewport: the
+    surface only covers the visible cells, a camera keeps the head inside
+    the middle of the view, and camera moves scroll the surface and paint
+    just the exposed strip. Redraws scan the occupancy bitmap of visible
+    rows only, so draw cost scales with the viewport, never the board.
+    """
+
+    # Redraw everything once this many cells changed between frames
+    DIRTY_CELL_LIMIT = 1024
+
+    def __init__(self, size: int, grid_size: int, minimap_size: int = 150,
+                 minimap_interval: int = 10):
+        self.size = size
+        self.grid_size = grid_size
+        self.minimap = Minimap(minimap_size, minimap_interval)
+        self.board_size = None
+        self.camera = (0, 0)
+        self._theme = None
+        self._body = None
+        self._painted = None
+        self._food = None
+        self._configure(size // grid_size, size // grid_size)
+
+    def _configure(self, width: int, height: int) -> None:
+        """Size the viewport for a board of width x height cells"""
+        self.board_size = (width, height)
+        cells = self.size // self.grid_size
+        self.view_size = (min(width, cells), min(height, cells))
+        self.surface = pygame.Surface((self.view_size[0] * self.grid_size,
+                                       self.view_size[1] * self.grid_size))
+        self.rect = self.surface.get_rect()
+        self.camera = (0, 0)
+        self._body = None
+        self._painted = None
+        # Blit the whole board next frame (after overlays/menus used the screen)
+        self.present_all = True
+
+    @property
+    def scrolling(self) -> bool:
+        """True when the board is larger than the window"""
+        return self.view_size != self.board_size
+
+    def invalidate(self) -> None:
+        """Force a full board redraw on the next sync (e.g. after a theme switch)"""
+        self._body = None
+        self._painted = None
+
+    def _visible_occupancy(self, env) -> np.ndarray:
+        """View of the occupancy bitmap restricted to the viewport, as (rows, cols)"""
+        (view_w, view_h), (cam_x, cam_y) = self.view_size, self.camera
+        occupancy = np.frombuffer(env.snake_pos.occupied, dtype=np.uint8).reshape(env.height, env.width)
+        return occupancy[cam_y:cam_y + view_h, cam_x:cam_x + view_w]
+
+    def _follow(self, env) -> Tuple[int, int]:
+        """Camera position that keeps the head away from the viewport edges"""
+        (view_w, view_h), (cam_x, cam_y) = self.view_size, self.camera
+        head_x = env.snake_pos.head[0] // self.grid_size
+        head_y = env.snake_pos.head[1] // self.grid_size
+
+        def axis(cam, head, view, board):
+            margin = view // 4
+            if head < cam + margin:
+                cam = head - margin
+            elif head >= cam + view - margin:
+                cam = head - view + margin + 1
+            return max(0, min(cam, board - view))
+
+        return (axis(cam_x, head_x, view_w, env.width),
+                axis(cam_y, head_y, view_h, env.height))
+
+    def _paint_cell(self, env, position, theme: Theme) -> Optional[pygame.Rect]:
+        x = position[0] // self.grid_size - self.camera[0]
+        y = position[1] // self.grid_size - self.camera[1]
+        if not (0 <= x < self.view_size[0] and 0 <= y < self.view_size[1]):
+            return None
+        if env.food_pos == position:
+            color = theme.food_color
+        elif position in env.snake_pos:
+            color = theme.snake_color
+        else:
+            color = theme.bg_color
+        rect = pygame.Rect(x * self.grid_size, y * self.grid_size, self.grid_size, self.grid_size)
+        self.surface.fill(color, rect)
+        return rect
+
+    def _paint_region(self, env, theme: Theme, x0: int, y0: int, w: int, h: int) -> None:
+        """Repaint viewport cells [x0, x0+w) x [y0, y0+h) from the occupancy bitmap"""
+        g = self.grid_size
+        cam_x, cam_y = self.camera
+        self.surface.fill(theme.bg_color, (x0 * g, y0 * g, w * g, h * g))
+        occupied = env.snake_pos.occupied
+        for y in range(y0, y0 + h):
+            row = (y + cam_y) * env.width + cam_x
+            start, end = row + x0, row + x0 + w
+            # Fill each horizontal run of snake cells with a single rect
+            run = occupied.find(1, start, end)
+            while run != -1:
+                gap = occupied.find(0, run, end)
+                if gap == -1:
+                    gap = end
+                self.surface.fill(theme.snake_color, ((run - row) * g, y * g, (gap - run) * g, g))
+                run = occupied.find(1, gap, end)
+        if env.food_pos is not None:  # None once the board is full
+            fx = env.food_pos[0] // g - cam_x
+            fy = env.food_pos[1] // g - cam_y
+            if x0 <= fx < x0 + w and y0 <= fy < y0 + h:
+                self.surface.fill(theme.food_color, (fx * g, fy * g, g, g))
+
+    def _redraw_all(self, env, theme: Theme) -> None:
+        if self.board_size != (env.width, env.height):
+            self._configure(env.width, env.height)
+        self.camera = self._follow(env)
+        self._paint_region(env, theme, 0, 0, *self.view_size)
+        self._painted = self._visible_occupancy(env).copy()
+        self._food = env.food_pos
+        self._theme = theme
+        self._body = env.snake_pos
+        self.present_all = True
+
+    def _scroll(self, env, theme: Theme, camera: Tuple[int, int]) -> bool:
+        """Move the camera by scrolling the surface; False if a full redraw is cheaper"""
+        dx, dy = camera[0] - self.camera[0], camera[1] - self.camera[1]
+        view_w, view_h = self.view_size
+        if abs(dx) >= view_w // 2 or abs(dy) >= view_h // 2:
+            return False
+        self.surface.scroll(-dx * self.grid_size, -dy * self.grid_size)
+        self.camera = camera
+        # Shift the last frame along with the surface; the exposed strips
+        # are painted from the env below, so they start out up to date
+        painted = self._visible_occupancy(env).copy()
+        src_x = slice(max(dx, 0), view_w + min(dx, 0))
+        dst_x = slice(max(-dx, 0), view_w + min(-dx, 0))
+        src_y = slice(max(dy, 0), view_h + min(dy, 0))
+        dst_y = slice(max(-dy, 0), view_h + min(-dy, 0))
+        painted[dst_y, dst_x] = self._painted[src_y, src_x]
+        self._painted = painted
+        # Paint only the strips the scroll exposed
+        if dx:
+            x0 = view_w - dx if dx > 0 else 0
+            self._paint_region(env, theme, x0, 0, abs(dx), view_h)
+        if dy:
+            y0 = view_h - dy if dy > 0 else 0
+            self._paint_region(env, theme, 0, y0, view_w, abs(dy))
+        self.present_all = True
+        return True
+
+    def sync(self, env, theme: Theme) -> List[pygame.Rect]:
+        """Bring the board surface up to date; returns the board rects that changed"""
+        if self._body is not env.snake_pos or self._theme is not theme or self._painted is None:
+            self._redraw_all(env, theme)
+            return [self.rect]
+
+        camera = self._follow(env)
+        if camera != self.camera and not self._scroll(env, theme, camera):
+            self._redraw_all(env, theme)
+            return [self.rect]
+
+        current = self._visible_occupancy(env)
+        changed = np.flatnonzero(current != self._painted)
+        if len(changed) >= self.DIRTY_CELL_LIMIT:
+            self._redraw_all(env, theme)
+            return [self.rect]
+
+        g = self.grid_size
+        view_w = self.view_size[0]
+        cam_x, cam_y = self.camera
+        positions = [((cam_x + i % view_w) * g, (cam_y + i // view_w) * g) for i in changed.tolist()]
+        if env.food_pos != self._food:
+            positions.extend(p for p in (self._food, env.food_pos) if p is not None)
+        rects = [self._paint_cell(env, position, theme) for position in positions]
+        self._painted[:] = current
+        self._food = env.food_pos
+        return [rect for rect in rects if rect is not None]
+
+    def present(self, screen: pygame.Surface, rects: List[pygame.Rect]) -> List[pygame.Rect]:
+        """Copy changed board areas to the screen; returns the rects to update"""
+        if self.present_all:
+            screen.blit(self.surface, (0, 0))
+            self.present_all = False
+            return [self.rect]
+        for rect in rects:
+            screen.blit(self.surface, rect, rect)
+        return rects
+
+    def restore(self, screen: pygame.Surface, rect: Optional[pygame.Rect]) -> None:
+        """Erase an overlay (e.g. the HUD) by copying the board back under it"""
+        if rect is not None:
+            screen.blit(self.surface, rect, rect)
+
+    def draw_minimap(self, screen: pygame.Surface, env, theme: Theme) -> Optional[pygame.Rect]:
+        """Draw the minimap in the top-right corner when the board scrolls"""
+        if not self.scrolling:
+            return None
+        return self.minimap.draw(screen, env, theme, self.camera, self.view_size)
+
+
+class Minimap:
+    """Downsampled overview of a large board.
+
+    Each minimap pixel covers a square block of cells and shows snake if
+    any cell in the block is occupied. The image is rebuilt with a couple
+    of vectorized reductions every ``interval`` frames; in between the
+    cached surface is blitted with a fresh viewport outline.
+    """
+
+    def __init__(self, size: int, interval: int):
+        self.size = size
+        self.interval = interval
+        self._frame = 0
+        self._image = None
+        self._block = 1
+
+    def _build(self, env, theme: Theme) -> None:
+        occupancy = np.frombuffer(env.snake_pos.occupied, dtype=np.uint8).reshape(env.height, env.width)
+        block = -(-max(env.width, env.height) // self.size)
+        if block > 1:
+            occupancy = np.maximum.reduceat(occupancy, np.arange(0, env.height, block), axis=0)
+            occupancy = np.maximum.reduceat(occupancy, np.arange(0, env.width, block), axis=1)
+
+        pixels = np.where(occupancy[..., None].astype(bool),
+                          np.array(theme.snake_color, dtype=np.uint8),
+                          np.array(theme.bg_color, dtype=np.uint8))
+        if env.food_pos is not None:
+            fx = env.food_pos[0] // env.grid_size // block
+            fy = env.food_pos[1] // env.grid_size // block
+            pixels[fy, fx] = theme.food_color
+
+        # surfarray is indexed (x, y)
+        image = pygame.surfarray.make_surface(np.ascontiguousarray(pixels.transpose(1, 0, 2)))
+        scale = max(1, self.size // max(image.get_width(), image.get_height()))
+        self._image = pygame.transform.scale(image, (image.get_width() * scale, image.get_height() * scale))
+        self._block = block / scale
+
+    def draw(self, screen: pygame.Surface, env, theme: Theme,
+             camera: Tuple[int, int], view_size: Tuple[int, int]) -> pygame.Rect:
+        if self._image is None or self._frame % self.interval == 0:
+            self._build(env, theme)
+        self._frame += 1
+
+        rect = self._image.get_rect(topright=(screen.get_width() - 10, 10))
+        screen.blit(self._image, rect)
+        view = pygame.Rect(rect.x + int(camera[0] / self._block), rect.y + int(camera[1] / self._block),
+                           max(2, int(view_size[0] / self._block)), max(2, int(view_size[1] / self._block)))
+        pygame.draw.rect(screen, theme.food_color, view, 1)
+        pygame.draw.rect(screen, theme.snake_color, rect.inflate(2, 2), 1)
+        return rect.inflate(2, 2)
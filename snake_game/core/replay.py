@@ -0,0 +1,92 @@
+import argparse
+import struct
+import sys
+from typing import Iterable, List, Optional
+
+from core.constants import Direction, GameSettings
+
+# magic, format version, board width, board height, episode seed, action count
+_HEADER = struct.Struct('<4sBHHQI')
+_MAGIC = b'SNKR'
+_VERSION = 1
+
+class Replay:
+    """A recorded game: the episode seed plus one byte per action.
+
+    Food placement is fully determined by the seed, so re-applying the
+    actions to a fresh ``SnakeEnv`` reproduces the game exactly. Each
+    action byte is the ``Direction`` value the snake moved in that tick.
+    """
+
+    def __init__(self, width: int, height: int, seed: int,
+                 actions: Optional[Iterable[int]] = None):
+        self.width = width
+        self.height = height
+        self.seed = seed
+        self.actions = bytearray(actions or ())
+
+    def record(self, direction: Direction) -> None:
+        self.actions.append(direction.value)
+
+    def to_bytes(self) -> bytes:
+        header = _HEADER.pack(_MAGIC, _VERSION, self.width, self.height,
+                              self.seed, len(self.actions))
+        return header + bytes(self.actions)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'Replay':
+        magic, version, width, height, seed, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a snake replay file (or unsupported version)")
+        actions = data[_HEADER.size:_HEADER.size + count]
+        if len(actions) != count:
+            raise ValueError("Truncated replay file")
+        return cls(width, height, seed, actions)
+
+    def save(self, path: str) -> None:
+        with open(path, 'wb') as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> 'Replay':
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    def __len__(self) -> int:
+        return len(self.actions)
+
+
+def simulate(replay: Replay, settings: Optional[GameSettings] = None):
+    """Re-run a recorded game headlessly and return the finished SnakeEnv"""
+    from core.env import SnakeEnv
+
+    settings = settings or GameSettings()
+    settings = GameSettings(**{**settings.__dict__,
+                               'BOARD_WIDTH': replay.width,
+                               'BOARD_HEIGHT': replay.height})
+
+    env = SnakeEnv(settings)
+    env.reset(seed=replay.seed)
+    directions = {direction.value: direction for direction in Direction}
+    for action in replay.actions:
+        env.step(directions[action])
+        if env.game_over:
+            break
+    return env
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Re-simulate recorded snake games headlessly")
+    parser.add_argument('replays', nargs='+', help="replay files written by SnakeEnv.save_replay")
+    args = parser.parse_args(argv)
+
+    for path in args.replays:
+        replay = Replay.load(path)
+        env = simulate(replay)
+        outcome = 'won' if env.won else ('died' if env.game_over else 'unfinished')
+        print(f"{path}: score={env.score} steps={env.steps} {outcome}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
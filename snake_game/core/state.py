@@ -0,0 +1,111 @@
+from typing import Optional, Tuple
+
+from core.body import SnakeBody
+from core.constants import Direction
+
+_DELTAS = {
+    Direction.UP: (0, -1),
+    Direction.DOWN: (0, 1),
+    Direction.LEFT: (-1, 0),
+    Direction.RIGHT: (1, 0),
+}
+
+class SnakeState:
+    """Forkable game state for lookahead search.
+
+    Holds just the body, direction, food, score and end flags, detached
+    from any env or pygame object. ``step`` records an undo entry, so a
+    search can ``snapshot()`` once, explore any number of moves and
+    ``restore()`` in time proportional to the moves made rather than the
+    snake length. ``clone()`` gives a fully independent copy when two
+    branches need to live side by side.
+
+    Food is not respawned: after the snake eats, ``food_pos`` is None
+    because the next spawn is unknown to the searcher.
+    """
+
+    __slots__ = ('body', 'direction', 'food_pos', 'score', 'game_over', 'won', '_undo')
+
+    def __init__(self, body: SnakeBody, direction: Direction,
+                 food_pos: Optional[Tuple[int, int]], score: int = 0,
+                 game_over: bool = False, won: bool = False):
+        self.body = body
+        self.direction = direction
+        self.food_pos = food_pos
+        self.score = score
+        self.game_over = game_over
+        self.won = won
+        self._undo = []
+
+    @classmethod
+    def from_game(cls, game) -> 'SnakeState':
+        """Snapshot a live SnakeEnv (or anything exposing the same fields)"""
+        return cls(game.snake_pos.copy(), game.snake_direction, game.food_pos,
+                   game.score, game.game_over, getattr(game, 'won', False))
+
+    def clone(self) -> 'SnakeState':
+        """Independent copy with an empty undo log"""
+        return SnakeState(self.body.copy(), self.direction, self.food_pos,
+                          self.score, self.game_over, self.won)
+
+    def snapshot(self) -> int:
+        """Token for the current point in the undo log"""
+        return len(self._undo)
+
+    def restore(self, snapshot: int) -> None:
+        """Undo every step taken since ``snapshot`` was returned"""
+        while len(self._undo) > snapshot:
+            self.undo()
+
+    def step(self, direction: Direction) -> bool:
+        """Advance one tick; returns False if the move ended the game"""
+        if self.game_over:
+            return False
+
+        body = self.body
+        dx, dy = _DELTAS[direction]
+        head = body[0]
+        new_head = (head[0] + dx * body.grid_size, head[1] + dy * body.grid_size)
+
+        # (direction, food, score, game_over, won, new_head, popped_tail)
+        entry = [self.direction, self.food_pos, self.score, self.game_over, self.won, None, None]
+        self._undo.append(entry)
+        self.direction = direction
+
+        if body.is_blocked(new_head):
+            self.game_over = True
+            return False
+
+        if new_head == self.food_pos:
+            self.score += 1
+            self.food_pos = None
+        else:
+            entry[6] = body.pop_tail()
+        body.push_head(new_head)
+        entry[5] = new_head
+
+        if body.free_count == 0:
+            self.won = True
+            self.game_over = True
+        return True
+
+    def undo(self) -> None:
+        """Revert the most recent step"""
+        direction, food_pos, score, game_over, won, new_head, popped_tail = self._undo.pop()
+        if new_head is not None:
+            self.body.pop_head()
+            if popped_tail is not None:
+                self.body.push_tail(popped_tail)
+        self.direction = direction
+        self.food_pos = food_pos
+        self.score = score
+        self.game_over = game_over
+        self.won = won
+
+    @property
+    def head(self) -> Tuple[int, int]:
+        return self.body[0]
+
+    @property
+    def tail(self) -> Tuple[int, int]:
+        return self.body[-1]
@@ -0,0 +1,68 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pygame
+
+class TextCache:
+    """Shared cache for fonts, rendered text and pre-rendered static layers.
+
+    Fonts are built once per size. Rendered text surfaces are kept in an
+    LRU keyed by (size, text, color) so labels that repeat frame after
+    frame are rasterized only once. Static screen layers (backgrounds,
+    titles, fixed menu text) are rendered once per key and theme by a
+    caller-supplied builder and then simply blitted.
+    """
+
+    def __init__(self, max_entries: int = 512):
+        self.max_entries = max_entries
+        self._fonts: Dict[int, pygame.font.Font] = {}
+        self._texts: 'OrderedDict[Tuple, pygame.Surface]' = OrderedDict()
+        self._layers: Dict[Hashable, pygame.Surface] = {}
+
+    def font(self, size: int) -> pygame.font.Font:
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._fonts[size] = pygame.font.Font(None, size)
+        return font
+
+    def render(self, text: str, size: int, color) -> pygame.Surface:
+        """Antialiased text surface, rasterized at most once while cached"""
+        key = (size, text, tuple(color))
+        surface = self._texts.get(key)
+        if surface is not None:
+            self._texts.move_to_end(key)
+            return surface
+        surface = self.font(size).render(text, True, color)
+        self._texts[key] = surface
+        if len(self._texts) > self.max_entries:
+            self._texts.popitem(last=False)
+        return surface
+
+    def blit(self, target: pygame.Surface, text: str, size: int, color, **anchor) -> pygame.Rect:
+        """Blit cached text positioned with a get_rect anchor, e.g. center=(x, y)"""
+        surface = self.render(text, size, color)
+        return target.blit(surface, surface.get_rect(**anchor))
+
+    def layer(self, key: Hashable, size: Tuple[int, int],
+              builder: Callable[[pygame.Surface], None], alpha: bool = False) -> pygame.Surface:
+        """Static full-screen layer built once per key (include the theme in the key)"""
+        surface = self._layers.get(key)
+        if surface is None:
+            surface = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+            builder(surface)
+            self._layers[key] = surface
+        return surface
+
+    def clear(self) -> None:
+        self._texts.clear()
+        self._layers.clear()
+
+
+_shared: Optional[TextCache] = None
+
+def get_text_cache() -> TextCache:
+    """Process-wide cache shared by the game screens and AI debug overlays"""
+    global _shared
+    if _shared is None:
+        _shared = TextCache()
+    return _shared
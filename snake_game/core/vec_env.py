@@ -0,0 +1,184 @@
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+from core.constants import GameSettings, RewardSettings
+
+# Clockwise direction order, matching RLAgent._action_to_direction
+# 0: RIGHT, 1: DOWN, 2: LEFT, 3: UP
+_DX = np.array([1, 0, -1, 0], dtype=np.int64)
+_DY = np.array([0, 1, 0, -1], dtype=np.int64)
+# Relative action -> change in clockwise index ([straight, right, left])
+_TURN = np.array([0, 1, -1], dtype=np.int64)
+
+
+class VecSnakeEnv:
+    """Batch of B snake boards stepped together with NumPy array ops.
+
+    Each board keeps an occupancy grid plus a ring buffer of body cell ids
+    (head index and length), so a step is a handful of vectorised gathers
+    and scatters regardless of snake length. Observations are the same
+    11-feature state ``SnakeAI.get_state`` produces, one row per board.
+    Finished boards are reset automatically at the end of ``step``.
+    """
+
+    OBSERVATION_SIZE = 11
+
+    def __init__(self, num_envs: int, settings: Optional[GameSettings] = None,
+                 config=None, seed: Optional[int] = None):
+        self.num_envs = num_envs
+        self.settings = settings or GameSettings()
+        self.config = config or RewardSettings()
+        self.width = self.settings.board_width
+        self.height = self.settings.board_height
+        self.num_cells = self.width * self.height
+        self.rng = np.random.default_rng(seed)
+
+        B, N = num_envs, self.num_cells
+        self.occupancy = np.zeros((B, N), dtype=bool)
+        self.body = np.zeros((B, N), dtype=np.int64)  # ring buffer of cell ids
+        self.head_idx = np.zeros(B, dtype=np.int64)
+        self.length = np.zeros(B, dtype=np.int64)
+        self.food = np.zeros(B, dtype=np.int64)
+        self.direction = np.zeros(B, dtype=np.int64)
+        self.score = np.zeros(B, dtype=np.int64)
+        self.steps = np.zeros(B, dtype=np.int64)
+        self.prev_food_distance = np.full(B, np.inf)
+        self._boards = np.arange(B)
+
+        self.reset()
+
+    def reset(self) -> np.ndarray:
+        """Reset every board and return the batched observation"""
+        self._reset_boards(self._boards)
+        return self.get_observations()
+
+    def _reset_boards(self, boards: np.ndarray) -> None:
+        """Put the given boards back to a single-segment snake in the centre"""
+        if len(boards) == 0:
+            return
+        center = (self.height // 2) * self.width + self.width // 2
+        self.occupancy[boards] = False
+        self.occupancy[boards, center] = True
+        self.body[boards, 0] = center
+        self.head_idx[boards] = 0
+        self.length[boards] = 1
+        self.direction[boards] = 0
+        self.score[boards] = 0
+        self.steps[boards] = 0
+        self.prev_food_distance[boards] = np.inf
+        self.food[boards] = self._sample_free_cells(boards)
+
+    def _sample_free_cells(self, boards: np.ndarray) -> np.ndarray:
+        """Pick a uniformly random unoccupied cell per board (-1 if full)"""
+        keys = self.rng.random((len(boards), self.num_cells))
+        keys[self.occupancy[boards]] = -1.0
+        cells = keys.argmax(axis=1)
+        full = keys[np.arange(len(boards)), cells] < 0
+        cells[full] = -1
+        return cells
+
+    def _tail_cells(self) -> np.ndarray:
+        tail_idx = (self.head_idx - self.length + 1) % self.num_cells
+        return self.body[self._boards, tail_idx]
+
+    def _collisions(self, x: np.ndarray, y: np.ndarray, tails: np.ndarray) -> np.ndarray:
+        """Vectorised equivalent of SnakeAI._is_collision for one cell per board"""
+        out = (x < 0) | (x >= self.width) | (y < 0) | (y >= self.height)
+        cells = np.where(out, 0, y * self.width + x)
+        hit_body = self.occupancy[self._boards, cells] & (cells != tails)
+        return out | hit_body
+
+    def get_observations(self) -> np.ndarray:
+        """Return the (B, 11) float32 observation batch"""
+        heads = self.body[self._boards, self.head_idx]
+        hx, hy = heads % self.width, heads // self.width
+        tails = self._tail_cells()
+        d = self.direction
+
+        obs = np.zeros((self.num_envs, self.OBSERVATION_SIZE), dtype=np.float32)
+        # Danger straight, right, left
+        for col, turn in enumerate(_TURN):
+            nd = (d + turn) % 4
+            obs[:, col] = self._collisions(hx + _DX[nd], hy + _DY[nd], tails)
+
+        # Move direction: left, right, up, down
+        obs[:, 3] = d == 2
+        obs[:, 4] = d == 0
+        obs[:, 5] = d == 3
+        obs[:, 6] = d == 1
+
+        # Food location relative to head
+        fx, fy = self.food % self.width, self.food // self.width
+        obs[:, 7] = fx < hx
+        obs[:, 8] = fx > hx
+        obs[:, 9] = fy < hy
+        obs[:, 10] = fy > hy
+        return obs
+
+    def step(self, actions: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, Dict]:
+        """Apply one relative action per board.
+
+        ``actions`` is either a (B,) array of indices into
+        [straight, right, left] or a (B, 3) one-hot array as produced by
+        ``RLAgent._get_action``. Returns (observations, rewards, dones, info);
+        ``info['scores']`` holds each board's score at the end of the step and
+        ``info['terminal_observation']`` the pre-reset observation.
+        """
+        actions = np.asarray(actions)
+        if actions.ndim == 2:
+            actions = actions.argmax(axis=1)
+
+        self.direction = (self.direction + _TURN[actions]) % 4
+        heads = self.body[self._boards, self.head_idx]
+        nx = heads % self.width + _DX[self.direction]
+        ny = heads // self.width + _DY[self.direction]
+        tails = self._tail_cells()
+        self.steps += 1
+
+        died = self._collisions(nx, ny, tails)
+        alive = ~died
+        new_heads = np.where(died, 0, ny * self.width + nx)
+        ate = alive & (new_heads == self.food)
+
+        # Vacate tails first so a head may move into the cell its tail just left
+        movers = np.flatnonzero(alive & ~ate)
+        self.occupancy[movers, tails[movers]] = False
+        live = np.flatnonzero(alive)
+        self.head_idx[live] = (self.head_idx[live] + 1) % self.num_cells
+        self.body[live, self.head_idx[live]] = new_heads[live]
+        self.occupancy[live, new_heads[live]] = True
+        self.length += ate
+        self.score += ate
+
+        won = np.zeros(self.num_envs, dtype=bool)
+        eaters = np.flatnonzero(ate)
+        if len(eaters):
+            self.food[eaters] = self._sample_free_cells(eaters)
+            won[eaters] = self.food[eaters] < 0
+
+        # Rewards (same shaping as SnakeEnv.calculate_reward)
+        distance = (np.abs(nx - self.food % self.width) +
+                    np.abs(ny - self.food // self.width)).astype(np.float64)
+        moved = alive & ~ate
+        rewards = np.where(distance < self.prev_food_distance,
+                           self.config.REWARD_CLOSER,
+                           self.config.REWARD_FARTHER).astype(np.float32)
+        self.prev_food_distance = np.where(moved, distance, self.prev_food_distance)
+        rewards[ate] = self.config.REWARD_EAT
+        rewards[died] = self.config.REWARD_DEATH
+
+        dones = died | won
+        obs = self.get_observations()
+        info = {'scores': self.score.copy(), 'won': won}
+        finished = np.flatnonzero(dones)
+        if len(finished):
+            info['terminal_observation'] = obs[finished].copy()
+            self._reset_boards(finished)
+            obs[finished] = self.get_observations()[finished]
+        return obs, rewards, dones, info
+
+    def snake_cells(self, board: int) -> np.ndarray:
+        """Body cell ids of one board from head to tail"""
+        idx = (self.head_idx[board] - np.arange(self.length[board])) % self.num_cells
+        return self.body[board, idx]
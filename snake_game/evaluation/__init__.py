@@ -0,0 +1,2 @@
+# evaluation/__init__.py
+"""Headless benchmarking and evaluation tools (no pygame window required)"""
\ No newline at end of file
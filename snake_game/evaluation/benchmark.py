@@ -0,0 +1,340 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from core.constants import Direction, GameSettings
+from core.env import SnakeEnv
+from core.grid import grid_topology
+
+_DIRECTIONS = (Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.UP)
+
+# Cold import of the game module (manual play) must stay under this many seconds
+STARTUP_BUDGET_S = 1.0
+_HEAVY_MODULES = ('torch', 'matplotlib', 'ai.pathfinding', 'ai.reinforcement.agent')
+
+# Agents that follow the board's fixed Hamiltonian cycle: a snake laid
+# along it is a position they reach in play. Others play up to the length.
+_CYCLE_AGENTS = ('hamiltonian', 'dynamic')
+# Give up on playing to a length after this many steps per cell without food
+_STARVE_FACTOR = 2
+
+
+def _agent_factories() -> Dict[str, Callable]:
+    """Agent name -> constructor taking an env; RL is skipped if torch is missing"""
+    from ai.pathfinding.astar import AStarPathfinder
+    from ai.pathfinding.hamilton import HamiltonianPathfinder
+    from ai.pathfinding.hybrid import HybridPathfinder
+    from ai.pathfinding.dynamic_cycle import DynamicHamiltonianPathfinder
+
+    factories = {
+        'astar': AStarPathfinder,
+        'hamiltonian': HamiltonianPathfinder,
+        'hybrid': HybridPathfinder,
+        'dynamic': DynamicHamiltonianPathfinder,
+    }
+    try:
+        from ai.reinforcement.agent import RLAgent
+        factories['rl'] = RLAgent
+    except ImportError as e:
+        print(f"Skipping RLAgent benchmark: {e}", file=sys.stderr)
+    return factories
+
+
+def serpentine_snake(width: int, height: int, length: int,
+                     grid_size: int) -> Tuple[List[Tuple[int, int]], Direction]:
+    """Head-to-tail segments of a snake laid row by row from the top-left"""
+    cells = []
+    for y in range(height):
+        xs = range(width) if y % 2 == 0 else range(width - 1, -1, -1)
+        cells.extend((x * grid_size, y * grid_size) for x in xs)
+    body = cells[:max(1, length)][::-1]
+    if len(body) == 1:
+        return body, Direction.RIGHT
+    (hx, hy), (nx, ny) = body[0], body[1]
+    if hx != nx:
+        return body, Direction.RIGHT if hx > nx else Direction.LEFT
+    return body, Direction.DOWN if hy > ny else Direction.UP
+
+
+def cycle_snake(width: int, height: int, length: int, grid_size: int,
+                offset: int = 0) -> Tuple[List[Tuple[int, int]], Direction]:
+    """Head-to-tail segments of a snake lying along the board's Hamiltonian
+    cycle, head at cycle position offset and moving forward along it"""
+    from ai.pathfinding.cycles import hamiltonian_cycle
+
+    order = hamiltonian_cycle(width, height).order_list
+    topology = grid_topology(width, height, grid_size)
+    n = len(order)
+    length = max(1, min(length, n))
+    cells = [order[(offset - i) % n] for i in range(length)]
+    body = [topology.positions[cell] for cell in cells]
+    if length == 1:
+        return body, topology.direction_between(cells[0], order[(offset + 1) % n])
+    return body, topology.direction_between(cells[1], cells[0])
+
+
+def play_to_length(env: SnakeEnv, agent, length: int) -> bool:
+    """Play a fresh game until the snake is length long; False if it died or starved first"""
+    env.reset()
+    starve_limit = _STARVE_FACTOR * env.width * env.height
+    last_food_step = 0
+    while len(env.snake_pos) < length:
+        score = env.score
+        env.step(agent.get_next_move())
+        if env.game_over or env.food_pos is None:
+            return False
+        if env.score != score:
+            last_food_step = env.steps
+        elif env.steps - last_food_step > starve_limit:
+            return False
+    return True
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(pct / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Latency summary in microseconds"""
+    ordered = sorted(samples)
+    return {
+        'count': len(ordered),
+        'mean_us': sum(ordered) / len(ordered) * 1e6 if ordered else 0.0,
+        'p50_us': percentile(ordered, 50) * 1e6,
+        'p99_us': percentile(ordered, 99) * 1e6,
+        'max_us': ordered[-1] * 1e6 if ordered else 0.0,
+    }
+
+
+def settings_for(board: int, grid_size: int = 20) -> GameSettings:
+    return GameSettings(GRID_SIZE=grid_size, BOARD_WIDTH=board, BOARD_HEIGHT=board)
+
+
+def bench_engine(board: int, steps: int, seed: int) -> Dict:
+    """Raw SnakeEnv steps per second under a cheap collision-avoiding policy"""
+    env = SnakeEnv(settings_for(board), seed=seed)
+    start = time.perf_counter()
+    for _ in range(steps):
+        direction = env.snake_direction
+        if env.is_collision(env.next_head(direction)):
+            for direction in _DIRECTIONS:
+                if not env.is_collision(env.next_head(direction)):
+                    break
+        env.step(direction)
+        if env.game_over:
+            env.reset()
+    elapsed = time.perf_counter() - start
+    return {'board': board, 'steps': steps, 'steps_per_sec': steps / elapsed}
+
+
+def bench_vec_engine(board: int, num_envs: int, steps: int, seed: int) -> Optional[Dict]:
+    try:
+        import numpy as np
+        from core.vec_env import VecSnakeEnv
+    except ImportError:
+        return None
+    env = VecSnakeEnv(num_envs, settings_for(board), seed=seed)
+    rng = np.random.default_rng(seed)
+    actions = rng.integers(0, 3, (steps, num_envs))
+    start = time.perf_counter()
+    for i in range(steps):
+        env.step(actions[i])
+    elapsed = time.perf_counter() - start
+    return {'board': board, 'num_envs': num_envs, 'steps': steps * num_envs,
+            'steps_per_sec': steps * num_envs / elapsed}
+
+
+def bench_agent(name: str, factory: Callable, board: int, fill: float,
+                positions: int, moves: int, seed: int) -> Dict:
+    """Latency of get_next_move from mid-game positions with a given snake length.
+
+    Positions are ones the agent reaches itself: cycle followers start from
+    a snake laid along their cycle, every other agent plays a fresh game up
+    to the length. Games that die or starve first count as invalid
+    positions and are not timed.
+    """
+    settings = settings_for(board)
+    env = SnakeEnv(settings, seed=seed)
+    agent = factory(env)
+    length = max(1, int(fill * board * board))
+    rng = random.Random(seed)
+    samples = []
+    deaths = 0
+    invalid = 0
+
+    for position in range(positions):
+        if name in _CYCLE_AGENTS:
+            env.reset()
+            body, direction = cycle_snake(env.width, env.height, length, env.grid_size,
+                                          rng.randrange(env.width * env.height))
+            env.place_snake(body, direction)
+            if env.food_pos is None:
+                invalid += 1
+                continue
+        elif not play_to_length(env, agent, length):
+            invalid += 1
+            continue
+        # Agents may cache plans between ticks; start each position fresh
+        if hasattr(agent, 'current_path'):
+            agent.current_path = []
+        for _ in range(moves):
+            start = time.perf_counter()
+            move = agent.get_next_move()
+            samples.append(time.perf_counter() - start)
+            env.step(move)
+            if env.game_over:
+                deaths += 1
+                break
+
+    return {'agent': name, 'board': board, 'fill': fill, 'length': length,
+            'positions': positions - invalid, 'invalid_positions': invalid,
+            'deaths': deaths, **summarize(samples)}
+
+
+def bench_flood_fill(board: int, fill: float, queries: int, seed: int) -> Dict:
+    """count_free_squares latency: cell-by-cell BFS against the bitboard flood fill"""
+    from ai.pathfinding.astar import AStarPathfinder
+
+    env = SnakeEnv(settings_for(board), seed=seed)
+    length = max(1, int(fill * board * board))
+    body, direction = serpentine_snake(env.width, env.height, length, env.grid_size)
+    env.place_snake(body, direction)
+    variants = {'bfs': AStarPathfinder(env), 'bitboard': AStarPathfinder(env, bitboard=True)}
+    rng = random.Random(seed)
+    samples = {name: [] for name in variants}
+    mismatches = 0
+
+    for _ in range(queries):
+        position = env.snake_pos.random_free_position(rng)
+        if position is None:
+            break
+        # A fresh tick, so the bitboard pays for building its masks every time
+        env.tick_cache.clear()
+        counts = set()
+        for name, agent in variants.items():
+            start = time.perf_counter()
+            counts.add(agent.count_free_squares(position))
+            samples[name].append(time.perf_counter() - start)
+        mismatches += len(counts) > 1
+
+    return {'board': board, 'fill': fill, 'length': length, 'mismatches': mismatches,
+            **{name: summarize(times) for name, times in samples.items()}}
+
+
+def bench_startup(module: str = 'core.game', repeats: int = 3,
+                  budget: float = STARTUP_BUDGET_S) -> Dict:
+    """Cold import time of a module in fresh interpreters, plus any heavy backends it loaded"""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    probe = (f"import sys, time; t = time.perf_counter(); import {module}; "
+             f"print(time.perf_counter() - t); "
+             f"print(','.join(m for m in {_HEAVY_MODULES!r} if m in sys.modules))")
+    env = {**os.environ, 'PYGAME_HIDE_SUPPORT_PROMPT': '1'}
+    times, heavy = [], []
+    for _ in range(repeats):
+        out = subprocess.run([sys.executable, '-c', probe], cwd=root, env=env,
+                             capture_output=True, text=True, check=True).stdout.split('\n')
+        times.append(float(out[0]))
+        heavy = [m for m in out[1].split(',') if m]
+    best = min(times)
+    return {'module': module, 'import_s': best, 'budget_s': budget,
+            'within_budget': best <= budget and not heavy, 'heavy_modules_loaded': heavy}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(boards: List[int], fills: List[float], agents: Optional[List[str]] = None,
+        engine_steps: int = 20_000, positions: int = 20, moves: int = 20,
+        seed: int = 0) -> Dict:
+    factories = _agent_factories()
+    if agents:
+        factories = {name: f for name, f in factories.items() if name in agents}
+
+    results = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+        },
+        'startup': bench_startup(),
+        'engine': [],
+        'vec_engine': [],
+        'agents': [],
+        'flood_fill': [],
+    }
+    for board in boards:
+        results['engine'].append(bench_engine(board, engine_steps, seed))
+        vec = bench_vec_engine(board, 256, max(1, engine_steps // 256), seed)
+        if vec:
+            results['vec_engine'].append(vec)
+        for fill in fills:
+            results['flood_fill'].append(bench_flood_fill(board, fill, positions * moves, seed))
+        for name, factory in factories.items():
+            for fill in fills:
+                results['agents'].append(
+                    bench_agent(name, factory, board, fill, positions, moves, seed))
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark engine throughput and agent decision latency")
+    parser.add_argument('--boards', type=int, nargs='+', default=[10, 20, 30],
+                        help="board sizes in cells per side")
+    parser.add_argument('--fills', type=float, nargs='+', default=[0.0, 0.1, 0.25, 0.5],
+                        help="snake length buckets as a fraction of the board")
+    parser.add_argument('--agents', nargs='+', help="subset of astar, hamiltonian, hybrid, dynamic, rl")
+    parser.add_argument('--engine-steps', type=int, default=20_000)
+    parser.add_argument('--positions', type=int, default=20)
+    parser.add_argument('--moves', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', '-o', help="write JSON results here (default: stdout)")
+    args = parser.parse_args(argv)
+
+    results = run(args.boards, args.fills, args.agents, args.engine_steps,
+                  args.positions, args.moves, args.seed)
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+        startup = results['startup']
+        print(f"startup {startup['module']}: {startup['import_s'] * 1000:.0f}ms "
+              f"(budget {startup['budget_s'] * 1000:.0f}ms)")
+        for row in results['engine']:
+            print(f"engine {row['board']}x{row['board']}: {row['steps_per_sec']:.0f} steps/s")
+        for row in results['agents']:
+            label = f"{row['agent']:12s} {row['board']}x{row['board']} len={row['length']:<4d}"
+            if not row['count']:
+                print(f"{label} no valid positions ({row['invalid_positions']} games ended before reaching the length)")
+                continue
+            print(f"{label} p50={row['p50_us']:.0f}us p99={row['p99_us']:.0f}us "
+                  f"positions={row['positions']} invalid={row['invalid_positions']} deaths={row['deaths']}")
+        for row in results['flood_fill']:
+            print(f"flood fill {row['board']}x{row['board']} len={row['length']:<4d} "
+                  f"bfs={row['bfs']['mean_us']:.0f}us bitboard={row['bitboard']['mean_us']:.0f}us")
+    else:
+        print(text)
+    if not results['startup']['within_budget']:
+        print(f"Startup over budget or loaded heavy backends: {results['startup']}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,297 @@
+import argparse
+import json
+import logging
+import math
+import multiprocessing as mp
+import os
+import sys
+import time
+import types
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from core.constants import AIType, GameSettings
+from core.env import SnakeEnv
+
+# Agent name -> registry type; "rl" may be followed by ":<checkpoint path>"
+AGENT_TYPES = {
+    'astar': AIType.ASTAR,
+    'hamiltonian': AIType.HAMILTONIAN,
+    'hybrid': AIType.HYBRID,
+    'dynamic': AIType.DYNAMIC_HAMILTONIAN,
+    'rl': AIType.REINFORCEMENT_LEARNING,
+}
+
+DEATH_CAUSES = ('wall', 'self', 'starved')
+
+logger = logging.getLogger(__name__)
+
+
+class LatencyHistogram:
+    """Log-bucketed latency counts (10 buckets per decade from 100ns to 10s).
+
+    Workers return bucket counts instead of raw samples, so merging the
+    latencies of thousands of games costs nothing and percentiles stay
+    accurate to about 12%.
+    """
+
+    BUCKETS_PER_DECADE = 10
+    MIN_EXPONENT = -7
+    NUM_BUCKETS = 8 * BUCKETS_PER_DECADE
+
+    def __init__(self, counts: Optional[List[int]] = None):
+        self.counts = counts or [0] * self.NUM_BUCKETS
+
+    def add(self, seconds: float) -> None:
+        index = int((math.log10(max(seconds, 1e-7)) - self.MIN_EXPONENT) * self.BUCKETS_PER_DECADE)
+        self.counts[min(index, self.NUM_BUCKETS - 1)] += 1
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+
+    def percentile(self, pct: float) -> float:
+        """Upper edge of the bucket holding the pct-th percentile, in seconds"""
+        total = sum(self.counts)
+        if not total:
+            return 0.0
+        rank = pct / 100 * total
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return 10 ** (self.MIN_EXPONENT + (index + 1) / self.BUCKETS_PER_DECADE)
+        return 10 ** (self.MIN_EXPONENT + self.NUM_BUCKETS / self.BUCKETS_PER_DECADE)
+
+
+def parse_agent(spec: str) -> Tuple[str, Optional[str]]:
+    """'astar' -> ('astar', None); 'rl:models/model.pth' -> ('rl', 'models/model.pth')"""
+    name, _, checkpoint = spec.partition(':')
+    if name not in AGENT_TYPES:
+        raise argparse.ArgumentTypeError(f"unknown agent {name!r} (choose from {', '.join(AGENT_TYPES)})")
+    if checkpoint and name != 'rl':
+        raise argparse.ArgumentTypeError("only rl agents take a checkpoint")
+    return name, checkpoint or None
+
+
+def parse_board(value: str) -> Tuple[int, int]:
+    """'20' -> (20, 20); '40x30' -> (40, 30)"""
+    try:
+        sizes = [int(v) for v in value.lower().split('x')]
+    except ValueError:
+        sizes = []
+    if len(sizes) not in (1, 2):
+        raise argparse.ArgumentTypeError(f"expected N or WIDTHxHEIGHT, got {value!r}")
+    return sizes[0], sizes[-1]
+
+
+def _make_agent(name: str, checkpoint: Optional[str], env):
+    from ai.registry import create_agent
+
+    if name != 'rl':
+        return create_agent(AGENT_TYPES[name], env)
+
+    import torch
+    from ai.base import SnakeAI
+    # One intra-op thread per worker so the pool scales with cores
+    torch.set_num_threads(1)
+    agent = create_agent(AIType.REINFORCEMENT_LEARNING, env)
+    if checkpoint:
+        state = torch.load(checkpoint, map_location='cpu')
+        agent.model.load_state_dict(state.get('model_state_dict', state))
+    # Greedy evaluation: no exploration, no training
+    agent.config.EPSILON_END = 0.0
+    agent.epsilon = 0.0
+    agent.model.eval()
+    # ... and no end-of-game training step or record checkpoints
+    agent.end_episode = types.MethodType(SnakeAI.end_episode, agent)
+    return agent
+
+
+def play_game(env: SnakeEnv, agent, seed: int, starve_limit: int,
+              latency: LatencyHistogram) -> Dict:
+    """Play one game to the end and describe how it went"""
+    env.reset(seed=seed)
+
+    food_steps = []
+    last_food_step = 0
+    cause = None
+    error = None
+    clock = time.perf_counter
+    while not env.game_over:
+        start = clock()
+        try:
+            move = agent.get_next_move()
+        except Exception as e:
+            # A crash is a bug in the agent, not a loss: log it and keep the
+            # game out of the score statistics
+            logger.exception(f"{type(agent).__name__} crashed on seed {seed} at step {env.steps}")
+            cause = 'error'
+            error = f"{type(e).__name__}: {e}"
+            break
+        latency.add(clock() - start)
+
+        new_head = env.next_head(move or env.snake_direction)
+        score = env.score
+        env.step(move)
+        if env.score != score:
+            food_steps.append(env.steps - last_food_step)
+            last_food_step = env.steps
+        elif env.game_over and not env.won:
+            cause = 'self' if env.snake_pos.in_bounds(new_head) else 'wall'
+        elif env.steps - last_food_step > starve_limit:
+            cause = 'starved'
+            break
+    agent.end_episode(env.score)
+
+    return {
+        'seed': seed,
+        'score': env.score,
+        'steps': env.steps,
+        'won': env.won,
+        'cause': 'won' if env.won else cause,
+        'food_steps': food_steps,
+        'error': error,
+    }
+
+
+def _play_chunk(name: str, checkpoint: Optional[str], board: Tuple[int, int],
+                seeds: List[int], starve_factor: float) -> Tuple[List[Dict], List[int]]:
+    """Worker entry point: one env and agent for a chunk of seeded games"""
+    settings = GameSettings(BOARD_WIDTH=board[0], BOARD_HEIGHT=board[1])
+    env = SnakeEnv(settings)
+    agent = _make_agent(name, checkpoint, env)
+    starve_limit = int(starve_factor * env.width * env.height)
+    latency = LatencyHistogram()
+    games = [play_game(env, agent, seed, starve_limit, latency) for seed in seeds]
+    return games, latency.counts
+
+
+def _quantile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    return sorted_values[min(len(sorted_values) - 1, int(q * len(sorted_values)))]
+
+
+def summarize_agent(games: List[Dict], latency: LatencyHistogram, cells: int) -> Dict:
+    """Statistics of the games played to the end; games where the agent crashed are only counted"""
+    errors = [game for game in games if game['cause'] == 'error']
+    games = [game for game in games if game['cause'] != 'error']
+    scores = sorted(game['score'] for game in games)
+    food_steps = sorted(step for game in games for step in game['food_steps'])
+    causes = Counter(game['cause'] for game in games)
+    return {
+        'games': len(games),
+        'errors': len(errors),
+        'error_seeds': [game['seed'] for game in errors],
+        'score_mean': sum(scores) / len(scores) if scores else 0.0,
+        'score_p10': _quantile(scores, 0.10),
+        'score_median': _quantile(scores, 0.50),
+        'score_p90': _quantile(scores, 0.90),
+        'score_max': scores[-1] if scores else 0,
+        'score_histogram': dict(sorted(Counter(scores).items())),
+        'win_rate': causes['won'] / len(games) if games else 0.0,
+        'mean_fill': (sum(scores) / len(scores) + 1) / cells if scores else 0.0,
+        'steps_per_food_mean': sum(food_steps) / len(food_steps) if food_steps else 0.0,
+        'steps_per_food_median': _quantile(food_steps, 0.50),
+        'death_causes': {cause: causes[cause] for cause in ('won',) + DEATH_CAUSES},
+        'decisions': sum(latency.counts),
+        'latency_p50_us': latency.percentile(50) * 1e6,
+        'latency_p99_us': latency.percentile(99) * 1e6,
+    }
+
+
+def run(agents: List[Tuple[str, Optional[str]]], games: int, board: Tuple[int, int] = (20, 20),
+        seed: int = 0, workers: Optional[int] = None, chunk_size: Optional[int] = None,
+        starve_factor: float = 2.0, per_game: bool = False) -> Dict:
+    """Play the same seeded games with every agent across a process pool"""
+    workers = workers or os.cpu_count() or 1
+    seeds = [seed + i for i in range(games)]
+    # A few chunks per worker keeps the pool busy without paying agent setup per game
+    chunk_size = chunk_size or max(1, math.ceil(games / (workers * 4)))
+    chunks = [seeds[i:i + chunk_size] for i in range(0, games, chunk_size)]
+
+    results = {name if not ckpt else f'{name}:{ckpt}': ([], LatencyHistogram())
+               for name, ckpt in agents}
+    start = time.perf_counter()
+    with ProcessPoolExecutor(workers, mp_context=mp.get_context('spawn')) as pool:
+        futures = {pool.submit(_play_chunk, name, ckpt, board, chunk, starve_factor):
+                   (name if not ckpt else f'{name}:{ckpt}')
+                   for name, ckpt in agents for chunk in chunks}
+        for future in as_completed(futures):
+            played, counts = future.result()
+            agent_games, latency = results[futures[future]]
+            agent_games.extend(played)
+            latency.merge(LatencyHistogram(counts))
+    elapsed = time.perf_counter() - start
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'board': list(board),
+            'games_per_agent': games,
+            'seed': seed,
+            'workers': workers,
+            'starve_limit': int(starve_factor * board[0] * board[1]),
+            'elapsed_s': elapsed,
+        },
+        'agents': {},
+    }
+    for label, (agent_games, latency) in results.items():
+        agent_games.sort(key=lambda game: game['seed'])
+        report['agents'][label] = summarize_agent(agent_games, latency, board[0] * board[1])
+        if per_game:
+            report['agents'][label]['per_game'] = [
+                {key: game[key] for key in ('seed', 'score', 'steps', 'cause', 'error')} for game in agent_games]
+    return report
+
+
+def format_table(report: Dict) -> str:
+    header = (f"{'agent':<14}{'games':>7}{'mean':>8}{'med':>6}{'p90':>6}{'max':>6}{'win%':>7}"
+              f"{'st/food':>9}{'wall':>6}{'self':>6}{'starv':>6}{'err':>5}{'p50us':>8}{'p99us':>8}")
+    lines = [header, '-' * len(header)]
+    for label, row in report['agents'].items():
+        causes = row['death_causes']
+        lines.append(
+            f"{label[:13]:<14}{row['games']:>7}{row['score_mean']:>8.1f}{row['score_median']:>6}"
+            f"{row['score_p90']:>6}{row['score_max']:>6}{row['win_rate'] * 100:>6.1f}%"
+            f"{row['steps_per_food_mean']:>9.1f}{causes['wall']:>6}{causes['self']:>6}"
+            f"{causes['starved']:>6}{row['errors']:>5}"
+            f"{row['latency_p50_us']:>8.0f}{row['latency_p99_us']:>8.0f}")
+    meta = report['meta']
+    lines.append(f"\n{meta['games_per_agent']} games/agent on {meta['board'][0]}x{meta['board'][1]}, "
+                 f"{meta['workers']} workers, {meta['elapsed_s']:.1f}s")
+    return '\n'.join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Headless agent tournament on fixed seeds")
+    parser.add_argument('--agents', type=parse_agent, nargs='+',
+                        default=[('astar', None), ('hamiltonian', None), ('hybrid', None)],
+                        help="astar, hamiltonian, hybrid, dynamic, rl or rl:<checkpoint.pth>")
+    parser.add_argument('--games', '-m', type=int, default=100, help="games per agent")
+    parser.add_argument('--board', type=parse_board, default=(20, 20), help="N or WIDTHxHEIGHT cells")
+    parser.add_argument('--seed', type=int, default=0, help="seed of the first game")
+    parser.add_argument('--workers', type=int, help="worker processes (default: all cores)")
+    parser.add_argument('--starve-factor', type=float, default=2.0,
+                        help="end a game after this many board-sizes of steps without food")
+    parser.add_argument('--per-game', action='store_true', help="include every game in the JSON")
+    parser.add_argument('--output', '-o', help="write JSON results here")
+    args = parser.parse_args(argv)
+
+    report = run(args.agents, args.games, args.board, args.seed, args.workers,
+                 starve_factor=args.starve_factor, per_game=args.per_game)
+    print(format_table(report))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    crashed = {label: row['errors'] for label, row in report['agents'].items() if row['errors']}
+    if crashed:
+        print(f"Agents crashed (games left out of the statistics): {crashed}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
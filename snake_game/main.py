@@ -1,14 +1,31 @@
 # main.py
+import argparse
 import pygame
 import sys
 from core.game import SnakeGame
-from core.constants import GameState
+from core.constants import GameState, GameSettings
 from utils.logger import setup_logger
 
+def parse_board(value: str):
+    """Parse a board size like '200x200' (cells)"""
+    try:
+        width, height = (int(v) for v in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got {value!r}")
+    return width, height
+
 def main():
+    parser = argparse.ArgumentParser(description="Snake game")
+    parser.add_argument('--board', type=parse_board,
+                        help="board size in cells, e.g. 200x200 (default: fill the window)")
+    args = parser.parse_args()
+
     logger = setup_logger()
     try:
-        game = SnakeGame()
+        settings = GameSettings()
+        if args.board:
+            settings.BOARD_WIDTH, settings.BOARD_HEIGHT = args.board
+        game = SnakeGame(settings)
         # Call the run method to start the game loop
         game.run()
     except Exception as e:
@@ -0,0 +1,6 @@
+# replay.py
+import sys
+from core.replay import main
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,55 @@
+"""Seeded games, brute-force searches and tour checks shared by the pathfinding tests"""
+import random
+from collections import deque
+
+from ai.pathfinding.astar import AStarPathfinder
+from core.constants import Direction, GameSettings
+from core.env import SnakeEnv
+
+
+def passable(body, cell):
+    """The rule every search shares: free cells and the tail"""
+    return not body.occupied[cell] or cell == body.cell_id(body.tail)
+
+
+def bfs(body, width, height, start):
+    """Brute-force distances from start through passable cells, by coordinates"""
+    dist = {start: 0}
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        x, y = cell % width, cell // width
+        for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            neighbor = ny * width + nx
+            if 0 <= nx < width and 0 <= ny < height and neighbor not in dist and passable(body, neighbor):
+                dist[neighbor] = dist[cell] + 1
+                queue.append(neighbor)
+    return dist
+
+
+def seeded_games(width, height, games=12, max_steps=3000, explore=0.02):
+    """Yield the env at every tick of seeded games, mostly played to the food"""
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=width, BOARD_HEIGHT=height))
+    agent = AStarPathfinder(env)
+    for seed in range(games):
+        env.reset(seed=seed)
+        agent.end_episode(env.score)
+        rng = random.Random(seed)
+        while not env.game_over and env.food_pos is not None and env.steps < max_steps:
+            yield env
+            if rng.random() < explore:
+                env.step(rng.choice(list(Direction)))
+            else:
+                env.step(agent.get_next_move())
+
+
+def adjacent(width, a, b):
+    return abs(a % width - b % width) + abs(a // width - b // width) == 1
+
+
+def assert_closed_tour(width, height, order, skipped):
+    """order visits every cell but skipped once, each step to a neighbor, and closes"""
+    covered = sorted(order + ([skipped] if skipped >= 0 else []))
+    assert covered == list(range(width * height))
+    for i, cell in enumerate(order):
+        assert adjacent(width, cell, order[(i + 1) % len(order)])
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+
+from ai.pathfinding.astar import AStarPathfinder
+from core.constants import Direction, GameSettings
+from core.env import SnakeEnv
+from boards import bfs, passable, seeded_games
+
+
+def check_path(agent, body, start, goal, expected):
+    path = agent.find_cell_path(start, goal)
+    assert len(path) == expected.get(goal, -1) + 1
+    if path:
+        assert path[0] == start and path[-1] == goal
+        adjacency = agent.topology.adjacency
+        for a, b in zip(path, path[1:]):
+            assert b in adjacency[a] and passable(body, b)
+
+
+@pytest.mark.parametrize('width,height', [(12, 9), (7, 5)])
+def test_paths_are_shortest(width, height):
+    """A* from the head to the food, the tail and random cells matches BFS"""
+    agent = None
+    rng = random.Random(0)
+    for env in seeded_games(width, height):
+        agent = agent or AStarPathfinder(env)
+        body = env.snake_pos
+        start = body.cell_id(body.head)
+        expected = bfs(body, width, height, start)
+        goals = [body.cell_id(env.food_pos), body.cell_id(body.tail)]
+        goals += rng.sample(range(width * height), 3)
+        for goal in goals:
+            check_path(agent, body, start, goal, expected)
+        food_path = agent.find_path(body.head, env.food_pos)
+        assert food_path[-1:] == ([env.food_pos] if goals[0] in expected else [])
+
+
+def test_paths_around_a_wall_on_a_200x200_board():
+    size = 200
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=size, BOARD_HEIGHT=size), seed=0)
+    g = env.grid_size
+    # A wall down the middle column; the tail at its foot moves away, so
+    # the way around passes through the bottom two rows
+    env.place_snake([(100 * g, y * g) for y in range(size - 1)], Direction.UP)
+    agent = AStarPathfinder(env)
+    body = env.snake_pos
+    for start, goal in [(0, size - 1), (0, size * size - 1), (size * size - 1, 150)]:
+        check_path(agent, body, start, goal, bfs(body, size, size, start))
+    assert len(agent.find_cell_path(0, size - 1)) == 199 + 2 * 198 + 1
+
+    # The agent follows A* paths on the big board too
+    for _ in range(3):
+        score = env.score
+        while env.score == score:
+            env.step(agent.get_next_move())
+            assert not env.game_over
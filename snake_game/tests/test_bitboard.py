@@ -0,0 +1,34 @@
+import pytest
+
+from core.bitboard import Bitboard, BoardBits
+from boards import bfs, passable, seeded_games
+
+
+@pytest.mark.parametrize('width,height', [(12, 9), (7, 5)])
+def test_bitboard_flood_fill_matches_bfs(width, height):
+    bitboard = Bitboard(width, height)
+    for env in seeded_games(width, height):
+        body = env.snake_pos
+        bits = BoardBits(bitboard, body)
+        from_tail = bfs(body, width, height, body.cell_id(body.tail))
+        component_size, components = {}, []
+        for cell in range(width * height):
+            assert bits.is_blocked(cell) == (not passable(body, cell))
+            if passable(body, cell):
+                if cell not in component_size:
+                    reached = bfs(body, width, height, cell)
+                    component_size.update(dict.fromkeys(reached, len(reached)))
+                    components.append(len(reached))
+                assert bits.free_squares(cell) == component_size[cell]
+                assert bits.reaches_tail(cell) == (cell in from_tail)
+        regions = bitboard.regions(bits.passable)
+        assert sorted(Bitboard.count(region) for region in regions) == sorted(components)
+
+
+def test_moves_do_not_wrap_around_rows():
+    bitboard = Bitboard(4, 3)
+    right_edge = 1 << 3
+    # Growing the top-right cell reaches its row and the cell below, never row 1's first cell
+    assert bitboard.expand(right_edge) == (1 << 2) | (1 << 3) | (1 << 7)
+    assert bitboard.flood_fill(1 << 0, bitboard.full) == bitboard.full
+    assert bitboard.from_occupancy(bytearray([1, 0, 0, 1] + [0] * 8)) == 0b1001
@@ -0,0 +1,37 @@
+import pytest
+
+from ai.pathfinding.cycles import hamiltonian_cycle
+from ai.pathfinding.hamilton import HamiltonianPathfinder
+from core.constants import GameSettings
+from core.env import SnakeEnv
+from boards import adjacent, assert_closed_tour
+
+
+@pytest.mark.parametrize('width', range(2, 10))
+@pytest.mark.parametrize('height', range(2, 10))
+def test_hamiltonian_cycle_is_a_closed_tour(width, height):
+    cycle = hamiltonian_cycle(width, height)
+    odd = width % 2 == 1 and height % 2 == 1
+    assert cycle.length == width * height - odd
+    assert (cycle.skipped >= 0) == odd
+    assert_closed_tour(width, height, cycle.order_list, cycle.skipped)
+    for i, cell in enumerate(cycle.order_list):
+        assert cycle.index_list[cell] == i
+    if odd:
+        # The left-out corner sits between the detour entry and its successor
+        entry, after = cycle.detour_entry, cycle.next_list[cycle.skipped]
+        assert adjacent(width, entry, cycle.skipped) and adjacent(width, cycle.skipped, after)
+        assert cycle.distance(entry, cycle.skipped) == 1
+        assert cycle.distance(cycle.skipped, after) == 1
+
+
+@pytest.mark.parametrize('width,height', [(3, 3), (5, 5), (5, 3), (4, 4)])
+def test_hamiltonian_agent_wins_every_seed(width, height):
+    """Shortcuts never stall the snake, including around the left-out corner"""
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=width, BOARD_HEIGHT=height))
+    agent = HamiltonianPathfinder(env)
+    for seed in range(40):
+        env.reset(seed=seed)
+        while not env.game_over and env.steps < 50 * width * height:
+            env.step(agent.get_next_move())
+        assert env.won, f"seed {seed}: score {env.score} after {env.steps} steps"
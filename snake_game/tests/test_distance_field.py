@@ -0,0 +1,64 @@
+import pytest
+
+from ai.pathfinding.astar import AStarPathfinder
+from ai.pathfinding.distance_field import DistanceField
+from core.constants import Direction, GameSettings
+from core.env import SnakeEnv
+from core.grid import grid_topology
+from boards import bfs, passable, seeded_games
+
+
+@pytest.mark.parametrize('width,height', [(12, 9), (7, 5)])
+def test_distance_field_matches_bfs(width, height):
+    field = DistanceField(grid_topology(width, height, GameSettings().GRID_SIZE))
+    adjacency = field.topology.adjacency
+    for env in seeded_games(width, height):
+        body = env.snake_pos
+        field.compute(body)
+        expected = bfs(body, width, height, body.cell_id(body.head))
+        for cell in range(width * height):
+            assert field.distance(cell) == expected.get(cell, -1)
+            path = field.cell_path(cell)
+            assert len(path) == expected.get(cell, -1) + 1
+            for a, b in zip(path, path[1:]):
+                assert b in adjacency[a] and passable(body, b)
+
+
+class CountingAStar(AStarPathfinder):
+    searches = 0
+
+    def find_cell_path(self, start, goal):
+        self.searches += 1
+        return super().find_cell_path(start, goal)
+
+
+def test_astar_reads_a_shared_field_before_searching():
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=10, BOARD_HEIGHT=8), seed=4)
+    agent = CountingAStar(env)
+    agent.get_next_move()
+    assert agent.searches == 1 and agent.distances.cached(env) is None
+
+    # Another agent's field for this tick answers the food path
+    env.step(Direction.UP)
+    agent.end_episode(env.score)
+    shared = DistanceField(agent.topology).for_tick(env)
+    move = agent.get_next_move()
+    assert agent.searches == 1
+    assert agent.distances.cached(env) is shared
+    expected = shared.path(env.food_pos)[1]
+    assert agent.topology.move(agent.topology.cell_id(env.snake_pos.head), move) == \
+        agent.topology.cell_id(expected)
+
+
+def test_astar_falls_back_to_the_tail_through_the_tick_field():
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=5, BOARD_HEIGHT=5), seed=0)
+    g = env.grid_size
+    # The body walls off the top-left corner, where the food is placed
+    cells = [(2, 2), (2, 1), (2, 0), (1, 0), (1, 1), (0, 1), (0, 2)]
+    env.place_snake([(x * g, y * g) for x, y in cells], Direction.DOWN)
+    env.food_pos = (0, 0)
+    agent = AStarPathfinder(env)
+    move = agent.get_next_move()
+    field = agent.distances.cached(env)
+    assert field is not None and field.path(env.food_pos) == []
+    assert move == Direction.LEFT  # (1, 2) then the tail at (0, 2)
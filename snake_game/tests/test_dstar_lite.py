@@ -0,0 +1,36 @@
+import pytest
+
+from ai.pathfinding.dstar_lite import DStarLitePlanner
+from ai.pathfinding.hybrid import HybridPathfinder
+from core.constants import GameSettings
+from core.env import SnakeEnv
+from evaluation.tournament import LatencyHistogram, play_game
+from boards import bfs, seeded_games
+
+
+@pytest.mark.parametrize('width,height', [(12, 9), (7, 5)])
+def test_dstar_lite_paths_are_shortest(width, height):
+    planner = None
+    for env in seeded_games(width, height):
+        planner = planner or DStarLitePlanner(env)
+        body = env.snake_pos
+        distance = bfs(body, width, height, body.cell_id(body.head)).get(body.cell_id(env.food_pos))
+        next_cell = planner.next_cell()
+        if distance is None:
+            assert next_cell is None
+            assert planner.path() == []
+        else:
+            assert next_cell is not None
+            path = planner.path()
+            assert path[0] == body.head and path[-1] == env.food_pos
+            assert len(path) - 1 == distance
+
+
+def test_hybrid_never_walls_itself_in():
+    """Food paths that would cut the head off from the tail are not taken"""
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=10, BOARD_HEIGHT=10))
+    agent = HybridPathfinder(env)
+    for seed in range(4):
+        game = play_game(env, agent, seed, 200, LatencyHistogram())
+        assert game['cause'] in ('won', 'starved')
+        assert game['score'] >= 50
@@ -0,0 +1,29 @@
+import pytest
+
+from ai.pathfinding.dynamic_cycle import DynamicHamiltonianPathfinder
+from core.constants import GameSettings
+from core.env import SnakeEnv
+from boards import assert_closed_tour
+
+
+@pytest.mark.parametrize('width,height', [(6, 6), (8, 5), (5, 5), (7, 9)])
+def test_dynamic_cycle_splices_keep_the_invariant(width, height):
+    """After every splice the cycle is still a tour and the body lies along it behind the head"""
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=width, BOARD_HEIGHT=height))
+    agent = DynamicHamiltonianPathfinder(env)
+    for seed in range(4):
+        env.reset(seed=seed)
+        while not env.game_over:
+            env.step(agent.get_next_move())
+            if env.game_over:
+                break
+            order, index = agent.order, agent.index
+            assert_closed_tour(width, height, order, agent.skipped)
+            for i, cell in enumerate(order):
+                assert index[cell] == i
+            body = [env.snake_pos.cell_id(position) for position in env.snake_pos]
+            head = index[body[0]]
+            for offset, cell in enumerate(body):
+                assert index[cell] == (head - offset) % len(order)
+        assert env.won
+    assert agent.splices > 0
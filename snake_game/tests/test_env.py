@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+
+from core.constants import Direction, GameSettings, RewardSettings
+from core.env import SnakeEnv
+
+CYCLE_2X2 = {(1, 1): Direction.UP, (1, 0): Direction.LEFT, (0, 0): Direction.DOWN, (0, 1): Direction.RIGHT}
+
+
+def test_env_imports_without_pygame():
+    probe = "import sys, core.env; print('pygame' in sys.modules)"
+    out = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True,
+                         cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__)))).stdout
+    assert out.strip() == 'False'
+
+
+def test_same_seed_replays_the_same_game():
+    def play(seed):
+        env = SnakeEnv(GameSettings(BOARD_WIDTH=8, BOARD_HEIGHT=8), seed=seed)
+        moves = [Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.UP]
+        trace = []
+        for i in range(200):
+            reward, done, score = env.step(moves[i // 3 % 4])
+            trace.append((reward, done, score, env.food_pos, tuple(env.snake_pos)))
+            if done:
+                env.reset()
+        return trace
+
+    assert play(7) == play(7)
+    assert play(7) != play(8)
+
+
+def test_step_eats_grows_and_dies_at_the_wall():
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=5, BOARD_HEIGHT=5), seed=0)
+    g = env.grid_size
+    env.food_pos = (3 * g, 2 * g)
+    reward, done, score = env.step(Direction.RIGHT)
+    assert (reward, done, score) == (RewardSettings.REWARD_EAT, False, 1)
+    assert list(env.snake_pos) == [(3 * g, 2 * g), (2 * g, 2 * g)]
+
+    env.food_pos = (0, 0)
+    env.step(Direction.RIGHT)
+    reward, done, score = env.step(Direction.RIGHT)
+    assert (reward, done, score) == (RewardSettings.REWARD_DEATH, True, 1)
+    assert env.game_over and not env.won
+
+
+def test_filling_the_board_wins():
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=2, BOARD_HEIGHT=2), seed=3)
+    g = env.grid_size
+    while not env.game_over:
+        head = env.snake_pos.head
+        env.step(CYCLE_2X2[(head[0] // g, head[1] // g)])
+    assert env.won
+    assert env.score == 3 and env.food_pos is None
@@ -0,0 +1,20 @@
+import pytest
+
+from core.constants import Direction
+from core.grid import grid_topology
+
+
+@pytest.mark.parametrize('width,height', [(7, 5), (1, 6), (6, 1), (2, 2)])
+def test_moves_and_directions_agree(width, height):
+    topology = grid_topology(width, height, 20)
+    for cell in range(width * height):
+        position = topology.cell_position(cell)
+        assert topology.cell_id(position) == cell
+        assert position == (cell % width * 20, cell // width * 20)
+        neighbors = []
+        for direction in Direction:
+            neighbor = topology.move(cell, direction)
+            if neighbor >= 0:
+                assert topology.direction_between(cell, neighbor) == direction
+                neighbors.append(neighbor)
+        assert sorted(neighbors) == sorted(topology.adjacency[cell])
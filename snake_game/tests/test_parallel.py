@@ -0,0 +1,91 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+import torch
+
+from ai.reinforcement.model import SnakeNN
+from ai.reinforcement.parallel import STATE_SIZE, SharedTransitionBuffer, SharedWeights
+
+
+@pytest.fixture
+def buffer():
+    buffer = SharedTransitionBuffer(num_workers=2, capacity=8)
+    yield buffer
+    buffer.close()
+
+
+def write_rows(buffer, worker, first, count):
+    """Transitions whose reward is their row number, so reads can be traced"""
+    rows = np.arange(first, first + count)
+    states = np.repeat(rows[:, None], STATE_SIZE, axis=1).astype(np.float32)
+    buffer.write(worker, states, rows % 3, rows.astype(np.float32), states + 1, rows % 2 == 0)
+
+
+def test_transition_buffer_reads_each_row_once(buffer):
+    write_rows(buffer, 0, 0, 3)
+    write_rows(buffer, 1, 100, 2)
+    states, actions, rewards, next_states, dones = buffer.read_new()
+    assert rewards.tolist() == [0, 1, 2, 100, 101]
+    assert (states[:, 0] == rewards).all() and (next_states[:, 0] == rewards + 1).all()
+    assert actions.tolist() == [0, 1, 2, 1, 2] and dones.tolist() == [True, False, True, True, False]
+    assert len(buffer.read_new()[0]) == 0
+
+    # Wraps around the ring
+    write_rows(buffer, 0, 3, 7)
+    assert buffer.read_new()[2].tolist() == list(range(3, 10))
+
+
+def test_transition_buffer_skips_rows_a_worker_lapped(buffer):
+    write_rows(buffer, 0, 0, 12)
+    assert buffer.read_new()[2].tolist() == list(range(4, 12))
+
+
+def test_transition_buffer_drops_rows_overwritten_during_the_copy(buffer):
+    write_rows(buffer, 0, 0, 8)
+    # A worker has claimed four more rows and may be overwriting rows 0-3
+    buffer.reserved[0] = 12
+    assert buffer.read_new()[2].tolist() == [4, 5, 6, 7]
+
+
+def test_shared_weights_copy_only_newer_versions():
+    source, target = SnakeNN(STATE_SIZE, 256, 3), SnakeNN(STATE_SIZE, 256, 3)
+    weights = SharedWeights(sum(p.numel() for p in source.parameters()))
+    try:
+        weights.publish(source, 0.25)
+        version, epsilon = weights.load_into(target, -1)
+        assert version % 2 == 0 and epsilon == 0.25
+        for a, b in zip(source.parameters(), target.parameters()):
+            assert torch.equal(a, b)
+
+        with torch.no_grad():
+            next(target.parameters()).add_(1.0)
+        assert weights.load_into(target, version) == (version, 0.25)
+        assert not torch.equal(next(source.parameters()), next(target.parameters()))
+    finally:
+        weights.close()
+
+
+def test_shared_weights_readers_wait_out_a_publish():
+    source, target = SnakeNN(STATE_SIZE, 256, 3), SnakeNN(STATE_SIZE, 256, 3)
+    weights = SharedWeights(sum(p.numel() for p in source.parameters()))
+    try:
+        # Simulate a publish in progress: odd version, half-written parameters
+        weights.version[0] = 1
+        weights.params[:] = 0
+
+        def finish():
+            time.sleep(0.05)
+            weights.params[:] = torch.nn.utils.parameters_to_vector(source.parameters()).detach().numpy()
+            weights.epsilon[0] = 0.5
+            weights.version[0] = 2
+
+        writer = threading.Thread(target=finish)
+        writer.start()
+        assert weights.load_into(target, 0) == (2, 0.5)
+        writer.join()
+        for a, b in zip(source.parameters(), target.parameters()):
+            assert torch.equal(a, b)
+    finally:
+        weights.close()
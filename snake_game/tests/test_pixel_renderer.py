@@ -0,0 +1,81 @@
+import random
+
+import numpy as np
+import pytest
+
+from core.constants import Direction, GameSettings
+from core.env import SnakeEnv
+from core.pixel_renderer import PixelRenderer
+from core.vec_env import VecSnakeEnv
+
+WIDTH, HEIGHT = 7, 5
+HEAD = (250, 200, 0)
+
+
+def reference_frame(renderer, cells, head, food):
+    """Paint one board cell by cell: the obvious loop the renderer must match"""
+    px = renderer.cell_px
+    frame = np.zeros(renderer.frame_shape, dtype=np.uint8)
+    for cell in range(renderer.width * renderer.height):
+        label = 0
+        if cell in cells:
+            label = 3 if renderer.mark_head and cell == head else 1
+        if cell == food:
+            label = 2
+        y, x = divmod(cell, renderer.width)
+        frame[y * px:(y + 1) * px, x * px:(x + 1) * px] = renderer.palette[label]
+    return frame
+
+
+def played_envs(count, steps):
+    settings = GameSettings(BOARD_WIDTH=WIDTH, BOARD_HEIGHT=HEIGHT)
+    rng = random.Random(0)
+    envs = []
+    for seed in range(count):
+        env = SnakeEnv(settings, seed=seed)
+        for _ in range(steps * seed):
+            if env.step(rng.choice(list(Direction)))[1]:
+                env.reset()
+        envs.append(env)
+    return envs
+
+
+@pytest.mark.parametrize('cell_px', [1, 2, 3])
+@pytest.mark.parametrize('grayscale,head_color', [(False, None), (False, HEAD), (True, HEAD)])
+def test_render_envs_matches_reference(cell_px, grayscale, head_color):
+    renderer = PixelRenderer(WIDTH, HEIGHT, cell_px, grayscale=grayscale, head_color=head_color)
+    envs = played_envs(4, 15)
+    frames = renderer.render_envs(envs)
+    assert frames.shape == (4, HEIGHT * cell_px, WIDTH * cell_px, 1 if grayscale else 3)
+    for env, frame in zip(envs, frames):
+        body = env.snake_pos
+        cells = {body.cell_id(p) for p in body}
+        food = body.cell_id(env.food_pos) if env.food_pos is not None else None
+        expected = reference_frame(renderer, cells, body.cell_id(body.head), food)
+        np.testing.assert_array_equal(frame, expected)
+
+
+@pytest.mark.parametrize('cell_px', [1, 3])
+def test_render_vec_matches_reference(cell_px):
+    vec = VecSnakeEnv(5, GameSettings(BOARD_WIDTH=WIDTH, BOARD_HEIGHT=HEIGHT), seed=2)
+    rng = np.random.default_rng(0)
+    renderer = PixelRenderer(WIDTH, HEIGHT, cell_px, head_color=HEAD)
+    out = renderer.allocate(vec.num_envs)
+    for _ in range(30):
+        vec.step(rng.integers(0, 3, vec.num_envs))
+        assert renderer.render_vec(vec, out=out) is out
+        for board in range(vec.num_envs):
+            cells = vec.snake_cells(board)
+            food = int(vec.food[board]) if vec.food[board] >= 0 else None
+            expected = reference_frame(renderer, set(cells.tolist()), int(cells[0]), food)
+            np.testing.assert_array_equal(out[board], expected)
+
+
+def test_non_contiguous_out_is_rejected():
+    renderer = PixelRenderer(WIDTH, HEIGHT, cell_px=2)
+    envs = played_envs(2, 5)
+    wide = np.zeros((2,) + renderer.frame_shape[:2] + (6,), dtype=np.uint8)
+    with pytest.raises(ValueError, match='C-contiguous'):
+        renderer.render_envs(envs, out=wide[..., ::2])
+    with pytest.raises(ValueError, match='shape'):
+        renderer.render_envs(envs, out=renderer.allocate(3))
@@ -0,0 +1,20 @@
+import pytest
+
+from ai.pathfinding.reachability import TailReachability
+from core.constants import GameSettings
+from core.grid import grid_topology
+from boards import bfs, seeded_games
+
+
+@pytest.mark.parametrize('width,height', [(12, 9), (7, 5)])
+def test_tail_reachability_matches_bfs(width, height):
+    reachability = None
+    positions = grid_topology(width, height, GameSettings().GRID_SIZE).positions
+    for env in seeded_games(width, height):
+        # Carried over tick to tick; the env is the same object throughout
+        reachability = reachability or TailReachability(env)
+        body = env.snake_pos
+        from_tail = bfs(body, width, height, body.cell_id(body.tail))
+        for cell in range(width * height):
+            if not body.occupied[cell]:
+                assert reachability.reachable(positions[cell]) == (cell in from_tail)
@@ -0,0 +1,99 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import numpy as np
+import pygame
+import pytest
+
+from ai.pathfinding.astar import AStarPathfinder
+from core.constants import GameSettings
+from core.env import SnakeEnv
+from core.renderer import BoardRenderer
+from core.theme import ThemeManager
+
+WINDOW, GRID = 600, 20
+
+
+def pixels(surface):
+    return pygame.surfarray.array3d(surface)
+
+
+def full_redraw(renderer, env, theme):
+    """A fresh renderer drawing the whole board through the same camera"""
+    reference = BoardRenderer(WINDOW, GRID)
+    reference.sync(env, theme)
+    reference.camera = renderer.camera
+    reference.invalidate()
+    reference.sync(env, theme)
+    assert reference.camera == renderer.camera
+    return pixels(reference.surface)
+
+
+def play(board, seed):
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=board, BOARD_HEIGHT=board), seed=seed)
+    agent = AStarPathfinder(env)
+    while True:
+        yield env
+        env.step(agent.get_next_move())
+        if env.game_over:
+            env.reset()
+
+
+def test_incremental_frames_repaint_only_changed_cells():
+    theme = ThemeManager.get_default_theme()
+    renderer = BoardRenderer(WINDOW, GRID)
+    games = play(WINDOW // GRID, seed=0)
+    env = next(games)
+    assert renderer.sync(env, theme) == [renderer.rect]
+    incremental = 0
+
+    for frame in range(200):
+        before = pixels(renderer.surface)
+        body = env.snake_pos
+        env = next(games)
+        # Some frames cover several ticks, as when the loop falls behind
+        if frame % 7 == 0:
+            env = next(games)
+        rects = renderer.sync(env, theme)
+
+        after = pixels(renderer.surface)
+        if env.snake_pos is body:
+            incremental += 1
+            assert 0 < len(rects) <= 6
+            allowed = np.zeros(after.shape[:2], dtype=bool)
+            for rect in rects:
+                allowed[rect.x:rect.right, rect.y:rect.bottom] = True
+            changed = (before != after).any(axis=2)
+            assert not (changed & ~allowed).any()
+        if frame % 25 == 0:
+            assert np.array_equal(after, full_redraw(renderer, env, theme))
+    assert incremental > 150
+
+
+def test_theme_switch_redraws_the_whole_board():
+    themes = list(ThemeManager.get_themes().values())
+    renderer = BoardRenderer(WINDOW, GRID)
+    env = next(play(WINDOW // GRID, seed=1))
+    renderer.sync(env, themes[0])
+    assert renderer.sync(env, themes[1]) == [renderer.rect]
+    assert np.array_equal(pixels(renderer.surface), full_redraw(renderer, env, themes[1]))
+
+
+@pytest.mark.parametrize('board', [100, 45])
+def test_viewport_scrolls_with_the_head(board):
+    theme = ThemeManager.get_default_theme()
+    renderer = BoardRenderer(WINDOW, GRID)
+    games = play(board, seed=2)
+    cameras = set()
+    for frame in range(1500):
+        env = next(games)
+        renderer.sync(env, theme)
+        assert renderer.scrolling and renderer.view_size == (WINDOW // GRID, WINDOW // GRID)
+        head_x = env.snake_pos.head[0] // GRID - renderer.camera[0]
+        head_y = env.snake_pos.head[1] // GRID - renderer.camera[1]
+        assert 0 <= head_x < renderer.view_size[0] and 0 <= head_y < renderer.view_size[1]
+        cameras.add(renderer.camera)
+        if frame % 20 == 0:
+            assert np.array_equal(pixels(renderer.surface), full_redraw(renderer, env, theme))
+    assert len(cameras) > 10
@@ -0,0 +1,38 @@
+import random
+
+import pytest
+
+from ai.pathfinding.astar import AStarPathfinder
+from core.constants import Direction, GameSettings
+from core.env import SnakeEnv
+from core.replay import Replay, simulate
+
+
+@pytest.mark.parametrize('seed', [0, 1, 2])
+def test_saved_replay_reproduces_the_game(tmp_path, seed):
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=10, BOARD_HEIGHT=8), seed=seed, record=True)
+    agent = AStarPathfinder(env)
+    rng = random.Random(seed)
+    while not env.game_over and env.steps < 2000:
+        # Mostly chase the food, with some random moves so games also end in deaths
+        env.step(agent.get_next_move() if rng.random() < 0.95 else rng.choice(list(Direction)))
+    path = tmp_path / 'game.snkr'
+    env.save_replay(str(path))
+
+    replay = Replay.load(str(path))
+    assert (replay.width, replay.height, replay.seed) == (10, 8, env.episode_seed)
+    assert len(replay) == env.steps
+    replayed = simulate(replay)
+    assert (replayed.score, replayed.steps, replayed.game_over, replayed.won) == \
+        (env.score, env.steps, env.game_over, env.won)
+    assert list(replayed.snake_pos) == list(env.snake_pos)
+    assert replayed.food_pos == env.food_pos
+
+
+def test_replay_rejects_foreign_and_truncated_files():
+    data = Replay(5, 5, 42, [Direction.UP.value] * 3).to_bytes()
+    assert Replay.from_bytes(data).actions == bytearray([Direction.UP.value] * 3)
+    with pytest.raises(ValueError):
+        Replay.from_bytes(b'XXXX' + data[4:])
+    with pytest.raises(ValueError):
+        Replay.from_bytes(data[:-1])
@@ -0,0 +1,8 @@
+from evaluation.benchmark import STARTUP_BUDGET_S, bench_startup
+
+
+def test_manual_game_imports_within_budget_without_heavy_backends():
+    result = bench_startup('core.game')
+    assert result['heavy_modules_loaded'] == []
+    assert result['import_s'] <= STARTUP_BUDGET_S
+    assert result['within_budget']
@@ -0,0 +1,64 @@
+import random
+
+from core.constants import Direction, GameSettings
+from core.env import SnakeEnv
+from core.state import SnakeState
+
+CLOCKWISE = [Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.UP]
+
+
+def random_walk(state, rng, moves):
+    for _ in range(moves):
+        if not state.step(rng.choice(CLOCKWISE)):
+            break
+
+
+def state_fields(state):
+    return (list(state.body), bytes(state.body.occupied), state.body.free_count,
+            state.direction, state.food_pos, state.score, state.game_over, state.won)
+
+
+def test_snake_state_restore_undoes_every_step():
+    settings = GameSettings(BOARD_WIDTH=8, BOARD_HEIGHT=6)
+    env = SnakeEnv(settings, seed=3)
+    rng = random.Random(3)
+    for seed in range(20):
+        env.reset(seed=seed)
+        state = SnakeState.from_game(env)
+        while not state.game_over:
+            before = state_fields(state)
+            snapshot = state.snapshot()
+            # Nested branches, each rolled back to where it started
+            random_walk(state, rng, rng.randint(1, 12))
+            inner = state.snapshot()
+            inner_fields = state_fields(state)
+            random_walk(state, rng, rng.randint(1, 12))
+            state.restore(inner)
+            assert state_fields(state) == inner_fields
+            state.restore(snapshot)
+            assert state_fields(state) == before
+            state.step(rng.choice(CLOCKWISE))
+
+
+def test_snake_state_steps_like_the_env():
+    """Forked states move, grow and die exactly as the engine does"""
+    settings = GameSettings(BOARD_WIDTH=8, BOARD_HEIGHT=6)
+    env = SnakeEnv(settings, seed=5)
+    rng = random.Random(5)
+    for seed in range(20):
+        env.reset(seed=seed)
+        while not env.game_over:
+            direction = rng.choice(CLOCKWISE)
+            before = list(env.snake_pos)
+            state = SnakeState.from_game(env)
+            clone = state.clone()
+            alive = state.step(direction)
+            env.step(direction)
+            assert alive == (not env.game_over or env.won)
+            assert state.game_over == env.game_over
+            assert state.score == env.score
+            if not env.game_over or env.won:
+                assert list(state.body) == list(env.snake_pos)
+                assert state.body.occupied == env.snake_pos.occupied
+            # The clone shares nothing with the state it was taken from
+            assert list(clone.body) == before
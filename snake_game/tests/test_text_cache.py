@@ -0,0 +1,49 @@
+import os
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+import pytest
+
+from core.text_cache import TextCache
+
+
+@pytest.fixture(autouse=True)
+def fonts():
+    pygame.font.init()
+    yield
+
+
+def test_render_is_keyed_by_size_text_and_color():
+    cache = TextCache()
+    label = cache.render('Score: 3', 24, (255, 255, 255))
+    assert cache.render('Score: 3', 24, [255, 255, 255]) is label
+    assert cache.render('Score: 3', 36, (255, 255, 255)) is not label
+    assert cache.render('Score: 4', 24, (255, 255, 255)) is not label
+    assert cache.render('Score: 3', 24, (255, 0, 0)) is not label
+    assert cache.render('Score: 3', 24, (255, 255, 255)) is label
+    assert len(cache._texts) == 4
+
+
+def test_least_recently_used_text_is_evicted_first():
+    cache = TextCache(max_entries=3)
+    white = (255, 255, 255)
+    a = cache.render('a', 20, white)
+    b = cache.render('b', 20, white)
+    cache.render('c', 20, white)
+    assert cache.render('a', 20, white) is a     # 'a' is now the most recent
+    cache.render('d', 20, white)                 # evicts 'b'
+    assert len(cache._texts) == 3
+    assert cache.render('a', 20, white) is a
+    assert cache.render('b', 20, white) is not b
+
+
+def test_layers_are_built_once_per_key():
+    cache = TextCache()
+    calls = []
+    first = cache.layer(('menu', 'dark'), (10, 10), calls.append)
+    assert cache.layer(('menu', 'dark'), (10, 10), calls.append) is first
+    assert cache.layer(('menu', 'light'), (10, 10), calls.append) is not first
+    assert len(calls) == 2
+    cache.clear()
+    assert cache.layer(('menu', 'dark'), (10, 10), calls.append) is not first
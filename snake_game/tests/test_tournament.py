@@ -0,0 +1,33 @@
+from ai.registry import create_agent
+from core.constants import AIType, GameSettings
+from core.env import SnakeEnv
+from evaluation.tournament import LatencyHistogram, play_game, run
+
+AGENTS = [('astar', None), ('hamiltonian', None)]
+
+
+def test_same_seeds_give_the_same_results():
+    first = run(AGENTS, games=4, board=(8, 6), seed=3, workers=2, chunk_size=1, per_game=True)
+    second = run(AGENTS, games=4, board=(8, 6), seed=3, workers=1, per_game=True)
+
+    assert set(first['agents']) == {'astar', 'hamiltonian'}
+    assert first['meta']['board'] == [8, 6] and first['meta']['starve_limit'] == 96
+    for label, row in first['agents'].items():
+        assert row['games'] + row['errors'] == 4 and row['errors'] == 0
+        assert [game['seed'] for game in row['per_game']] == [3, 4, 5, 6]
+        assert sum(row['death_causes'].values()) == 4
+        assert 0.0 <= row['win_rate'] <= 1.0 and row['decisions'] > 0
+        assert row['per_game'] == second['agents'][label]['per_game']
+        assert row['score_histogram'] == second['agents'][label]['score_histogram']
+
+
+def test_agent_state_does_not_leak_between_games():
+    """Replaying a seed after other games plays it exactly as a fresh agent would"""
+    def fresh(seed):
+        env = SnakeEnv(GameSettings(BOARD_WIDTH=8, BOARD_HEIGHT=6))
+        return play_game(env, create_agent(AIType.ASTAR, env), seed, 96, LatencyHistogram())
+
+    env = SnakeEnv(GameSettings(BOARD_WIDTH=8, BOARD_HEIGHT=6))
+    agent = create_agent(AIType.ASTAR, env)
+    games = [play_game(env, agent, seed, 96, LatencyHistogram()) for seed in (0, 1, 2)]
+    assert games == [fresh(seed) for seed in (0, 1, 2)]
@@ -0,0 +1,62 @@
+import random
+
+import numpy as np
+import pytest
+
+from ai.base import SnakeAI
+from core.constants import Direction, GameSettings
+from core.env import SnakeEnv
+from core.vec_env import VecSnakeEnv
+
+CLOCKWISE = [Direction.RIGHT, Direction.DOWN, Direction.LEFT, Direction.UP]
+
+
+class StateReader(SnakeAI):
+    """Exposes SnakeAI.get_state for an env; never asked for moves"""
+
+    def get_next_move(self):
+        raise NotImplementedError
+
+
+def cell_positions(cells, width, grid_size):
+    return [(cell % width * grid_size, cell // width * grid_size) for cell in cells]
+
+
+@pytest.mark.parametrize('width,height', [(20, 20), (6, 5)])
+def test_vec_env_matches_scalar_env(width, height):
+    """Boards stepped together follow the same game as one SnakeEnv per board"""
+    settings = GameSettings(BOARD_WIDTH=width, BOARD_HEIGHT=height)
+    num_envs = 4
+    vec = VecSnakeEnv(num_envs, settings, seed=1)
+    envs = [SnakeEnv(settings, seed=i) for i in range(num_envs)]
+    readers = [StateReader(env) for env in envs]
+    grid_size = envs[0].grid_size
+    rng = random.Random(0)
+
+    def sync_food(i):
+        # Food spawns come from different RNGs; the vec env's is the reference
+        envs[i].food_pos = cell_positions([vec.food[i]], width, grid_size)[0]
+
+    for i in range(num_envs):
+        sync_food(i)
+
+    episodes = 0
+    for _ in range(3000):
+        actions = np.array([rng.choice([0, 0, 0, 1, 2]) for _ in range(num_envs)])
+        obs, rewards, dones, _ = vec.step(actions)
+        for i, env in enumerate(envs):
+            turn = [0, 1, -1][actions[i]]
+            direction = CLOCKWISE[(CLOCKWISE.index(env.snake_direction) + turn) % 4]
+            reward, done, _ = env.step(direction)
+            assert done == dones[i]
+            assert reward == pytest.approx(rewards[i])
+            if done:
+                env.reset()
+                episodes += 1
+            else:
+                body = cell_positions(vec.snake_cells(i), width, grid_size)
+                assert body == list(env.snake_pos)
+            assert np.array_equal(vec.occupancy[i], np.frombuffer(env.snake_pos.occupied, np.uint8).astype(bool))
+            sync_food(i)
+            assert list(obs[i].astype(bool)) == [bool(x) for x in readers[i].get_state()]
+    assert episodes > 0
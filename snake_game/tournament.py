@@ -0,0 +1,6 @@
+# tournament.py
+import sys
+from evaluation.tournament import main
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,6 @@
+# train.py
+import sys
+from ai.reinforcement.parallel import main
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
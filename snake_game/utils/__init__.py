@@ -1,5 +1,16 @@
-from .visualization import plot_training_stats
-from .logger import setup_logger
-from .persistence import SaveLoadManager
+__all__ = ['plot_training_stats', 'setup_logger', 'SaveLoadManager', 'FrameProfiler']
 
-__all__ = ['plot_training_stats', 'setup_logger', 'SaveLoadManager']
\ No newline at end of file
+_LAZY = {
+    'plot_training_stats': '.visualization',
+    'setup_logger': '.logger',
+    'SaveLoadManager': '.persistence',
+    'FrameProfiler': '.profiler',
+}
+
+def __getattr__(name):
+    # visualization pulls in matplotlib and persistence pulls in torch;
+    # import each only when first used
+    if name in _LAZY:
+        import importlib
+        return getattr(importlib.import_module(_LAZY[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
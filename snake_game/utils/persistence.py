@@ -9,7 +9,16 @@ class SaveLoadManager:
     def __init__(self, base_dir: str = 'training_states', max_saves: int = 5):
         self.base_dir = base_dir
         self.max_saves = max_saves
-        os.makedirs(self.base_dir, exist_ok=True)
+        # The directory is created by the first save, not on construction
+        
+    def _state_dirs(self) -> List[str]:
+        """Names of saved training states, oldest first (empty if none saved yet)"""
+        try:
+            with os.scandir(self.base_dir) as entries:
+                return sorted(entry.name for entry in entries
+                              if entry.is_dir() and entry.name.startswith('training_state_'))
+        except FileNotFoundError:
+            return []
         
     def save_state(self, agent, force: bool = False) -> None:
         """Save training state with improved efficiency"""
@@ -54,8 +63,7 @@ class SaveLoadManager:
         """Load the most recent training state"""
         try:
             # Find most recent state
-            states = sorted([d for d in os.listdir(self.base_dir) 
-                           if d.startswith('training_state_')])
+            states = self._state_dirs()
             if not states:
                 return None
                 
@@ -65,7 +73,7 @@ class SaveLoadManager:
             # Load model
             model_path = os.path.join(state_path, 'model.pth')
             if os.path.exists(model_path):
-                checkpoint = torch.load(model_path)
+                checkpoint = torch.load(model_path, map_location='cpu')
                 agent.model.load_state_dict(checkpoint['model_state_dict'])
                 agent.trainer.optimizer.load_state_dict(checkpoint['optimizer_state_dict'])
                 agent.n_games = checkpoint['n_games']
@@ -89,8 +97,7 @@ class SaveLoadManager:
     
     def _cleanup_old_saves(self):
         """Keep only the most recent max_saves states"""
-        states = sorted([d for d in os.listdir(self.base_dir) 
-                        if d.startswith('training_state_')])
+        states = self._state_dirs()
         
         # Remove oldest states if we exceed max_saves
         while len(states) > self.max_saves:
@@ -104,17 +111,16 @@ class SaveLoadManager:
             best_state = None
             
             # Find state with highest score
-            for state in os.listdir(self.base_dir):
-                if state.startswith('training_state_'):
-                    state_path = os.path.join(self.base_dir, state)
-                    stats_path = os.path.join(state_path, 'stats.json')
-                    
-                    if os.path.exists(stats_path):
-                        with open(stats_path, 'r') as f:
-                            stats = json.load(f)
-                            if stats['record'] > best_score:
-                                best_score = stats['record']
-                                best_state = state
+            for state in self._state_dirs():
+                state_path = os.path.join(self.base_dir, state)
+                stats_path = os.path.join(state_path, 'stats.json')
+                
+                if os.path.exists(stats_path):
+                    with open(stats_path, 'r') as f:
+                        stats = json.load(f)
+                        if stats['record'] > best_score:
+                            best_score = stats['record']
+                            best_state = state
             
             if best_state:
                 state_path = os.path.join(self.base_dir, best_state)
@@ -0,0 +1,254 @@
+import cProfile
+import csv
+import io
+import json
+import logging
+import pstats
+import time
+from collections import deque
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+# Phase -> methods timed on each object the game owns
+_HOT_PATHS = {
+    'game': {'handle_input': 'input', 'draw': 'draw'},
+    'env': {'step': 'move'},
+    'ai_agent': {
+        'get_next_move': 'agent',
+        '_get_action': 'agent',
+        'train_short_memory': 'train',
+        'train_long_memory': 'train',
+        'remember': 'train',
+        'update_training_stats': 'train',
+    },
+    'high_scores': {
+        'add_score': 'sqlite',
+        'get_top_scores': 'sqlite',
+        'is_high_score': 'sqlite',
+    },
+}
+
+PHASES = ('input', 'agent', 'move', 'train', 'plot', 'sqlite', 'draw', 'other')
+
+# Histogram bucket upper bounds in milliseconds
+_BUCKETS_MS = (0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 33, 66, float('inf'))
+
+
+class _NullPhase:
+    """Shared no-op context used while profiling is off"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    def __init__(self, profiler: 'FrameProfiler', name: str):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.profiler._push()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler._pop(self.name)
+        return False
+
+
+class FrameProfiler:
+    """Per-phase timings for the game loop.
+
+    While enabled, the game's hot-path methods (input handling, agent
+    decisions, env steps, training, SQLite queries, drawing) are replaced
+    on their instances by timing wrappers, and each frame's per-phase
+    totals go into rolling windows for histograms, the on-screen overlay
+    and periodic JSON/CSV dumps. Times are exclusive: a SQLite query made
+    while drawing counts as sqlite, not draw. While disabled nothing is
+    wrapped, so the only cost left in the loop is one attribute check per
+    frame.
+    """
+
+    def __init__(self, window: int = 600, dump_interval: float = 10.0,
+                 dump_path: Optional[str] = 'profile_stats.json'):
+        self.enabled = False
+        self.window = window
+        self.dump_interval = dump_interval
+        self.dump_path = dump_path
+        self.samples: Dict[str, deque] = {}
+        self.cprofile: Optional[cProfile.Profile] = None
+        self.overlay_rect = None
+        self._wrapped: List = []  # (object, attribute name)
+        self._owners: Dict[str, object] = {}
+        self._stack: List[List[float]] = []  # [start, child time] per open phase
+        self._frame = {}
+        self._overlay_summary = None
+        self._reset_window()
+
+    def _reset_window(self) -> None:
+        self.samples = {name: deque(maxlen=self.window) for name in PHASES + ('frame',)}
+        self._frame = dict.fromkeys(PHASES, 0.0)
+        self._frame_start = time.perf_counter()
+        self._last_dump = self._frame_start
+
+    # Enabling and instrumentation
+    def toggle(self, game) -> None:
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable(game)
+
+    def enable(self, game) -> None:
+        self.enabled = True
+        self._reset_window()
+        self._instrument(game)
+
+    def disable(self) -> None:
+        self.enabled = False
+        for obj, name in self._wrapped:
+            # Drop the instance attribute so the class method shows through again
+            obj.__dict__.pop(name, None)
+        self._wrapped.clear()
+        self._owners.clear()
+
+    def _instrument(self, game) -> None:
+        """Wrap hot paths of any objects the game swapped in since last frame"""
+        for owner, methods in _HOT_PATHS.items():
+            obj = game if owner == 'game' else getattr(game, owner, None)
+            if obj is None or self._owners.get(owner) is obj:
+                continue
+            self._owners[owner] = obj
+            for name, phase in methods.items():
+                method = getattr(obj, name, None)
+                if method is not None:
+                    setattr(obj, name, self._timed(method, phase))
+                    self._wrapped.append((obj, name))
+
+    def _timed(self, method, phase: str):
+        def timed(*args, **kwargs):
+            self._push()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self._pop(phase)
+        return timed
+
+    def phase(self, name: str):
+        """Context manager timing an explicit block (a no-op while disabled)"""
+        return _Phase(self, name) if self.enabled else _NULL_PHASE
+
+    def _push(self) -> None:
+        self._stack.append([time.perf_counter(), 0.0])
+
+    def _pop(self, name: str) -> None:
+        start, children = self._stack.pop()
+        elapsed = time.perf_counter() - start
+        self._frame[name] += elapsed - children
+        if self._stack:
+            self._stack[-1][1] += elapsed
+
+    # Per-frame bookkeeping
+    def end_frame(self, game) -> None:
+        now = time.perf_counter()
+        frame_time = now - self._frame_start
+        self._frame_start = now
+
+        accounted = 0.0
+        for name in PHASES[:-1]:
+            self.samples[name].append(self._frame[name])
+            accounted += self._frame[name]
+            self._frame[name] = 0.0
+        self.samples['other'].append(max(0.0, frame_time - accounted))
+        self.samples['frame'].append(frame_time)
+        if len(self.samples['frame']) % 30 == 0:
+            self._overlay_summary = None  # refresh the overlay a couple of times a second
+
+        self._instrument(game)
+        if self.dump_path and now - self._last_dump >= self.dump_interval:
+            self._last_dump = now
+            self.dump(self.dump_path)
+
+    def summary(self) -> Dict[str, Dict]:
+        """Mean, p50, p99 and a histogram (ms) per phase over the rolling window"""
+        result = {}
+        for name, values in self.samples.items():
+            ordered = sorted(values)
+            count = len(ordered)
+            histogram = [0] * len(_BUCKETS_MS)
+            for value in ordered:
+                ms = value * 1000
+                histogram[next(i for i, bound in enumerate(_BUCKETS_MS) if ms <= bound)] += 1
+            result[name] = {
+                'frames': count,
+                'mean_ms': sum(ordered) / count * 1000 if count else 0.0,
+                'p50_ms': ordered[count // 2] * 1000 if count else 0.0,
+                'p99_ms': ordered[min(count - 1, int(count * 0.99))] * 1000 if count else 0.0,
+                'max_ms': ordered[-1] * 1000 if count else 0.0,
+                'histogram': histogram,
+            }
+        return result
+
+    def dump(self, path: str) -> None:
+        """Write the current summary as JSON, or CSV if the path ends in .csv"""
+        summary = self.summary()
+        if path.endswith('.csv'):
+            with open(path, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(['phase', 'frames', 'mean_ms', 'p50_ms', 'p99_ms', 'max_ms'] +
+                                [f'le_{bound}ms' for bound in _BUCKETS_MS])
+                for name, stats in summary.items():
+                    writer.writerow([name, stats['frames'], f"{stats['mean_ms']:.4f}",
+                                     f"{stats['p50_ms']:.4f}", f"{stats['p99_ms']:.4f}",
+                                     f"{stats['max_ms']:.4f}"] + stats['histogram'])
+        else:
+            with open(path, 'w') as f:
+                json.dump({'timestamp': datetime.now().isoformat(timespec='seconds'),
+                           'buckets_ms': [str(b) for b in _BUCKETS_MS],
+                           'phases': summary}, f, indent=2)
+
+    # cProfile hook
+    def toggle_cprofile(self) -> Optional[str]:
+        """Start a cProfile session, or stop it and save the stats; returns the file written"""
+        if self.cprofile is None:
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+            return None
+        self.cprofile.disable()
+        path = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.prof"
+        self.cprofile.dump_stats(path)
+        report = io.StringIO()
+        pstats.Stats(self.cprofile, stream=report).sort_stats('cumulative').print_stats(20)
+        logger.info("cProfile saved to %s\n%s", path, report.getvalue())
+        self.cprofile = None
+        return path
+
+    # Overlay
+    def draw_overlay(self, screen: pygame.Surface, text_cache, color) -> pygame.Rect:
+        """Draw p50/p99 per phase with a bar for the mean in the bottom-left corner"""
+        if self._overlay_summary is None:
+            self._overlay_summary = self.summary()
+        summary = self._overlay_summary
+        lines = ['phase    p50 ms  p99 ms'] + [
+            f"{name:<8} {summary[name]['p50_ms']:6.2f}  {summary[name]['p99_ms']:6.2f}"
+            for name in PHASES + ('frame',)
+        ]
+        top = screen.get_height() - 10 - len(lines) * 16
+        # Numbers change every frame, so render directly instead of filling the text LRU
+        font = text_cache.font(18)
+        rects = []
+        for i, line in enumerate(lines):
+            rects.append(screen.blit(font.render(line, True, color), (10, top + i * 16)))
+            if i:
+                name = (PHASES + ('frame',))[i - 1]
+                width = min(100, int(summary[name]['mean_ms'] / 16.7 * 100))
+                rects.append(pygame.draw.rect(screen, color, (180, top + i * 16 + 4, max(1, width), 8)))
+        self.overlay_rect = rects[0].unionall(rects[1:])
+        return self.overlay_rect
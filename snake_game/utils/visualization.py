@@ -5,6 +5,7 @@ import numpy as np
 def plot_training_stats(scores: List[float], mean_scores: List[float], training_stats: Dict) -> None:
     """Plot training statistics with better visibility and error handling"""
     try:
+        plt.ion()  # Interactive mode so the game loop is never blocked
         plt.figure(2, figsize=(12, 8))  # Use figure 2 to avoid conflicts
         plt.clf()
         